@@ -6,116 +6,387 @@
 
 import os
 import re
+import sys
 from typing import Dict, List, Optional, Tuple, Any
-from datetime import datetime
+from datetime import datetime, timedelta
+import bisect
 import json
+import logging
+import time
+from collections import Counter, deque
+from functools import lru_cache
+from itertools import islice
+from dataclasses import asdict, dataclass, is_dataclass
+from operator import attrgetter
+from types import MappingProxyType
+
+import numpy as np
+
+# orjson이 있으면 내보내기 직렬화에 사용 (없으면 표준 json)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# zstandard가 있으면 .zst 경로 내보내기를 압축 (선택 의존성)
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+logger = logging.getLogger(__name__)
+
+# 부정 위험 수준 구간: 20/40/70점 이상에서 한 단계씩 상승
+_FRAUD_THRESHOLDS = (20, 40, 70)
+_FRAUD_LEVELS = ("MINIMAL", "LOW", "MEDIUM", "HIGH")
+
+# 업계 평균 (임시 데이터 - 실제로는 DB나 API에서 가져와야 함)
+# 비율명은 여러 dict의 키로 반복 조회되므로 intern해 둔다
+# (CPython은 ASCII 식별자형 리터럴만 자동 intern하며 "부채비율" 같은 한글 키는 제외됨)
+_INDUSTRY_KEYS = tuple(sys.intern(key) for key in ("ROE", "ROA", "부채비율", "영업이익률", "순이익률"))
+_INDUSTRY_VALS = np.array([12.5, 8.3, 85.2, 8.7, 6.4])
+
+# 시각화/보고서 모듈 import (핸들러 호출마다 import하지 않도록 모듈 상단에서 한 번만)
+try:
+    from visualization_engine import FinancialVisualizationEngine
+except ImportError as e:
+    print(f"⚠️ FinancialVisualizationEngine import 실패: {e}")
+    FinancialVisualizationEngine = None
+
+try:
+    from document_generator import ProfessionalReportGenerator
+except ImportError as e:
+    print(f"⚠️ ProfessionalReportGenerator import 실패: {e}")
+    ProfessionalReportGenerator = None
+
+# 보고서·비교·차트 유형 판별 키워드 (호출마다 리스트를 새로 만들지 않도록 모듈 상수로 둠)
+# 한국어는 조사가 붙어 공백 토큰 단위로 비교할 수 없으므로("엑셀로") 부분 문자열로 검사한다
+_EXCEL_KEYWORDS = frozenset({"excel", "엑셀", "xlsx"})
+_WORD_KEYWORDS = frozenset({"word", "워드", "docx"})
+_PDF_KEYWORDS = frozenset({"pdf"})
+
+_INDUSTRY_KEYWORDS = frozenset({"업계", "평균", "industry"})
+_PREVIOUS_YEAR_KEYWORDS = frozenset({"작년", "전년", "2023", "previous"})
+_COMPETITOR_KEYWORDS = frozenset({"경쟁사", "competitor"})
+
+_BAR_CHART_KEYWORDS = frozenset({"막대", "bar", "비교"})
+_LINE_CHART_KEYWORDS = frozenset({"선", "line", "추세", "trend"})
+_PIE_CHART_KEYWORDS = frozenset({"파이", "pie", "비중", "구성"})
+_RADAR_CHART_KEYWORDS = frozenset({"레이더", "radar", "종합"})
+
+
+# 입력 정규화 테이블: 구두점은 공백으로, ASCII 대문자는 소문자로 (C 수준 단일 패스)
+_NORMALIZE_TABLE = str.maketrans({
+    **{c: " " for c in ".,!?;:()[]{}"},
+    **{c: c.lower() for c in "ABCDEFGHIJKLMNOPQRSTUVWXYZ"},
+})
+
+
+def _normalize(text: str) -> str:
+    """키워드 매칭용 입력 정규화 (구두점 제거 + 소문자화)"""
+    return text.translate(_NORMALIZE_TABLE)
+
+
+@dataclass(slots=True)
+class ConversationRecord:
+    """대화 기록 1건 (고정 스키마이므로 dict 대신 slots 데이터클래스로 메모리 절감)"""
+    timestamp: float  # epoch 초
+    timestamp_iso: str  # 내보내기/요약에서 매번 변환하지 않도록 기록 시 한 번만 변환
+    user_input: str
+    company: Optional[str]
+    query_type: Optional[str] = None
+    # compact_history로 여러 대화를 묶은 요약 레코드일 때만 사용 (유형별/회사별 대화 수)
+    digest_counts: Optional[Dict[str, int]] = None
+    digest_companies: Optional[Dict[str, int]] = None
+
+
+# JSON 문서 내보내기 필드 (출력 키)와 대화 기록에서 꺼낼 값 (C 수준 attrgetter)
+_EXPORT_FIELDS = ("timestamp", "user_input", "company")
+_get_export_values = attrgetter("timestamp_iso", "user_input", "company")
+
+
+def _json_default(obj: Any) -> Any:
+    """표준 json 폴백용 직렬화 훅 (orjson은 데이터클래스를 기본 지원)"""
+    if is_dataclass(obj):
+        return asdict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _dumps_line(obj: Any) -> bytes:
+    """NDJSON 한 줄 직렬화 (UTF-8 바이트, 줄바꿈 포함)"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS)
+    return (json.dumps(obj, ensure_ascii=False, separators=(",", ":"), default=_json_default) + "\n").encode("utf-8")
+
+
+def _dumps_document(obj: Any, pretty: bool = False) -> bytes:
+    """JSON 문서 직렬화 (UTF-8 바이트, pretty=True면 2칸 들여쓰기)"""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+    if pretty:
+        return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _write_bytes(filepath: str, payload: bytes):
+    """완성된 bytes를 파일에 기록 (버퍼 계층 복사 없이 os.write 직접 호출)
+
+    Windows에서는 큰 단일 write 동작이 다르므로 일반 버퍼 경로를 사용한다.
+    """
+    if os.name == "nt":
+        with open(filepath, 'wb') as f:
+            f.write(payload)
+        return
+    
+    fd = os.open(filepath, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(payload)
+        while view:
+            written = os.write(fd, view)  # 부분 기록될 수 있으므로 남은 부분을 반복 기록
+            view = view[written:]
+    finally:
+        os.close(fd)
+
+
+def _contains_any(text: str, keywords) -> bool:
+    """text에 keywords 중 하나라도 부분 문자열로 포함되어 있는지"""
+    return any(keyword in text for keyword in keywords)
+
+
+# 입력에 있으면 점수 계산 없이 바로 유형이 결정되는 패턴 (파일 형식 지정은 곧 보고서 요청)
+# "roe", "그래프"처럼 다른 유형과 함께 쓰이는 키워드는 점수 계산에 맡긴다
+# 영문 형식명은 단독 토큰일 때만 인정 ("excellent"는 제외, "pdf로"는 포함).
+# "워드"는 "키워드"·"패스워드"의 일부이기도 하므로 결정적 신호로 쓰지 않는다
+_DECISIVE_PATTERNS = (
+    (re.compile(r"(?<![a-z0-9])(?:pdf|docx|xlsx|excel)(?![a-z0-9])|엑셀"), "report_query"),
+)
+
+
+# 질의 패턴 (인스턴스마다 다시 만들지 않도록 모듈 상수로 두고 공유 — 수정 금지)
+_QUERY_PATTERNS = MappingProxyType({
+    # 기본 분석 요청
+    "full_analysis": (
+        "결산", "감사", "분석해줘", "검토해줘", "분석하자", "결산처리",
+        "전체분석", "종합분석", "완전분석"
+    ),
+    
+    # 재무비율 관련
+    "ratio_query": (
+        "비율", "ratio", "ROE", "ROA", "부채비율", "유동비율", "영업이익률",
+        "순이익률", "자기자본비율", "매출성장률", "회전율"
+    ),
+    
+    # 부정 탐지 관련
+    "fraud_query": (
+        "부정", "이상", "특이", "위험", "fraud", "의심", "문제",
+        "조작", "부정회계", "회계조작"
+    ),
+    
+    # 비교 분석
+    "comparison_query": (
+        "비교", "대비", "vs", "차이", "compared", "업계평균", "경쟁사",
+        "작년", "전년", "동종업계"
+    ),
+    
+    # 시각화 요청
+    "visualization_query": (
+        "그래프", "차트", "시각화", "graph", "chart", "plot", "보여줘",
+        "그림", "도표", "막대그래프", "선그래프"
+    ),
+    
+    # 상세 설명 요청
+    "explanation_query": (
+        "설명", "이유", "왜", "어떻게", "explain", "why", "how",
+        "자세히", "구체적으로", "detail"
+    ),
+    
+    # 데이터 출처 문의
+    "data_source_query": (
+        "언제", "몇년", "년도", "데이터", "자료", "출처", "source",
+        "기준", "시점", "when"
+    ),
+    
+    # 보고서 요청 (새로 추가)
+    "report_query": (
+        "보고서", "문서", "정리", "요약", "report", "document",
+        "파일", "저장", "다운로드", "출력", "내보내기", "export",
+        "워드", "엑셀", "pdf", "docx", "xlsx", "word", "excel"
+    )
+})
+
+# 컨텍스트 키워드
+_CONTEXT_KEYWORDS = MappingProxyType({
+    "financial_items": {
+        "매출": ("revenue", "sales", "매출액"),
+        "영업이익": ("operating_income", "영업이익"),
+        "순이익": ("net_income", "당기순이익", "순이익"),
+        "자산": ("assets", "총자산", "자산총계"),
+        "부채": ("liabilities", "총부채", "부채총계"),
+        "자본": ("equity", "자본총계", "자기자본"),
+        "현금": ("cash", "현금", "현금성자산"),
+        "매출채권": ("receivables", "매출채권", "채권"),
+        "재고": ("inventory", "재고자산", "재고")
+    },
+    
+    "ratio_items": {
+        "ROE": ("roe", "자기자본수익률", "자본수익률"),
+        "ROA": ("roa", "총자산수익률", "자산수익률"),
+        "부채비율": ("debt_ratio", "부채비율"),
+        "유동비율": ("current_ratio", "유동비율"),
+        "영업이익률": ("operating_margin", "영업이익률"),
+        "순이익률": ("net_margin", "순이익률")
+    },
+    
+    "time_periods": {
+        "올해": "2024",
+        "작년": "2023", 
+        "재작년": "2022",
+        "2024년": "2024",
+        "2023년": "2023",
+        "2022년": "2022"
+    }
+})
+
+# 회사명 추출 정규식
+_COMPANY_PATTERNS = (
+    re.compile(r'(삼성전자|LG전자|현대자동차|SK하이닉스|네이버|카카오|포스코|KT|LG화학)'),
+    re.compile(r'([A-Za-z가-힣]+(?:전자|자동차|화학|통신|바이오|제약|건설|중공업|생명과학))'),
+    re.compile(r'([A-Za-z가-힣]+(?:회사|기업|그룹|코퍼레이션))')
+)
+
+
+def _build_keyword_index(query_patterns: Dict[str, Tuple[str, ...]]) -> Tuple[Tuple[str, str], ...]:
+    """질의 분류용 키워드 색인 생성: (소문자 키워드, 질의 유형) 쌍을 한 번만 만든다
+
+    분류 시 매번 키워드를 소문자화하며 유형별로 순회하던 작업을 모듈 로드 시점으로 옮긴다.
+    유형 순서를 그대로 유지하므로 동점일 때 먼저 정의된 유형이 선택되는 규칙도 같다.
+    """
+    return tuple(
+        (keyword.lower(), query_type)
+        for query_type, keywords in query_patterns.items()
+        for keyword in keywords
+    )
+
+
+_KEYWORD_INDEX = _build_keyword_index(_QUERY_PATTERNS)
+
+# 비율 키워드 → 비율명 역색인 (비율 정의 순서 유지)
+_RATIO_KW_TO_NAME = MappingProxyType({
+    keyword.lower(): sys.intern(ratio_name)
+    for ratio_name, keywords in _CONTEXT_KEYWORDS["ratio_items"].items()
+    for keyword in keywords
+})
+
+
+@lru_cache(maxsize=4096)
+def _classify_lowered(user_input_lower: str) -> str:
+    """정규화된 입력의 질의 유형 분류
+
+    키워드 색인이 불변 모듈 상수이므로 입력 문자열만으로 결과가 정해지는 순수 함수이며,
+    캐시 키도 입력 하나뿐이라 색인 튜플을 매번 해시하지 않는다. 무효화할 필요도 없다.
+    """
+    # 결정적 패턴이 있으면 조기 반환
+    for pattern, query_type in _DECISIVE_PATTERNS:
+        if pattern.search(user_input_lower):
+            return query_type
+
+    # 각 패턴별 매칭 점수 계산 (색인 한 번 순회)
+    # 입력을 소문자화했으므로 키워드도 소문자로 비교해야 함 — 색인에 소문자로 저장됨
+    # (기존에는 "ROE" 같은 대문자 키워드가 영원히 매칭되지 않는 버그가 있었음)
+    # Counter가 C 수준에서 집계하며 삽입 순서를 유지하므로 동점 시 먼저 정의된 유형이 선택됨
+    scores = Counter(
+        query_type for keyword, query_type in _KEYWORD_INDEX
+        if keyword in user_input_lower
+    )
+
+    # 최고 점수 반환
+    if scores:
+        return max(scores, key=scores.__getitem__)
+    else:
+        return "general_query"
+
 
 class SmartConversationHandler:
     """지능형 대화 처리 시스템 - 보고서 생성 통합"""
+
+    MAX_HISTORY = 1000  # 보관할 최대 대화 수
+    # 대화가 없을 때의 요약 (호출자가 수정해도 원본이 바뀌지 않도록 복사해서 반환)
+    _EMPTY_SUMMARY = {
+        "total_conversations": 0,
+        "current_company": None,
+        "most_recent": None
+    }
     
     def __init__(self, agent_engine):
         self.agent = agent_engine
-        self.conversation_history = []
+        # 장시간 세션에서 메모리가 무한히 늘지 않도록 최근 대화만 보관
+        self.conversation_history = deque(maxlen=self.MAX_HISTORY)
+        # 요약용 누적 통계 (대화 추가 시 갱신)
+        self._query_type_counts = Counter()
+        self._company_counts = Counter()
+        self._first_ts = None
+        self._last_ts = None
         self.current_company = None
         self.query_patterns = self._initialize_query_patterns()
         self.context_keywords = self._initialize_context_keywords()
-        
-    def _initialize_query_patterns(self) -> Dict[str, List[str]]:
-        """질의 패턴 초기화"""
-        return {
-            # 기본 분석 요청
-            "full_analysis": [
-                "결산", "감사", "분석해줘", "검토해줘", "분석하자", "결산처리",
-                "전체분석", "종합분석", "완전분석"
-            ],
-            
-            # 재무비율 관련
-            "ratio_query": [
-                "비율", "ratio", "ROE", "ROA", "부채비율", "유동비율", "영업이익률",
-                "순이익률", "자기자본비율", "매출성장률", "회전율"
-            ],
-            
-            # 부정 탐지 관련
-            "fraud_query": [
-                "부정", "이상", "특이", "위험", "fraud", "의심", "문제",
-                "조작", "부정회계", "회계조작"
-            ],
-            
-            # 비교 분석
-            "comparison_query": [
-                "비교", "대비", "vs", "차이", "compared", "업계평균", "경쟁사",
-                "작년", "전년", "동종업계"
-            ],
-            
-            # 시각화 요청
-            "visualization_query": [
-                "그래프", "차트", "시각화", "graph", "chart", "plot", "보여줘",
-                "그림", "도표", "막대그래프", "선그래프"
-            ],
-            
-            # 상세 설명 요청
-            "explanation_query": [
-                "설명", "이유", "왜", "어떻게", "explain", "why", "how",
-                "자세히", "구체적으로", "detail"
-            ],
-            
-            # 데이터 출처 문의
-            "data_source_query": [
-                "언제", "몇년", "년도", "데이터", "자료", "출처", "source",
-                "기준", "시점", "when"
-            ],
-            
-            # 보고서 요청 (새로 추가)
-            "report_query": [
-                "보고서", "문서", "정리", "요약", "report", "document",
-                "파일", "저장", "다운로드", "출력", "내보내기", "export",
-                "워드", "엑셀", "pdf", "docx", "xlsx", "word", "excel"
-            ]
+        self.company_patterns = self._initialize_company_patterns()
+        self._ratio_kw_to_name = _RATIO_KW_TO_NAME
+        # 질의 유형별 핸들러 테이블
+        self._dispatch = {
+            "full_analysis": self._handle_full_analysis_request,
+            "ratio_query": self._handle_ratio_query,
+            "fraud_query": self._handle_fraud_query,
+            "comparison_query": self._handle_comparison_query,
+            "visualization_query": self._handle_visualization_query,
+            "explanation_query": self._handle_explanation_query,
+            "data_source_query": self._handle_data_source_query,
+            "report_query": self._handle_report_query,
         }
+        # 분석 요약 문자열 캐시
+        self._summary_cache = {}
+        # 질의 1건 동안 재사용할 분석 컨텍스트 (회사명, 컨텍스트)
+        self._ctx_cache = None
+        # 시각화 엔진/보고서 생성기는 첫 사용 시 한 번 생성해 재사용
+        self._viz_engine = None
+        self._report_generator = None
+        
+    def _initialize_query_patterns(self) -> Dict[str, Tuple[str, ...]]:
+        """질의 패턴 (모든 인스턴스가 공유하는 모듈 상수)"""
+        return _QUERY_PATTERNS
     
-    def _initialize_context_keywords(self) -> Dict[str, List[str]]:
-        """컨텍스트 키워드 초기화"""
-        return {
-            "financial_items": {
-                "매출": ["revenue", "sales", "매출액"],
-                "영업이익": ["operating_income", "영업이익"],
-                "순이익": ["net_income", "당기순이익", "순이익"],
-                "자산": ["assets", "총자산", "자산총계"],
-                "부채": ["liabilities", "총부채", "부채총계"],
-                "자본": ["equity", "자본총계", "자기자본"],
-                "현금": ["cash", "현금", "현금성자산"],
-                "매출채권": ["receivables", "매출채권", "채권"],
-                "재고": ["inventory", "재고자산", "재고"]
-            },
-            
-            "ratio_items": {
-                "ROE": ["roe", "자기자본수익률", "자본수익률"],
-                "ROA": ["roa", "총자산수익률", "자산수익률"],
-                "부채비율": ["debt_ratio", "부채비율"],
-                "유동비율": ["current_ratio", "유동비율"],
-                "영업이익률": ["operating_margin", "영업이익률"],
-                "순이익률": ["net_margin", "순이익률"]
-            },
-            
-            "time_periods": {
-                "올해": "2024",
-                "작년": "2023", 
-                "재작년": "2022",
-                "2024년": "2024",
-                "2023년": "2023",
-                "2022년": "2022"
-            }
-        }
+    def _initialize_context_keywords(self) -> Dict[str, Dict]:
+        """컨텍스트 키워드 (모든 인스턴스가 공유하는 모듈 상수)"""
+        return _CONTEXT_KEYWORDS
+
+    def _initialize_company_patterns(self) -> Tuple[re.Pattern, ...]:
+        """회사명 추출 정규식 (모듈 로드 시 한 번만 컴파일)"""
+        return _COMPANY_PATTERNS
 
     def process_user_query(self, user_input: str, company_name: str = None) -> Dict[str, Any]:
-        print(f"🚨🚨🚨 process_user_query 실행됨: '{user_input}' 🚨🚨🚨")
         """사용자 질의 처리 메인 함수"""
-        # 대화 기록 저장
-        self.conversation_history.append({
-            "timestamp": datetime.now(),
-            "user_input": user_input,
-            "company": company_name or self.current_company
-        })
+        logger.debug("process_user_query: %r", user_input)
+        
+        # 입력 정규화(소문자화·구두점 제거)는 질의당 한 번만 수행하고 하위 메서드에 전달
+        user_input_lower = _normalize(user_input)
+
+        # 질의 유형 분류
+        query_type = self._classify_query_type(user_input, user_input_lower)
+        logger.debug("%r → 분류결과: %s", user_input, query_type)
+
+        # 대화 기록 저장 (분류 결과도 함께 저장해 요약 시 재분류하지 않음)
+        # 회사명·질의 유형은 종류가 적고 요약 Counter의 키로 반복 사용되므로 intern
+        now = time.time()
+        company = company_name or self.current_company
+        self._record_conversation(ConversationRecord(
+            timestamp=now,
+            timestamp_iso=self._fmt_ts(now),
+            user_input=user_input,
+            company=sys.intern(company) if company else None,
+            query_type=sys.intern(query_type)
+        ))
         
         # 회사명 추출 또는 설정
         if company_name:
@@ -125,73 +396,125 @@ class SmartConversationHandler:
             if extracted_company:
                 self.current_company = extracted_company
         
-        # 질의 유형 분류
-        query_type = self._classify_query_type(user_input)
-        print(f"🔍 DEBUG: '{user_input}' → 분류결과: {query_type}")
-
-        # 질의 처리
-        if query_type == "full_analysis":
-            return self._handle_full_analysis_request(user_input)
-        elif query_type == "ratio_query":
-            return self._handle_ratio_query(user_input)
-        elif query_type == "fraud_query":
-            return self._handle_fraud_query(user_input)
-        elif query_type == "comparison_query":
-            return self._handle_comparison_query(user_input)
-        elif query_type == "visualization_query":
-            return self._handle_visualization_query(user_input)
-        elif query_type == "explanation_query":
-            return self._handle_explanation_query(user_input)
-        elif query_type == "data_source_query":
-            return self._handle_data_source_query(user_input)
-        elif query_type == "report_query":  # 새로 추가
-            return self._handle_report_query(user_input)
-        else:
-            print(f"📊 DEBUG: 일반 쿼리로 분류됨: {query_type}")
-            return self._handle_general_query(user_input)
+        # 이전 질의에서 캐시한 컨텍스트는 무효화 (그 사이 분석이 갱신됐을 수 있음)
+        self._ctx_cache = None
+
+        # 질의 처리 (유형 → 핸들러 테이블 조회, 미등록 유형은 일반 질의)
+        handler = self._dispatch.get(query_type, self._handle_general_query)
+        return handler(user_input, user_input_lower)
+
+    def _record_conversation(self, entry: ConversationRecord):
+        """대화 기록 추가 및 요약용 누적 통계 갱신
+
+        히스토리가 최대 길이에 도달하면 가장 오래된 항목이 밀려나므로
+        그 항목의 통계를 먼저 차감해 누적값이 히스토리와 항상 일치하게 한다.
+        """
+        if len(self.conversation_history) == self.conversation_history.maxlen:
+            self._uncount_record(self.conversation_history[0])
+        
+        self.conversation_history.append(entry)
+        self._count_record(entry)
+        # 세션 시작/최근 시각 (최대 길이 도달 시 가장 오래된 항목이 바뀌므로 매번 갱신)
+        self._first_ts = self.conversation_history[0].timestamp
+        self._last_ts = entry.timestamp
+
+    def _reset_summary_state(self):
+        """요약용 누적 통계 초기화"""
+        self._query_type_counts.clear()
+        self._company_counts.clear()
+        self._first_ts = None
+        self._last_ts = None
+
+    def _recompute_summary_state(self):
+        """히스토리 전체를 다시 순회해 누적 통계 재계산 (느린 경로)
+
+        평소에는 대화 추가 시 증분 갱신하므로 필요 없고, 히스토리를 직접 수정한 뒤
+        통계를 맞추거나 증분 갱신 결과를 검증할 때 사용한다.
+        """
+        self._reset_summary_state()
+        if self.conversation_history:
+            self._first_ts = self.conversation_history[0].timestamp
+            self._last_ts = self.conversation_history[-1].timestamp
+        for conv in self.conversation_history:
+            if conv.query_type is None:
+                conv.query_type = self._classify_query_type(conv.user_input)
+            self._count_record(conv)
+
+    def _count_record(self, record: ConversationRecord):
+        """대화 기록 1건을 누적 통계에 반영 (요약 레코드는 묶인 대화 수만큼)"""
+        if record.digest_counts is not None:
+            self._query_type_counts.update(record.digest_counts)
+            self._company_counts.update(record.digest_companies or {})
+            return
+        self._query_type_counts[record.query_type] += 1
+        if record.company:
+            self._company_counts[record.company] += 1
+
+    def _uncount_record(self, record: ConversationRecord):
+        """대화 기록 1건을 누적 통계에서 차감"""
+        if record.digest_counts is not None:
+            for query_type, count in record.digest_counts.items():
+                self._decrement(self._query_type_counts, query_type, count)
+            for company, count in (record.digest_companies or {}).items():
+                self._decrement(self._company_counts, company, count)
+            return
+        self._decrement(self._query_type_counts, record.query_type)
+        if record.company:
+            self._decrement(self._company_counts, record.company)
+
+    @staticmethod
+    def _decrement(counts: Counter, key: str, amount: int = 1):
+        """누적 통계 차감 (0이 되면 키를 제거해 조회 시 필터링이 필요 없게 함)"""
+        counts[key] -= amount
+        if counts[key] <= 0:
+            del counts[key]
 
     def _extract_company_name(self, user_input: str) -> Optional[str]:
         """사용자 입력에서 회사명 추출"""
-        company_patterns = [
-            r'(삼성전자|LG전자|현대자동차|SK하이닉스|네이버|카카오|포스코|KT|LG화학)',
-            r'([A-Za-z가-힣]+(?:전자|자동차|화학|통신|바이오|제약|건설|중공업|생명과학))',
-            r'([A-Za-z가-힣]+(?:회사|기업|그룹|코퍼레이션))'
-        ]
-        
-        for pattern in company_patterns:
-            match = re.search(pattern, user_input)
+        for pattern in self.company_patterns:
+            match = pattern.search(user_input)
             if match:
                 return match.group(1)
         
         return None
 
-    def _classify_query_type(self, user_input: str) -> str:
-        """질의 유형 분류"""
-        user_input_lower = user_input.lower()
-        
-        # 각 패턴별 매칭 점수 계산
-        # 입력을 소문자화했으므로 키워드도 소문자로 비교해야 함
-        # (기존에는 "ROE" 같은 대문자 키워드가 영원히 매칭되지 않는 버그가 있었음)
-        scores = {}
-        for query_type, keywords in self.query_patterns.items():
-            score = sum(1 for keyword in keywords if keyword.lower() in user_input_lower)
-            if score > 0:
-                scores[query_type] = score
-        
-        # 최고 점수 반환
-        if scores:
-            return max(scores.keys(), key=lambda x: scores[x])
-        else:
-            return "general_query"
+    def _get_context(self) -> Optional[Dict]:
+        """현재 회사의 분석 컨텍스트 조회 (질의 1건 내에서는 한 번만 조회)"""
+        if self._ctx_cache is None or self._ctx_cache[0] != self.current_company:
+            context = self.agent.get_analysis_context(self.current_company)
+            self._ctx_cache = (self.current_company, context)
+        return self._ctx_cache[1]
+
+    def _get_viz_engine(self):
+        """시각화 엔진 (최초 호출 시 생성 후 재사용)"""
+        if self._viz_engine is None:
+            if FinancialVisualizationEngine is None:
+                raise RuntimeError("시각화 엔진을 사용할 수 없습니다.")
+            self._viz_engine = FinancialVisualizationEngine()
+        return self._viz_engine
+
+    def _get_report_generator(self):
+        """보고서 생성기 (최초 호출 시 생성 후 재사용)"""
+        if self._report_generator is None:
+            if ProfessionalReportGenerator is None:
+                raise RuntimeError("보고서 생성기를 사용할 수 없습니다.")
+            self._report_generator = ProfessionalReportGenerator()
+        return self._report_generator
+
+    def _classify_query_type(self, user_input: str, user_input_lower: str = None) -> str:
+        """질의 유형 분류 (같은 문구 반복 시 캐시된 결과 사용)"""
+        if user_input_lower is None:
+            user_input_lower = _normalize(user_input)
+        return _classify_lowered(user_input_lower)
 
     # conversation_handler.py 수정 사항
     """
     A2A 통합 및 보고서 메시지 수정
     """
 
-    def _handle_full_analysis_request(self, user_input: str) -> Dict[str, Any]:
+    def _handle_full_analysis_request(self, user_input: str, user_input_lower: str = None) -> Dict[str, Any]:
         """A2A 통합 전체 분석 (항상 협업 모드)"""
-        print("🤖🤖🤖 A2A 협업 분석 시작! 🤖🤖🤖")
+        logger.debug("A2A 협업 분석 시작")
         
         if not self.current_company:
             return {
@@ -244,32 +567,46 @@ class SmartConversationHandler:
         else:
             grade = "C (개선필요)"
         
-        summary = f"""
-    📊 {analysis_data['company']} 분석 완료!
-
-    🏆 종합 등급: {grade}
-
-    📈 주요 재무지표:
-    • 매출액: {self.agent.format_currency(revenue)}
-    • 순이익: {self.agent.format_currency(net_income)}
-    • ROE: {roe:.1f}%
-    • 부채비율: {debt_ratio:.1f}%
-
-    ⚠️ 부정위험 분석:
-    • 위험점수: {fraud_score:.0f}점 (100점 만점)
-    • 위험수준: {"높음" if fraud_score >= 60 else "보통" if fraud_score >= 30 else "낮음"}
-
-    💬 이제 다음과 같은 질문을 해보세요:
-    • "재무비율 자세히 보여줘"
-    • "부정위험 분석 결과는?"
-    • "업계 평균과 비교해줘" 
-    • "그래프로 시각화해줘"
-    • "보고서 만들어줘"
-    """
+        # 같은 결과가 다시 렌더링되는 경우가 많으므로 사용된 값 기준으로 캐시
+        cache_key = (analysis_data['company'], grade, roe, debt_ratio, fraud_score, revenue, net_income)
+        cached = self._summary_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
+        risk_level = "높음" if fraud_score >= 60 else "보통" if fraud_score >= 30 else "낮음"
+        parts = [
+            "",
+            f"    📊 {analysis_data['company']} 분석 완료!",
+            "",
+            f"    🏆 종합 등급: {grade}",
+            "",
+            "    📈 주요 재무지표:",
+            # 0원은 통화 포맷팅 호출 없이 바로 표기
+            f"    • 매출액: {self.agent.format_currency(revenue) if revenue else '0원'}",
+            f"    • 순이익: {self.agent.format_currency(net_income) if net_income else '0원'}",
+            f"    • ROE: {roe:.1f}%",
+            f"    • 부채비율: {debt_ratio:.1f}%",
+            "",
+            "    ⚠️ 부정위험 분석:",
+            f"    • 위험점수: {fraud_score:.0f}점 (100점 만점)",
+            f"    • 위험수준: {risk_level}",
+            "",
+            "    💬 이제 다음과 같은 질문을 해보세요:",
+            '    • "재무비율 자세히 보여줘"',
+            '    • "부정위험 분석 결과는?"',
+            '    • "업계 평균과 비교해줘" ',
+            '    • "그래프로 시각화해줘"',
+            '    • "보고서 만들어줘"',
+            "    ",
+        ]
+        summary = "\n".join(parts)
         
+        if len(self._summary_cache) >= 128:
+            self._summary_cache.clear()
+        self._summary_cache[cache_key] = summary
         return summary
 
-    def _handle_ratio_query(self, user_input: str) -> Dict[str, Any]:
+    def _handle_ratio_query(self, user_input: str, user_input_lower: str = None) -> Dict[str, Any]:
         """재무비율 질의 처리"""
         if not self.current_company:
             return {
@@ -278,7 +615,7 @@ class SmartConversationHandler:
             }
         
         # 컨텍스트에서 기존 분석 결과 확인
-        context = self.agent.get_analysis_context(self.current_company)
+        context = self._get_context()
         if not context:
             return {
                 "type": "analysis_needed",
@@ -287,7 +624,7 @@ class SmartConversationHandler:
             }
         
         # 특정 비율 추출
-        requested_ratios = self._extract_requested_ratios(user_input)
+        requested_ratios = self._extract_requested_ratios(user_input, user_input_lower)
         ratios = context.get("ratios", {})
         
         if requested_ratios:
@@ -303,7 +640,7 @@ class SmartConversationHandler:
             "message": self._generate_ratio_explanation(filtered_ratios)
         }
 
-    def _handle_fraud_query(self, user_input: str) -> Dict[str, Any]:
+    def _handle_fraud_query(self, user_input: str, user_input_lower: str = None) -> Dict[str, Any]:
         """부정 탐지 질의 처리"""
         if not self.current_company:
             return {
@@ -311,7 +648,7 @@ class SmartConversationHandler:
                 "message": "먼저 분석할 회사를 지정해주세요."
             }
         
-        context = self.agent.get_analysis_context(self.current_company)
+        context = self._get_context()
         if not context:
             return {
                 "type": "analysis_needed",
@@ -323,17 +660,18 @@ class SmartConversationHandler:
         cash_flow_data = context.get("cash_flow_data", {})
         
         fraud_ratios = self.agent.calculate_fraud_detection_ratios(financial_data, cash_flow_data)
+        risk_level = self._determine_fraud_risk_level(fraud_ratios)
         
         return {
             "type": "fraud_analysis",
             "company": self.current_company,
             "fraud_ratios": fraud_ratios,
-            "risk_level": self._determine_fraud_risk_level(fraud_ratios),
-            "message": self._generate_fraud_explanation(fraud_ratios),
+            "risk_level": risk_level,
+            "message": self._generate_fraud_explanation(fraud_ratios, risk_level),
             "action": "show_fraud_details"
         }
 
-    def _handle_comparison_query(self, user_input: str) -> Dict[str, Any]:
+    def _handle_comparison_query(self, user_input: str, user_input_lower: str = None) -> Dict[str, Any]:
         """비교 분석 질의 처리"""
         if not self.current_company:
             return {
@@ -341,7 +679,7 @@ class SmartConversationHandler:
                 "message": "먼저 분석할 회사를 지정해주세요."
             }
         
-        context = self.agent.get_analysis_context(self.current_company)
+        context = self._get_context()
         if not context:
             return {
                 "type": "analysis_needed",
@@ -349,7 +687,7 @@ class SmartConversationHandler:
             }
         
         # 비교 대상 추출
-        comparison_target = self._extract_comparison_target(user_input)
+        comparison_target = self._extract_comparison_target(user_input, user_input_lower)
         
         if comparison_target == "industry":
             return self._generate_industry_comparison(context)
@@ -362,9 +700,9 @@ class SmartConversationHandler:
                 "options": ["업계 평균", "전년 대비", "경쟁사"]
             }
 
-    def _handle_visualization_query(self, user_input: str) -> Dict[str, Any]:
+    def _handle_visualization_query(self, user_input: str, user_input_lower: str = None) -> Dict[str, Any]:
         """시각화 요청 처리 (실제 차트 생성)"""
-        print("🔥🔥🔥 시각화 메서드 실행됨! 🔥🔥🔥")
+        logger.debug("시각화 요청 처리 시작")
     
         if not self.current_company:
             return {
@@ -372,7 +710,7 @@ class SmartConversationHandler:
                 "message": "먼저 분석할 회사를 지정해주세요."
             }
     
-        context = self.agent.get_analysis_context(self.current_company)
+        context = self._get_context()
         if not context:
             return {
                 "type": "analysis_needed", 
@@ -380,11 +718,9 @@ class SmartConversationHandler:
             }
         
         try:
-            print("🎨 차트 생성 시작...")
+            logger.debug("차트 생성 시작")
             
-            # 시각화 엔진 import
-            from visualization_engine import FinancialVisualizationEngine
-            viz_engine = FinancialVisualizationEngine()
+            viz_engine = self._get_viz_engine()
             
             # 분석 데이터 준비
             analysis_data = {
@@ -395,7 +731,7 @@ class SmartConversationHandler:
             }
             
             # 종합 대시보드 생성
-            print("📊 종합 대시보드 생성 중...")
+            logger.debug("종합 대시보드 생성 중")
             chart_filepath = viz_engine.create_comprehensive_dashboard(
                 analysis_data, self.current_company
             )
@@ -426,7 +762,7 @@ class SmartConversationHandler:
             print(f"❌ 오류: {str(e)}")
             return {"type": "error", "message": f"오류: {str(e)}"}
         
-    def _handle_explanation_query(self, user_input: str) -> Dict[str, Any]:
+    def _handle_explanation_query(self, user_input: str, user_input_lower: str = None) -> Dict[str, Any]:
         """설명 요청 처리"""
         if not self.current_company:
             return {
@@ -434,7 +770,7 @@ class SmartConversationHandler:
                 "message": "먼저 분석할 회사를 지정해주세요."
             }
         
-        context = self.agent.get_analysis_context(self.current_company)
+        context = self._get_context()
         if not context:
             return {
                 "type": "analysis_needed",
@@ -462,7 +798,7 @@ class SmartConversationHandler:
             "message": explanation
         }
 
-    def _handle_data_source_query(self, user_input: str) -> Dict[str, Any]:
+    def _handle_data_source_query(self, user_input: str, user_input_lower: str = None) -> Dict[str, Any]:
         """데이터 출처 문의 처리"""
         if not self.current_company:
             return {
@@ -470,7 +806,7 @@ class SmartConversationHandler:
                 "message": "분석 데이터는 DART(전자공시시스템) 공식 API에서 수집합니다."
             }
         
-        context = self.agent.get_analysis_context(self.current_company)
+        context = self._get_context()
         if not context:
             return {
                 "type": "general_info",
@@ -498,7 +834,7 @@ class SmartConversationHandler:
             "timestamp": context['timestamp']
         }
 
-    def _handle_report_query(self, user_input: str) -> Dict[str, Any]:
+    def _handle_report_query(self, user_input: str, user_input_lower: str = None) -> Dict[str, Any]:
         """보고서 요청 처리 - 실제 보고서 생성"""
         if not self.current_company:
             return {
@@ -506,7 +842,7 @@ class SmartConversationHandler:
                 "message": "먼저 분석할 회사를 지정해주세요."
             }
         
-        context = self.agent.get_analysis_context(self.current_company)
+        context = self._get_context()
         if not context:
             return {
                 "type": "analysis_needed",
@@ -516,17 +852,13 @@ class SmartConversationHandler:
         try:
             print(f"📋 {self.current_company} 보고서 생성 시작...")
             
-            # 보고서 생성기 import
-            from document_generator import ProfessionalReportGenerator
-            
-            # 보고서 생성기 초기화
-            report_generator = ProfessionalReportGenerator()
+            report_generator = self._get_report_generator()
             
             # 분석 데이터 준비
             analysis_data = context.get("analysis_data", {})
             
             # 보고서 유형 결정
-            report_type = self._determine_report_type(user_input)
+            report_type = self._determine_report_type(user_input, user_input_lower)
             
             if report_type == "comprehensive":
                 # 종합 보고서 생성
@@ -589,20 +921,21 @@ class SmartConversationHandler:
                 "message": f"보고서 생성 중 오류가 발생했습니다: {str(e)}"
             }
 
-    def _determine_report_type(self, user_input: str) -> Dict[str, Any]:
+    def _determine_report_type(self, user_input: str, user_input_lower: str = None) -> Dict[str, Any]:
         """사용자 입력에서 보고서 유형 결정"""
-        user_input_lower = user_input.lower()
+        if user_input_lower is None:
+            user_input_lower = _normalize(user_input)
         
-        if any(keyword in user_input_lower for keyword in ["excel", "엑셀", "xlsx"]):
+        if _contains_any(user_input_lower, _EXCEL_KEYWORDS):
             return "excel"
-        elif any(keyword in user_input_lower for keyword in ["word", "워드", "docx"]):
+        elif _contains_any(user_input_lower, _WORD_KEYWORDS):
             return "docx"
-        elif any(keyword in user_input_lower for keyword in ["pdf"]):
+        elif _contains_any(user_input_lower, _PDF_KEYWORDS):
             return "pdf"
         else:
             return "comprehensive"  # 기본값: 모든 형태
 
-    def _handle_general_query(self, user_input: str) -> Dict[str, Any]:
+    def _handle_general_query(self, user_input: str, user_input_lower: str = None) -> Dict[str, Any]:
         """일반 질의 처리
 
         분석 결과가 있으면 반드시 컨텍스트로 주입한다. 주입하지 않으면 모델이
@@ -611,7 +944,7 @@ class SmartConversationHandler:
         """
         context_block = ""
         if self.current_company:
-            context = self.agent.get_analysis_context(self.current_company)
+            context = self._get_context()
             if context:
                 ratios = context.get("ratios", {})
                 fraud = context.get("fraud_ratios", {})
@@ -644,40 +977,44 @@ class SmartConversationHandler:
 
     # === 헬퍼 메서드들 ===
     
-    def _extract_requested_ratios(self, user_input: str) -> List[str]:
+    def _extract_requested_ratios(self, user_input: str, user_input_lower: str = None) -> List[str]:
         """요청된 특정 비율 추출"""
-        requested = []
-        
-        for ratio_name, keywords in self.context_keywords["ratio_items"].items():
-            if any(keyword in user_input.lower() for keyword in keywords):
-                requested.append(ratio_name)
-        
-        return requested
+        if user_input_lower is None:
+            user_input_lower = _normalize(user_input)
+        
+        # 역색인 한 번 순회로 매칭 (조사가 붙는 한국어 특성상 토큰 일치가 아닌 부분 문자열 비교)
+        # dict.fromkeys로 중복을 제거하면서 비율 정의 순서를 유지
+        return list(dict.fromkeys(
+            ratio_name for keyword, ratio_name in self._ratio_kw_to_name.items()
+            if keyword in user_input_lower
+        ))
 
-    def _extract_comparison_target(self, user_input: str) -> str:
+    def _extract_comparison_target(self, user_input: str, user_input_lower: str = None) -> str:
         """비교 대상 추출"""
-        user_input_lower = user_input.lower()
+        if user_input_lower is None:
+            user_input_lower = _normalize(user_input)
         
-        if any(keyword in user_input_lower for keyword in ["업계", "평균", "industry"]):
+        if _contains_any(user_input_lower, _INDUSTRY_KEYWORDS):
             return "industry"
-        elif any(keyword in user_input_lower for keyword in ["작년", "전년", "2023", "previous"]):
+        elif _contains_any(user_input_lower, _PREVIOUS_YEAR_KEYWORDS):
             return "previous_year"
-        elif any(keyword in user_input_lower for keyword in ["경쟁사", "competitor"]):
+        elif _contains_any(user_input_lower, _COMPETITOR_KEYWORDS):
             return "competitors"
         else:
             return "unknown"
 
-    def _determine_chart_type(self, user_input: str) -> str:
+    def _determine_chart_type(self, user_input: str, user_input_lower: str = None) -> str:
         """시각화 유형 결정"""
-        user_input_lower = user_input.lower()
+        if user_input_lower is None:
+            user_input_lower = _normalize(user_input)
         
-        if any(keyword in user_input_lower for keyword in ["막대", "bar", "비교"]):
+        if _contains_any(user_input_lower, _BAR_CHART_KEYWORDS):
             return "bar_chart"
-        elif any(keyword in user_input_lower for keyword in ["선", "line", "추세", "trend"]):
+        elif _contains_any(user_input_lower, _LINE_CHART_KEYWORDS):
             return "line_chart"
-        elif any(keyword in user_input_lower for keyword in ["파이", "pie", "비중", "구성"]):
+        elif _contains_any(user_input_lower, _PIE_CHART_KEYWORDS):
             return "pie_chart"
-        elif any(keyword in user_input_lower for keyword in ["레이더", "radar", "종합"]):
+        elif _contains_any(user_input_lower, _RADAR_CHART_KEYWORDS):
             return "radar_chart"
         else:
             return "comprehensive_dashboard"
@@ -685,15 +1022,7 @@ class SmartConversationHandler:
     def _determine_fraud_risk_level(self, fraud_ratios: Dict) -> str:
         """부정 위험 수준 결정"""
         risk_score = fraud_ratios.get("종합_부정위험점수", 0)
-        
-        if risk_score >= 70:
-            return "HIGH"
-        elif risk_score >= 40:
-            return "MEDIUM" 
-        elif risk_score >= 20:
-            return "LOW"
-        else:
-            return "MINIMAL"
+        return _FRAUD_LEVELS[bisect.bisect_right(_FRAUD_THRESHOLDS, risk_score)]
 
     def _generate_ratio_explanation(self, ratios: Dict) -> str:
         """비율 설명 생성"""
@@ -721,10 +1050,11 @@ class SmartConversationHandler:
         
         return " ".join(explanations) if explanations else "분석된 비율을 확인해주세요."
 
-    def _generate_fraud_explanation(self, fraud_ratios: Dict) -> str:
-        """부정 위험 설명 생성"""
+    def _generate_fraud_explanation(self, fraud_ratios: Dict, risk_level: str = None) -> str:
+        """부정 위험 설명 생성 (risk_level을 이미 구했다면 전달받아 재계산 생략)"""
         risk_score = fraud_ratios.get("종합_부정위험점수", 0)
-        risk_level = self._determine_fraud_risk_level(fraud_ratios)
+        if risk_level is None:
+            risk_level = self._determine_fraud_risk_level(fraud_ratios)
         
         base_message = f"종합 부정 위험 점수: {risk_score}점 ({risk_level} 위험)"
         
@@ -748,27 +1078,30 @@ class SmartConversationHandler:
         """업계 비교 분석 생성"""
         ratios = context.get("ratios", {})
         
-        # 업계 평균 (임시 데이터 - 실제로는 DB나 API에서 가져와야 함)
-        industry_averages = {
-            "ROE": 12.5,
-            "ROA": 8.3,
-            "부채비율": 85.2,
-            "영업이익률": 8.7,
-            "순이익률": 6.4
+        # 업계 평균과 같은 순서의 배열로 정렬해 차이를 한 번에 계산 (수치가 아니면 NaN)
+        company_values = [ratios.get(key) for key in _INDUSTRY_KEYS]
+        values = np.array([
+            value if isinstance(value, (int, float)) else np.nan
+            for value in company_values
+        ], dtype=float)
+        differences = values - _INDUSTRY_VALS
+        valid = ~np.isnan(differences)
+        statuses = np.where(differences > 0, "우수", "열세")
+        
+        comparison_results = {
+            key: {
+                "company": company_value,
+                "industry": industry_value,
+                "difference": difference,
+                "status": status
+            }
+            for key, company_value, industry_value, difference, status, is_valid in zip(
+                _INDUSTRY_KEYS, company_values, _INDUSTRY_VALS.tolist(),
+                differences.tolist(), statuses.tolist(), valid.tolist()
+            )
+            if is_valid
         }
         
-        comparison_results = {}
-        for ratio_name, company_value in ratios.items():
-            if ratio_name in industry_averages and isinstance(company_value, (int, float)):
-                industry_value = industry_averages[ratio_name]
-                difference = company_value - industry_value
-                comparison_results[ratio_name] = {
-                    "company": company_value,
-                    "industry": industry_value,
-                    "difference": difference,
-                    "status": "우수" if difference > 0 else "열세"
-                }
-        
         return {
             "type": "industry_comparison",
             "company": self.current_company,
@@ -844,68 +1177,142 @@ class SmartConversationHandler:
 
     # === 대화 히스토리 관리 ===
     
-    def get_conversation_history(self, limit: int = 10) -> List[Dict]:
+    def get_conversation_history(self, limit: int = 10) -> List[ConversationRecord]:
         """대화 히스토리 조회"""
-        return self.conversation_history[-limit:] if limit else self.conversation_history
+        if not limit:
+            return list(self.conversation_history)
+        start = max(0, len(self.conversation_history) - limit)
+        return list(islice(self.conversation_history, start, None))
 
     def clear_conversation_history(self):
         """대화 히스토리 초기화"""
         self.conversation_history.clear()
+        self._reset_summary_state()
         self.current_company = None
+        self._summary_cache.clear()
+
+    @staticmethod
+    def _fmt_ts(timestamp: float) -> str:
+        """히스토리의 epoch 타임스탬프를 ISO 문자열로 변환"""
+        return datetime.fromtimestamp(timestamp).isoformat()
 
-    def export_conversation_history(self, filepath: str = None) -> str:
-        """대화 히스토리 내보내기"""
+    def export_conversation_history(self, filepath: str = None, pretty: bool = False) -> str:
+        """대화 히스토리 내보내기 (JSON 문서)
+
+        기본은 들여쓰기 없는 압축 JSON (직렬화가 빠르고 파일이 작음).
+        사람이 읽을 용도면 pretty=True로 내보내거나 `python -m json.tool`로 정렬하면 된다.
+        경로가 .zst로 끝나면 zstd로 압축해 저장한다 (zstandard 미설치 시 .zst를 뗀 경로에
+        비압축으로 저장). 실제 저장 경로를 반환한다.
+        """
         if filepath is None:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filepath = f"conversation_history_{timestamp}.json"
+            # 나노초 타임스탬프: 연속 내보내기에서도 파일명이 겹치지 않음
+            filepath = f"conversation_history_{time.time_ns()}.json"
+        
+        # 대화 수를 알고 있으므로 리스트를 미리 할당해 증가 재할당 없이 채움
+        conversations = [None] * len(self.conversation_history)
+        for i, values in enumerate(map(_get_export_values, self.conversation_history)):
+            conversations[i] = dict(zip(_EXPORT_FIELDS, values))
         
         history_data = {
             "export_time": datetime.now().isoformat(),
             "current_company": self.current_company,
-            "conversation_count": len(self.conversation_history),
-            "conversations": [
-                {
-                    "timestamp": conv["timestamp"].isoformat(),
-                    "user_input": conv["user_input"],
-                    "company": conv["company"]
-                }
-                for conv in self.conversation_history
-            ]
+            "conversation_count": len(conversations),
+            "conversations": conversations
         }
         
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(history_data, f, ensure_ascii=False, indent=2)
+        payload = _dumps_document(history_data, pretty=pretty)
+        if filepath.endswith(".zst"):
+            if zstandard is not None:
+                # 레벨 3: 텍스트 JSON을 크게 줄이면서 압축 자체도 빠름 (threads=-1: 전체 코어 사용)
+                payload = zstandard.ZstdCompressor(level=3, threads=-1).compress(payload)
+            else:
+                print("⚠️ zstandard 미설치 - 압축하지 않고 저장합니다.")
+                filepath = filepath[:-len(".zst")]
+        
+        _write_bytes(filepath, payload)
         
         return filepath
 
+    def export_conversation_history_ndjson(self, filepath: str = None) -> str:
+        """대화 히스토리 내보내기 (NDJSON)
+
+        첫 줄은 내보내기 메타데이터, 이후 한 줄에 대화 1건씩 기록한다.
+        전체 문서를 메모리에 만들지 않고 바로 파일에 쓰므로 히스토리가 길어도
+        메모리 사용량이 늘지 않으며, 중간에 끊겨도 기록된 줄까지는 읽을 수 있다.
+        timestamp는 epoch 초 그대로 저장된다.
+        """
+        if filepath is None:
+            # 나노초 타임스탬프: 연속 내보내기에서도 파일명이 겹치지 않음
+            filepath = f"conversation_history_{time.time_ns()}.ndjson"
+        
+        header = {
+            "export_time": datetime.now().isoformat(),
+            "current_company": self.current_company,
+            "conversation_count": len(self.conversation_history)
+        }
+        
+        with open(filepath, 'wb', buffering=1 << 20) as f:
+            f.write(_dumps_line(header))
+            # 대화 기록은 그대로 직렬화 (orjson은 데이터클래스 기본 지원, json은 _json_default)
+            f.writelines(map(_dumps_line, self.conversation_history))
+        
+        return filepath
+
+    def compact_history(self, older_than: timedelta = timedelta(hours=6)) -> int:
+        """오래된 대화를 요약 레코드 1건으로 압축
+
+        older_than보다 오래된 대화(기존 요약 레코드 포함)를 유형별·회사별 대화 수만 담은
+        요약 레코드 하나로 바꿔 히스토리 길이를 줄인다. 요약 통계(대화 수, 유형 통계,
+        세션 시간)는 압축 전과 같게 유지된다. 요약 레코드에 담긴 대화 수를 반환한다.
+        """
+        cutoff = time.time() - older_than.total_seconds()
+        history = self.conversation_history
+        
+        # 히스토리는 시간순이므로 앞쪽부터 기준 시각 이전 항목을 떼어냄
+        stale = []
+        while history and history[0].timestamp < cutoff:
+            stale.append(history.popleft())
+        if not stale:
+            return 0
+        
+        digest_counts = Counter()
+        digest_companies = Counter()
+        for record in stale:
+            if record.digest_counts is not None:
+                digest_counts.update(record.digest_counts)
+                digest_companies.update(record.digest_companies or {})
+            else:
+                digest_counts[record.query_type] += 1
+                if record.company:
+                    digest_companies[record.company] += 1
+        
+        turns = sum(digest_counts.values())
+        # 세션 시간이 유지되도록 가장 오래된 대화 시각을 사용
+        history.appendleft(ConversationRecord(
+            timestamp=stale[0].timestamp,
+            timestamp_iso=stale[0].timestamp_iso,
+            user_input=f"<이전 대화 {turns}건 요약>",
+            company=None,
+            query_type="digest",
+            digest_counts=dict(digest_counts),
+            digest_companies=dict(digest_companies)
+        ))
+        return turns
+
     def get_conversation_summary(self) -> Dict[str, Any]:
         """대화 요약 정보"""
         if not self.conversation_history:
-            return {
-                "total_conversations": 0,
-                "current_company": None,
-                "most_recent": None
-            }
-        
-        companies_discussed = set()
-        query_types = {}
+            return self._EMPTY_SUMMARY.copy()
         
-        for conv in self.conversation_history:
-            if conv["company"]:
-                companies_discussed.add(conv["company"])
-            
-            # 질의 유형 통계
-            query_type = self._classify_query_type(conv["user_input"])
-            query_types[query_type] = query_types.get(query_type, 0) + 1
+        history = self.conversation_history
         
+        # 누적 통계를 그대로 사용 (히스토리 재순회·재분류 없음)
         return {
-            "total_conversations": len(self.conversation_history),
+            # 요약 레코드로 묶인 대화까지 포함한 전체 대화 수
+            "total_conversations": sum(self._query_type_counts.values()),
             "current_company": self.current_company,
-            "companies_discussed": list(companies_discussed),
-            "query_type_stats": query_types,
-            "most_recent": self.conversation_history[-1]["timestamp"].isoformat(),
-            "session_duration": (
-                self.conversation_history[-1]["timestamp"] - 
-                self.conversation_history[0]["timestamp"]
-            ).total_seconds() / 60  # minutes
+            "companies_discussed": list(self._company_counts),
+            "query_type_stats": dict(self._query_type_counts),
+            "most_recent": history[-1].timestamp_iso,
+            "session_duration": (self._last_ts - self._first_ts) / 60.0  # minutes
         }
\ No newline at end of file
@@ -5,25 +5,345 @@
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
 import pandas as pd
-from datetime import datetime, timedelta
+import numpy as np
+from datetime import datetime
 import time
 import os
 import math
 import re
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Mapping, Optional, Any, Tuple
 import xml.etree.ElementTree as ET
 import zipfile
 import io
+import pickle
+import shelve
+import glob
+import weakref
+import hashlib
+from collections import OrderedDict, deque
+from itertools import islice
+from functools import lru_cache
+from dataclasses import dataclass, fields
+from types import MappingProxyType
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+
+try:
+    import diskcache
+except ImportError:
+    diskcache = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# DART 동시 요청 상한 (고정 sleep 대신 동시성으로 호출량 제어)
+DART_MAX_CONCURRENCY = 4
+# 회사 고유번호 목록(corpCode.xml) 디스크 캐시 유효 시간 (초)
+CORP_INDEX_MAX_AGE = 24 * 60 * 60
+# 최근 사업연도 재무제표 캐시 유효 시간 (초) — 정정공시 가능성, 지난 연도는 만료 없음
+DART_CACHE_RECENT_MAX_AGE = 7 * 24 * 60 * 60
+# 메모리에 보관하는 사업보고서 원본 응답 수 (재무제표·현금흐름표 파서가 공유)
+REPORT_CACHE_SIZE = 8
+# 에이전트 작업 기록·A2A 토론 기록 최대 보관 수
+AGENT_LOG_MAXLEN = 10000
+DISCUSSION_LOG_MAXLEN = 5000
+# 메모리에 유지하는 최근 분석 컨텍스트 수 (넘치면 오래된 것부터 세션 전용 디스크 저장소로 이동)
+CONTEXT_HOT_SIZE = 16
+# LLM 응답 메모리 캐시 최대 항목 수
+RESPONSE_CACHE_SIZE = 512
+# 다른 에이전트에게 전달하는 의견 1건당 최대 글자 수 (입력 토큰 ≈ 추론 시간)
+OPINION_CHAR_BUDGET = 450
+_JSON_HEADERS = {'Content-Type': 'application/json'}
+
+# 🔧 더 포괄적인 계정명 매칭 (카카오 등을 위해)
+_TARGET_ACCOUNTS = {
+    # 기타 (매출채권 우선)
+    '현금및현금성자산': 'cash_and_equivalents',
+    '매출채권': 'accounts_receivable',
+    '재고자산': 'inventory',
+    '매출총이익': 'gross_profit',
+
+    # 매출 관련 (다양한 표현)
+    '매출액': 'revenue',
+    '수익(매출액)': 'revenue', 
+    '영업수익': 'revenue',
+    '매출': 'revenue',
+    '수익': 'revenue',
+    
+    # 영업이익 관련
+    '영업이익': 'operating_income', 
+    '영업이익(손실)': 'operating_income',
+    '영업손익': 'operating_income',
+    
+    # 순이익 관련 (카카오를 위해 추가)
+    '당기순이익': 'net_income',
+    '당기순이익(손실)': 'net_income',
+    '연결당기순이익': 'net_income',
+    '순이익': 'net_income',
+    '당기순손익': 'net_income',
+    '지배기업소유주지분당기순이익': 'net_income',  # 카카오용
+    '지배기업소유주지분당기순손익': 'net_income',  # 카카오용
+    
+    # 자산 관련
+    '자산총계': 'total_assets',
+    '총자산': 'total_assets',
+    
+    # 부채 관련
+    '부채총계': 'total_liabilities',
+    '총부채': 'total_liabilities',
+    
+    # 자본 관련 (카카오를 위해 추가)
+    '자본총계': 'total_equity',
+    '자기자본': 'total_equity',
+    '연결자본총계': 'total_equity',
+    '총자본': 'total_equity',
+    '지배기업소유주지분': 'total_equity',  # 카카오용
+}
+
+# 재무제표 파싱 대상 재무제표 종류
+_RELEVANT_STATEMENTS = frozenset({'손익계산서', '재무상태표', '포괄손익계산서'})
+# 금액 없음으로 취급하는 값
+_EMPTY_AMOUNTS = frozenset({'0', '', '-', 'nan'})
+
+# 계정명 정리용 정규식 (대괄호 → 소괄호 순으로 제거)
+_BRACKET_RE = re.compile(r'\[.*?\]')
+_PAREN_RE = re.compile(r'\(.*?\)')
+
+
+@lru_cache(maxsize=4096)
+def _account_candidates(account_nm: str) -> Tuple[Tuple[str, str, bool], ...]:
+    """계정명과 포함 관계에 있는 대상 계정 목록 (target_name, key, 정확일치 여부)
+
+    같은 계정명이 연도·회사마다 반복되므로 정리·매칭 결과를 캐시해
+    행마다 전체 대상 계정을 순회하지 않는다. 순서는 _TARGET_ACCOUNTS 우선순위를 따른다.
+    """
+    cleaned = _PAREN_RE.sub('', _BRACKET_RE.sub('', account_nm).strip()).strip()
+    return tuple(
+        (target_name, key, cleaned == target_name)
+        for target_name, key in _TARGET_ACCOUNTS.items()
+        if target_name in cleaned or cleaned in target_name
+    )
+
+
+_CASH_FLOW_ACCOUNTS = {
+    '영업활동현금흐름': 'operating_cash_flow',
+    '영업활동으로인한현금흐름': 'operating_cash_flow',
+    '투자활동현금흐름': 'investing_cash_flow',
+    '재무활동현금흐름': 'financing_cash_flow'
+}
+
+
+@lru_cache(maxsize=1024)
+def _cash_flow_key(account_nm: str) -> Optional[str]:
+    """현금흐름표 계정명이 포함하는 첫 대상 계정의 키 (없으면 None)"""
+    for target_name, key in _CASH_FLOW_ACCOUNTS.items():
+        if target_name in account_nm:
+            return key
+    return None
+
+
+def _safe_divide(a, b, default=0):
+    """0으로 나누기 안전 나눗셈"""
+    return (a / b) if b != 0 else default
+
+
+def _json_loads(content: bytes) -> Any:
+    """HTTP 응답 본문 JSON 디코딩 (orjson이 있으면 사용)"""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """HTTP 요청 본문 JSON 인코딩 (UTF-8 바이트)"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False).encode('utf-8')
+
+
+def _close_context_store(store: shelve.Shelf, path: str):
+    """세션 전용 컨텍스트 저장소를 닫고 파일 삭제 (에이전트 소멸·종료 시 호출)"""
+    store.close()
+    for filename in glob.glob(glob.escape(path) + "*"):
+        try:
+            os.remove(filename)
+        except OSError:
+            pass
+
+
+# DART 조회 실패 시 사용하는 주요 회사 정보 (요청문 회사명 추출에도 공유)
+_MAJOR_COMPANIES = {
+    "삼성전자": {"corp_name": "삼성전자주식회사", "corp_code": "00126380", "stock_code": "005930"},
+    "LG전자": {"corp_name": "엘지전자주식회사", "corp_code": "00401731", "stock_code": "066570"},
+    "현대자동차": {"corp_name": "현대자동차주식회사", "corp_code": "00164779", "stock_code": "005380"},
+    "SK하이닉스": {"corp_name": "에스케이하이닉스주식회사", "corp_code": "00164742", "stock_code": "000660"},
+    "네이버": {"corp_name": "네이버주식회사", "corp_code": "00401517", "stock_code": "035420"},
+    "카카오": {"corp_name": "주식회사카카오", "corp_code": "00401062", "stock_code": "035720"}
+}
+
+# 요청문 회사명 추출 패턴 (우선순위 순, 모듈 로드 시 1회 컴파일)
+_COMPANY_PATTERNS = (
+    re.compile('(' + '|'.join(map(re.escape, (*_MAJOR_COMPANIES, '포스코', 'KT', 'LG화학'))) + ')'),
+    re.compile(r'([가-힣A-Za-z]+(?:전자|자동차|화학|통신|바이오|제약|건설|중공업|생명과학))'),
+    re.compile(r'([가-힣A-Za-z]+(?:회사|기업|그룹|코퍼레이션))'),
+)
+_COMPANY_WORD_RE = re.compile(r'(?<!\S)(?=\S*[전자동차화학통신])\S{2,}(?!\S)')
+
+
+@lru_cache(maxsize=1024)
+def _extract_company_name(request: str) -> Optional[str]:
+    """요청문에서 회사명 추출 (재시도·재실행 시 같은 요청은 캐시 재사용)"""
+    for pattern in _COMPANY_PATTERNS:
+        match = pattern.search(request)
+        if match:
+            return match.group(1)
+    
+    # 업종 글자를 포함한 첫 단어 (2글자 이상)
+    match = _COMPANY_WORD_RE.search(request)
+    if match:
+        return match.group(0)
+    
+    return None
+
+
+# 통화 표시 단위 (기준 금액, 형식) — 큰 단위부터 확인
+# printf 형식 — 단일 값(_format_currency)과 배열(_format_currency_array)이 같은 형식을 공유
+_CURRENCY_UNITS = (
+    (1000000000000, "%.1f조원"),
+    (100000000, "%.0f억원"),
+    (10000, "%.0f만원"),
+)
+
+
+# 같은 지표 값이 보고서·요약 여러 곳에 반복 표시되므로 결과를 캐시
+# (typed=True: 1과 1.0은 표시가 다르므로 별도 항목)
+@lru_cache(maxsize=4096, typed=True)
+def _format_currency(amount: int) -> str:
+    """통화 포맷팅 (조/억/만 단위)"""
+    magnitude = abs(amount)
+    for threshold, fmt in _CURRENCY_UNITS:
+        if magnitude >= threshold:
+            return fmt % (amount / threshold)
+    return f"{amount:,}원"
+
+
+def _format_currency_array(values: np.ndarray) -> List[str]:
+    """통화 포맷팅 (배열 단위) — 단위 구간 판정과 나눗셈은 NumPy로 일괄 처리"""
+    magnitude = np.abs(values)
+    units = np.select([magnitude >= threshold for threshold, _ in _CURRENCY_UNITS],
+                      range(len(_CURRENCY_UNITS)), default=len(_CURRENCY_UNITS))
+    thresholds = np.array([threshold for threshold, _ in _CURRENCY_UNITS] + [1])
+    scaled = (values / thresholds[units]).tolist()
+    formats = [fmt for _, fmt in _CURRENCY_UNITS]
+    # 만원 미만은 천 단위 구분 기호가 필요하므로 단일 값 포맷터 사용 (드문 경우)
+    return [formats[unit] % value if unit < len(formats) else _format_currency(raw)
+            for unit, value, raw in zip(units.tolist(), scaled, values.tolist())]
+
+
+# 불리언 비율 표시 문자열 — 모든 결과가 같은 객체를 공유 (표 변환 시 셀마다 새로 만들지 않음)
+_YES = "예"
+_NO = "아니오"
+
+
+@lru_cache(maxsize=4096, typed=True)
+def _format_percentage(ratio: float, decimal_places: int = 2) -> str:
+    """백분율 포맷팅"""
+    return f"{ratio:.{decimal_places}f}%"
+
+
+# 프롬프트용 의견 축약 시 연속 공백·줄바꿈 정리
+_WHITESPACE_RE = re.compile(r'\s+')
+
+
+# 토론 전 요약 (읽기 전용 공유 객체)
+_EMPTY_DISCUSSION_SUMMARY = MappingProxyType({"message": "아직 토론이 진행되지 않았습니다."})
+
+
+# A2A 분석 완료 요약 (_generate_a2a_summary에서 값만 채움)
+_A2A_SUMMARY_TEMPLATE = """
+🤖 {company} 완전 A2A 협업 분석 완료!
+
+📊 기본 재무 현황:
+• 매출액: {revenue}
+• 순이익: {net_income}
+• ROE: {roe:.1f}%
+
+🏆 AI 협업 최종 결과:
+• 투자 등급: {investment_grade} (분포: {investment_distribution})
+• 부정 위험: {risk_grade} (분포: {risk_distribution})
+• 판정 쏠림 기반 확신도: 투자 {investment_confidence}% / 위험 {risk_confidence}%
+※ 본 등급은 AI 판단 보조 지표이며, 분포가 분산된 항목일수록 전문가의 직접 검토가 필요합니다.
+
+🗣️ A2A 협업 과정:
+• 총 AI 상호작용: {interaction_count}회
+• 참여 전문가: 김성실, 이정확, 박의심
+• 다회차 토론으로 합의 도출
+
+🎯 최종 AI 합의 의견:
+{consensus}...
+
+💡 A2A 협업의 가치:
+✓ 단일 AI를 넘어선 집단 지성 활용
+✓ 전문가 수준의 다각적 검증
+✓ 투명한 의사결정 과정 공개
+✓ 인간 전문가팀과 동등한 분석 품질
+
+💬 이제 다음과 같은 질문을 해보세요:
+• "AI들이 어떻게 토론했는지 보여줘"
+• "투자 등급을 왜 {question_grade}로 결정했어?"
+• "AI들 사이에 의견 차이가 있었나?"
+• "보고서 만들어줘"
+"""
+
+
+@dataclass(slots=True)
+class AnalysisContext:
+    """회사별 분석 컨텍스트 (고정 스키마이므로 dict 대신 slots 데이터클래스로 메모리 절감)
+
+    기존 dict 기반 호출부(context["ratios"], context.get(...))가 그대로 동작하도록
+    읽기 전용 매핑 접근을 지원한다.
+    """
+    timestamp: datetime  # 표시용
+    saved_at_ns: int  # 만료 판단용 (time.monotonic_ns, 시계 변경에 영향 없음)
+    analysis_data: Dict
+    ratios: Dict
+    financial_data: Dict
+    cash_flow_data: Dict
+    a2a_discussion_log: tuple
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in _ANALYSIS_CONTEXT_FIELDS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return getattr(self, key) if key in _ANALYSIS_CONTEXT_FIELDS else default
+
+    def __contains__(self, key: object) -> bool:
+        # 정의하지 않으면 `in`이 __getitem__(0, 1, ...) 순회로 대체되어 KeyError 발생
+        return key in _ANALYSIS_CONTEXT_FIELDS
+
+
+_ANALYSIS_CONTEXT_FIELDS = frozenset(f.name for f in fields(AnalysisContext))
 
 class AdvancedAuditAgent:
     """완전 A2A 협업 고급 감사 에이전트 AI"""
     
+    # 표시 시 백분율(%)로 포맷하는 비율
+    _PERCENTAGE_RATIOS = frozenset({'ROE', 'ROA', '영업이익률', '순이익률', '부채비율', '자기자본비율'})
+    
     def __init__(self, dart_api_key: str, ecos_api_key: str = None):
         self.dart_api_key = dart_api_key
         self.dart_base_url = "https://opendart.fss.or.kr/api"
         self.ollama_url = "http://localhost:11434/api/generate"
+        # DART·Ollama 호출이 TCP/TLS 연결을 재사용하도록 세션 하나를 공유
+        self.http = self._create_http_session()
 
         # ECOS(한국은행) 업종 벤치마크 클라이언트 (키가 있을 때만 활성화)
         self.ecos_client = None
@@ -64,20 +384,70 @@ class AdvancedAuditAgent:
         # GUI 등 외부에서 진행 상황을 받아볼 수 있는 콜백 (message, llm_calls_done)
         self.progress_callback = None
         self._llm_calls_done = 0
+        # 에이전트 의견은 서로 독립이므로 동시에 요청 (Ollama 서버 동시 처리 수에 맞춤)
+        # VRAM이 작아 모델을 동시에 올릴 수 없다면 OLLAMA_NUM_PARALLEL=1로 순차 실행
+        self._llm_parallelism = max(1, int(os.getenv("OLLAMA_NUM_PARALLEL", "3")))
+        self._llm_executor = None  # 첫 병렬 호출 시 생성
+        # 호출 사이에 모델이 언로드되지 않도록 유지 시간 지정 (Ollama 기본 5분)
+        self._keep_alive = os.getenv("OLLAMA_KEEP_ALIVE", "30m")
+        self._models_warmed = False
+        self._llm_lock = threading.Lock()
         self.work_directory = "analysis_results"
-        self.agent_log = []
-        self.conversation_memory = {}
-        self.discussion_log = []  # A2A 토론 기록
+        # 동일 (모델, 프롬프트) 응답 캐시 — 재실행·재시도 시 추론 생략
+        # 실행 간 등급 변동을 불확실성 신호로 쓰므로 기본은 비활성화 (OLLAMA_RESPONSE_CACHE=1로 사용)
+        self._response_cache = None
+        self._response_disk_cache = None
+        if os.getenv("OLLAMA_RESPONSE_CACHE", "0") == "1":
+            self._response_cache = OrderedDict()
+            if diskcache is not None:
+                self._response_disk_cache = diskcache.Cache(f"{self.work_directory}/data/ollama_cache")
+        self._persona_prefix = {}  # agent_key → 페르소나 머리말
+        # 세션이 길어져도 메모리가 무한히 늘지 않도록 최근 기록만 보관
+        self.agent_log = deque(maxlen=AGENT_LOG_MAXLEN)
+        # 저장 시각 순서(오래된 것이 앞)를 유지해 만료 정리를 앞에서부터 끊을 수 있게 함
+        self.conversation_memory = OrderedDict()
+        # 메모리에서 밀려난 컨텍스트: 회사명 → saved_at_ns (이동 순서 유지, 본문은 디스크 저장소)
+        self._cold_contexts = OrderedDict()
+        self._context_store = None  # 처음 넘칠 때 생성
+        self.discussion_log = deque(maxlen=DISCUSSION_LOG_MAXLEN)  # A2A 토론 기록 (추가만 됨)
+        self._discussion_snapshot = ()  # 컨텍스트 저장용 불변 스냅샷 (여러 컨텍스트가 공유)
+        # 상태/토론 요약 조회 결과 (UI 폴링 시 바뀐 것이 없으면 같은 읽기 전용 뷰 반환)
+        self._status_key = None
+        self._status_view = None
+        self._summary_key = None
+        self._summary_view = None
+        # DART 회사 목록 캐시 (검색마다 수 MB ZIP을 다시 받지 않도록 첫 검색 시 1회 로드)
+        self._corp_list = None
+        self._corp_by_name = None
+        # (corp_code, year) → 사업보고서 원본 항목 Future (동시 요청 중복 제거 겸 캐시)
+        self._report_cache = OrderedDict()
+        self._report_lock = threading.Lock()
         
         self._setup_directories()
         print("🤖 A2A 협업 시스템 활성화 완료! 모든 분석이 AI 협업으로 실행됩니다.")
 
+    @staticmethod
+    def _create_http_session() -> requests.Session:
+        """keep-alive 연결 풀과 일시 오류(429/5xx) 재시도를 갖춘 HTTP 세션
+
+        재시도는 GET에만 적용되어 LLM 생성 요청(POST)이 중복 실행되지 않는다.
+        """
+        retry = Retry(total=3, backoff_factor=0.3, status_forcelist=(429, 500, 502, 503, 504),
+                      raise_on_status=False)
+        # 동시 요청 수(DART 스레드 + 병렬 LLM 호출)를 수용하는 풀 크기
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retry)
+        session = requests.Session()
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
     def _setup_directories(self):
         """작업 디렉토리 설정"""
         directories = [
             self.work_directory,
             f"{self.work_directory}/reports",
             f"{self.work_directory}/data", 
+            f"{self.work_directory}/data/dart_cache",
             f"{self.work_directory}/charts",
             f"{self.work_directory}/documents"
         ]
@@ -85,6 +455,35 @@ class AdvancedAuditAgent:
         for directory in directories:
             os.makedirs(directory, exist_ok=True)
 
+    @staticmethod
+    def _response_cache_key(model_name: str, prompt: str) -> str:
+        """(모델, 프롬프트) 응답 캐시 키"""
+        digest = hashlib.blake2b(prompt.encode('utf-8'), digest_size=16).hexdigest()
+        return f"{model_name}:{digest}"
+
+    def _get_cached_response(self, cache_key: str) -> Optional[str]:
+        """메모리 → 디스크 순으로 캐시된 응답 조회 (없으면 None)"""
+        with self._llm_lock:
+            if cache_key in self._response_cache:
+                self._response_cache.move_to_end(cache_key)
+                return self._response_cache[cache_key]
+        if self._response_disk_cache is not None:
+            cached = self._response_disk_cache.get(cache_key)
+            if cached is not None:
+                self._store_cached_response(cache_key, cached, persist=False)
+            return cached
+        return None
+
+    def _store_cached_response(self, cache_key: str, response: str, persist: bool = True):
+        """성공한 응답만 캐시에 저장 (오류 응답은 재시도되도록 저장하지 않음)"""
+        with self._llm_lock:
+            self._response_cache[cache_key] = response
+            self._response_cache.move_to_end(cache_key)
+            if len(self._response_cache) > RESPONSE_CACHE_SIZE:
+                self._response_cache.popitem(last=False)
+        if persist and self._response_disk_cache is not None:
+            self._response_disk_cache.set(cache_key, response)
+
     def load_model(self, model_name: str):
         """모델 전환 기록 (실제 로딩/언로딩은 Ollama 서버가 요청 시점에 수행)"""
         if self.current_loaded_model == model_name:
@@ -96,18 +495,30 @@ class AdvancedAuditAgent:
     def call_ollama(self, model_key: str, prompt: str) -> str:
         """Ollama API 호출"""
         model_name = self.agents[model_key]["model"]
-        self.load_model(model_name)
 
         # 진행 콜백: LLM 호출 단위로 실제 진행 상황을 알림 (긴 토론 구간의 체감 개선)
-        self._llm_calls_done += 1
+        # 병렬 호출 시 여러 스레드에서 갱신되므로 잠금 아래에서 증가
+        with self._llm_lock:
+            self._llm_calls_done += 1
+            calls_done = self._llm_calls_done
         if self.progress_callback:
             agent_name = self.agents[model_key]["name"]
-            self.progress_callback(f"{agent_name} · {model_name} 응답 생성 중", self._llm_calls_done)
+            self.progress_callback(f"{agent_name} · {model_name} 응답 생성 중", calls_done)
+
+        cache_key = None
+        if self._response_cache is not None:
+            cache_key = self._response_cache_key(model_name, prompt)
+            cached = self._get_cached_response(cache_key)
+            if cached is not None:
+                return cached
+
+        self.load_model(model_name)
         
         data = {
             "model": model_name,
             "prompt": prompt,
             "stream": False,
+            "keep_alive": self._keep_alive,
             # qwen3는 기본으로 사고(thinking) 토큰을 먼저 생성해 num_predict를
             # 소진하고 빈 응답을 반환함 → 사고 모드 비활성화 (등급 판정에는 불필요)
             **({"think": False} if model_name.startswith("qwen3") else {}),
@@ -123,9 +534,13 @@ class AdvancedAuditAgent:
         }
         
         try:
-            response = requests.post(self.ollama_url, json=data, timeout=180)
+            response = self.http.post(self.ollama_url, data=_json_dumps(data),
+                                      headers=_JSON_HEADERS, timeout=180)
             if response.status_code == 200:
-                return response.json().get("response", "응답 없음")
+                result = _json_loads(response.content).get("response", "응답 없음")
+                if cache_key is not None:
+                    self._store_cached_response(cache_key, result)
+                return result
             else:
                 return f"API 오류 {response.status_code}"
         except Exception as e:
@@ -149,62 +564,80 @@ class AdvancedAuditAgent:
         print(f"🔍 DART에서 '{company_name}' 검색 중...")
         
         try:
-            url = "https://opendart.fss.or.kr/api/corpCode.xml"
-            params = {'crtfc_key': self.dart_api_key}
-            
-            response = requests.get(url, params=params, timeout=15)
-            if response.status_code == 200:
-                zip_file = zipfile.ZipFile(io.BytesIO(response.content))
-                xml_data = zip_file.read('CORPCODE.xml').decode('utf-8')
-                root = ET.fromstring(xml_data)
-                
-                candidates = []
-                exact_match = None
-                
-                for corp in root.findall('list'):
-                    corp_name = corp.find('corp_name').text if corp.find('corp_name') is not None else ""
-                    corp_code = corp.find('corp_code').text if corp.find('corp_code') is not None else ""
-                    stock_code = corp.find('stock_code').text if corp.find('stock_code') is not None else ""
-                    
-                    if company_name in corp_name:
-                        company_info = {
-                            'corp_name': corp_name,
-                            'corp_code': corp_code,
-                            'stock_code': stock_code if stock_code and stock_code.strip() else 'N/A'
-                        }
-                        
-                        if corp_name == company_name:
-                            exact_match = company_info
-                        candidates.append(company_info)
-                
-                if exact_match:
-                    return exact_match
-                elif candidates:
-                    return {"candidates": candidates[:5], "exact_match": False}
-                else:
-                    return None
-            else:
+            if not self._load_corp_index():
                 return None
+            
+            exact_match = self._corp_by_name.get(company_name)
+            if exact_match:
+                return exact_match
+            
+            candidates = [info for info in self._corp_list if company_name in info['corp_name']][:5]
+            if candidates:
+                return {"candidates": candidates, "exact_match": False}
+            return None
                 
         except Exception as e:
             print(f"❌ 검색 오류: {str(e)}")
             return self._fallback_company_search(company_name)
+
+    def _load_corp_index(self) -> bool:
+        """DART 회사 목록을 메모리 → 디스크 캐시(24시간) → 다운로드 순으로 로드"""
+        if self._corp_list is not None:
+            return True
+        
+        cache_path = os.path.join(self.work_directory, "data", "corp_index.pkl")
+        corp_list = None
+        try:
+            if time.time() - os.path.getmtime(cache_path) < CORP_INDEX_MAX_AGE:
+                with open(cache_path, 'rb') as f:
+                    corp_list = pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            corp_list = None  # 캐시가 없거나 손상되면 새로 받음
+        
+        if corp_list is None:
+            url = f"{self.dart_base_url}/corpCode.xml"
+            params = {'crtfc_key': self.dart_api_key}
+            with self.http.get(url, params=params, timeout=15, stream=True) as response:
+                if response.status_code != 200:
+                    return False
+                # ZIP은 목록(central directory)이 파일 끝에 있어 전체를 받아야 열 수 있음
+                archive = io.BytesIO()
+                for chunk in response.iter_content(chunk_size=1 << 16):
+                    archive.write(chunk)
+            
+            corp_list = []
+            with zipfile.ZipFile(archive) as zip_file, zip_file.open('CORPCODE.xml') as xml_file:
+                # 전체 DOM을 만들지 않고 <list> 단위로 읽고 바로 해제
+                context = ET.iterparse(xml_file, events=('start', 'end'))
+                _, root = next(context)
+                for event, corp in context:
+                    if event != 'end' or corp.tag != 'list':
+                        continue
+                    stock_code = (corp.findtext('stock_code') or "").strip()
+                    corp_list.append({
+                        'corp_name': corp.findtext('corp_name') or "",
+                        'corp_code': corp.findtext('corp_code') or "",
+                        'stock_code': stock_code or 'N/A'
+                    })
+                    root.clear()
+            
+            try:
+                with open(cache_path, 'wb') as f:
+                    pickle.dump(corp_list, f, protocol=pickle.HIGHEST_PROTOCOL)
+            except OSError as e:
+                print(f"⚠️ 회사 목록 캐시 저장 실패: {e}")
+        
+        self._corp_list = corp_list
+        # 동명 회사가 여럿이면 목록상 마지막 항목이 정확 일치로 선택됨 (기존 동작 유지)
+        self._corp_by_name = {info['corp_name']: info for info in corp_list}
+        return True
         
     def _fallback_company_search(self, company_name: str) -> Optional[Dict]:
         """백업 회사 검색"""
-        major_companies = {
-            "삼성전자": {"corp_name": "삼성전자주식회사", "corp_code": "00126380", "stock_code": "005930"},
-            "LG전자": {"corp_name": "엘지전자주식회사", "corp_code": "00401731", "stock_code": "066570"},
-            "현대자동차": {"corp_name": "현대자동차주식회사", "corp_code": "00164779", "stock_code": "005380"},
-            "SK하이닉스": {"corp_name": "에스케이하이닉스주식회사", "corp_code": "00164742", "stock_code": "000660"},
-            "네이버": {"corp_name": "네이버주식회사", "corp_code": "00401517", "stock_code": "035420"},
-            "카카오": {"corp_name": "주식회사카카오", "corp_code": "00401062", "stock_code": "035720"}
-        }
-        
-        if company_name in major_companies:
-            return major_companies[company_name]
+        if company_name in _MAJOR_COMPANIES:
+            return dict(_MAJOR_COMPANIES[company_name])
         
-        candidates = [value for key, value in major_companies.items() if company_name in key or key in company_name]
+        candidates = [dict(value) for key, value in _MAJOR_COMPANIES.items() if company_name in key or key in company_name]
         return {"candidates": candidates, "exact_match": False} if candidates else None
 
     def get_company_industry_code(self, corp_code: str) -> Optional[str]:
@@ -212,23 +645,44 @@ class AdvancedAuditAgent:
         try:
             url = f"{self.dart_base_url}/company.json"
             params = {'crtfc_key': self.dart_api_key, 'corp_code': corp_code}
-            data = requests.get(url, params=params, timeout=10).json()
+            data = _json_loads(self.http.get(url, params=params, timeout=10).content)
             if data.get('status') == '000':
                 return data.get('induty_code')
         except (requests.RequestException, ValueError) as e:
             print(f"⚠️ 업종코드 조회 실패: {e}")
         return None
 
-    def get_industry_comparison(self, corp_code: str, ratios: Dict) -> Optional[Dict]:
+    def get_industry_comparison(self, corp_code: str, ratios: Dict,
+                                induty_code: Optional[str] = None) -> Optional[Dict]:
         """회사 재무비율을 동종업계 벤치마크(한국은행 기업경영분석)와 비교
 
         ECOS 키가 없으면 None. 업종 매핑 불가 시 available=False 딕셔너리 반환.
+        induty_code를 미리 조회해 두었다면 넘겨서 재조회를 생략할 수 있다.
         """
         if not self.ecos_client:
             return None
-        induty_code = self.get_company_industry_code(corp_code)
+        if induty_code is None:
+            induty_code = self.get_company_industry_code(corp_code)
         return self.ecos_client.compare(ratios, induty_code)
 
+    def _prefetch_industry_benchmarks(self, corp_code: str) -> Optional[Future]:
+        """업종코드·업종 벤치마크를 백그라운드에서 미리 조회 (결과: induty_code)
+
+        벤치마크는 비율 계산 결과와 무관하므로 수 분 걸리는 LLM 토론과 겹쳐 받는다.
+        """
+        if not self.ecos_client:
+            return None
+
+        def load() -> Optional[str]:
+            induty_code = self.get_company_industry_code(corp_code)
+            self.ecos_client.prefetch(induty_code)
+            return induty_code
+
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ecos")
+        future = executor.submit(load)
+        executor.shutdown(wait=False)  # 작업 완료 후 스레드 자동 종료
+        return future
+
     @staticmethod
     def _report_year_candidates() -> List[str]:
         """조회를 시도할 사업보고서 연도 목록 (최신순)
@@ -239,58 +693,95 @@ class AdvancedAuditAgent:
         latest = datetime.now().year - 1
         return [str(latest), str(latest - 1)]
 
-    def get_financial_statements(self, corp_code: str, year: Optional[str] = None) -> Dict:
-        """재무제표 조회. year 미지정 시 공시된 최신 연도를 자동 탐색"""
+    def get_financial_statements(self, corp_code: str, year: Optional[str] = None,
+                                 refresh: bool = False) -> Dict:
+        """재무제표 조회. year 미지정 시 공시된 최신 연도를 자동 탐색
+
+        파싱 결과는 디스크에 캐시되며 refresh=True면 캐시를 무시하고 다시 조회한다.
+        """
         if year is None:
             for candidate in self._report_year_candidates():
-                data = self.get_financial_statements(corp_code, candidate)
+                data = self.get_financial_statements(corp_code, candidate, refresh)
                 if data:
                     return data
                 print(f"ℹ️ {candidate}년 사업보고서 미공시 — 직전 연도로 폴백")
             return {}
 
-        print(f"📊 {year}년 재무제표 조회 중...")
-
-        url = f"{self.dart_base_url}/fnlttSinglAcntAll.json"
-
-        # 연결재무제표(CFS) 우선, 없으면 별도재무제표(OFS)로 폴백
-        # (자회사가 없거나 연결 공시가 없는 회사는 OFS만 존재)
-        for fs_div in ('CFS', 'OFS'):
-            params = {
-                'crtfc_key': self.dart_api_key,
-                'corp_code': corp_code,
-                'bsns_year': year,
-                'reprt_code': '11011',
-                'fs_div': fs_div
-            }
+        if not refresh:
+            cached = self._load_dart_cache('fs', corp_code, year)
+            if cached is not None:
+                print(f"📦 {year}년 재무제표 캐시 사용")
+                return cached
 
-            try:
-                response = requests.get(url, params=params, timeout=15)
-                if response.status_code != 200:
-                    continue
-                data = response.json()
-                if data['status'] == '000' and data['list']:
-                    print(f"📋 수집된 재무 항목 수: {len(data['list'])}개 ({fs_div})")
-                    return self.parse_financial_statements(data['list'])
-                print(f"❌ {year}년 {fs_div} 재무데이터 없음: {data.get('message')}")
-            except Exception as e:
-                print(f"❌ 재무제표 조회 오류: {str(e)}")
+        print(f"📊 {year}년 재무제표 조회 중...")
 
-        return {}
+        items = self._fetch_full_report(corp_code, year, refresh)
+        if not items:
+            return {}
+        financial_data = self.parse_financial_statements(items)
+        self._store_dart_cache('fs', corp_code, year, financial_data)
+        return financial_data
 
-    def get_cash_flow_statement(self, corp_code: str, year: Optional[str] = None) -> Dict:
-        """현금흐름표 조회. year 미지정 시 공시된 최신 연도를 자동 탐색"""
+    def get_cash_flow_statement(self, corp_code: str, year: Optional[str] = None,
+                                refresh: bool = False) -> Dict:
+        """현금흐름표 조회. year 미지정 시 공시된 최신 연도를 자동 탐색 (캐시는 재무제표와 동일)"""
         if year is None:
             for candidate in self._report_year_candidates():
-                data = self.get_cash_flow_statement(corp_code, candidate)
+                data = self.get_cash_flow_statement(corp_code, candidate, refresh)
                 if data:
                     return data
             return {}
 
+        if not refresh:
+            cached = self._load_dart_cache('cf', corp_code, year)
+            if cached is not None:
+                print(f"📦 {year}년 현금흐름표 캐시 사용")
+                return cached
+
         print(f"💰 {year}년 현금흐름표 조회 중...")
 
+        items = self._fetch_full_report(corp_code, year, refresh)
+        if not items:
+            return {}
+        cash_flow_data = self.parse_cash_flow_data(items)
+        self._store_dart_cache('cf', corp_code, year, cash_flow_data)
+        return cash_flow_data
+
+    def _fetch_full_report(self, corp_code: str, year: str, refresh: bool = False) -> Optional[List[Dict]]:
+        """사업보고서 전체 재무제표 항목(list) 조회 — 재무제표·현금흐름표가 공유
+
+        두 파서가 같은 DART 응답을 쓰므로 (corp_code, year)당 한 번만 요청한다.
+        동시에 들어온 같은 요청은 먼저 시작한 요청의 결과를 기다려 재사용하고,
+        실패(None)는 다음 호출에서 다시 시도되도록 캐시에 남기지 않는다.
+        """
+        key = (corp_code, year)
+        with self._report_lock:
+            future = None if refresh else self._report_cache.get(key)
+            is_owner = future is None
+            if is_owner:
+                future = self._report_cache[key] = Future()
+                if len(self._report_cache) > REPORT_CACHE_SIZE:
+                    self._report_cache.popitem(last=False)
+            self._report_cache.move_to_end(key)
+
+        if is_owner:
+            items = None
+            try:
+                items = self._request_full_report(corp_code, year)
+            finally:
+                if items is None:
+                    with self._report_lock:
+                        if self._report_cache.get(key) is future:
+                            del self._report_cache[key]
+                future.set_result(items)
+        return future.result()
+
+    def _request_full_report(self, corp_code: str, year: str) -> Optional[List[Dict]]:
+        """DART 단일회사 전체 재무제표 API 요청 (CFS 우선, 없으면 OFS)"""
         url = f"{self.dart_base_url}/fnlttSinglAcntAll.json"
 
+        # 연결재무제표(CFS) 우선, 없으면 별도재무제표(OFS)로 폴백
+        # (자회사가 없거나 연결 공시가 없는 회사는 OFS만 존재)
         for fs_div in ('CFS', 'OFS'):
             params = {
                 'crtfc_key': self.dart_api_key,
@@ -301,16 +792,51 @@ class AdvancedAuditAgent:
             }
 
             try:
-                response = requests.get(url, params=params, timeout=15)
+                response = self.http.get(url, params=params, timeout=15)
                 if response.status_code != 200:
                     continue
-                data = response.json()
+                data = _json_loads(response.content)
                 if data['status'] == '000' and data['list']:
-                    return self.parse_cash_flow_data(data['list'])
+                    print(f"📋 수집된 재무 항목 수: {len(data['list'])}개 ({fs_div})")
+                    return data['list']
+                print(f"❌ {year}년 {fs_div} 재무데이터 없음: {data.get('message')}")
             except Exception as e:
-                print(f"❌ 현금흐름표 조회 오류: {str(e)}")
+                print(f"❌ 재무제표 조회 오류: {str(e)}")
 
-        return {}
+        return None
+
+    def _dart_cache_path(self, kind: str, corp_code: str, year: str) -> str:
+        """DART 조회 결과 캐시 파일 경로 (kind: 'fs' 재무제표, 'cf' 현금흐름표)"""
+        return os.path.join(self.work_directory, "data", "dart_cache", f"{kind}_{corp_code}_{year}.pkl")
+
+    def _load_dart_cache(self, kind: str, corp_code: str, year: str) -> Optional[Dict]:
+        """캐시된 파싱 결과 조회 (없거나 만료되면 None)
+
+        사업보고서는 공시 후 바뀌지 않으므로 지난 연도는 만료 없이 재사용하고,
+        최근 사업연도만 정정공시를 반영하도록 일정 기간 후 다시 조회한다.
+        """
+        path = self._dart_cache_path(kind, corp_code, year)
+        try:
+            if int(year) >= datetime.now().year - 1:
+                if time.time() - os.path.getmtime(path) >= DART_CACHE_RECENT_MAX_AGE:
+                    return None
+            with open(path, 'rb') as f:
+                return pickle.load(f)
+        except (OSError, ValueError, EOFError, pickle.UnpicklingError):
+            return None
+
+    def _store_dart_cache(self, kind: str, corp_code: str, year: str, data: Dict):
+        """파싱 결과를 캐시에 저장 (빈 결과는 이후 공시될 수 있으므로 저장하지 않음)"""
+        if not data:
+            return
+        path = self._dart_cache_path(kind, corp_code, year)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path)  # 동시 조회 중에도 반쯤 쓴 파일을 읽지 않도록
+        except OSError as e:
+            print(f"⚠️ 재무 데이터 캐시 저장 실패: {e}")
 
     def get_multi_year_financials(self, corp_code: str, years: List[str] = None) -> Dict:
         """다년도 재무 데이터 조회. years 미지정 시 최신 공시 연도부터 3개년"""
@@ -320,14 +846,12 @@ class AdvancedAuditAgent:
         
         print(f"📅 {len(years)}년간 재무 데이터 조회 중...")
         
-        multi_year_data = {}
-        for year in years:
-            financial_data = self.get_financial_statements(corp_code, year)
-            if financial_data:
-                multi_year_data[year] = financial_data
-                time.sleep(1)
+        # 연도별 조회는 서로 독립이므로 동시 요청 (상한으로 DART 호출량 제한)
+        with ThreadPoolExecutor(max_workers=min(DART_MAX_CONCURRENCY, len(years) or 1)) as pool:
+            results = list(pool.map(lambda year: self.get_financial_statements(corp_code, year), years))
         
-        return multi_year_data
+        # 결과는 요청한 연도 순서 그대로 유지
+        return {year: data for year, data in zip(years, results) if data}
 
     def parse_financial_statements(self, financial_list: List[Dict]) -> Dict:
         """🔧 개선된 재무제표 데이터 파싱"""
@@ -335,101 +859,47 @@ class AdvancedAuditAgent:
         
         print(f"📋 전체 재무제표 항목 수: {len(financial_list)}개")
         
-        # 🔧 더 포괄적인 계정명 매칭 (카카오 등을 위해)
-        target_accounts = {
-            # 기타 (매출채권 우선)
-            '현금및현금성자산': 'cash_and_equivalents',
-            '매출채권': 'accounts_receivable',
-            '재고자산': 'inventory',
-            '매출총이익': 'gross_profit',
-
-            # 매출 관련 (다양한 표현)
-            '매출액': 'revenue',
-            '수익(매출액)': 'revenue', 
-            '영업수익': 'revenue',
-            '매출': 'revenue',
-            '수익': 'revenue',
-            
-            # 영업이익 관련
-            '영업이익': 'operating_income', 
-            '영업이익(손실)': 'operating_income',
-            '영업손익': 'operating_income',
-            
-            # 순이익 관련 (카카오를 위해 추가)
-            '당기순이익': 'net_income',
-            '당기순이익(손실)': 'net_income',
-            '연결당기순이익': 'net_income',
-            '순이익': 'net_income',
-            '당기순손익': 'net_income',
-            '지배기업소유주지분당기순이익': 'net_income',  # 카카오용
-            '지배기업소유주지분당기순손익': 'net_income',  # 카카오용
-            
-            # 자산 관련
-            '자산총계': 'total_assets',
-            '총자산': 'total_assets',
-            
-            # 부채 관련
-            '부채총계': 'total_liabilities',
-            '총부채': 'total_liabilities',
-            
-            # 자본 관련 (카카오를 위해 추가)
-            '자본총계': 'total_equity',
-            '자기자본': 'total_equity',
-            '연결자본총계': 'total_equity',
-            '총자본': 'total_equity',
-            '지배기업소유주지분': 'total_equity',  # 카카오용
-        }
         
         # 손익계산서와 재무상태표만 필터링
-        relevant_items = []
-        for item in financial_list:
-            sj_nm = item.get('sj_nm', '').strip()
-            if sj_nm in ['손익계산서', '재무상태표', '포괄손익계산서']:
-                relevant_items.append(item)
+        relevant_items = [
+            item for item in financial_list
+            if item.get('sj_nm', '').strip() in _RELEVANT_STATEMENTS
+        ]
         
         print(f"📊 관련 항목 수 (손익계산서/재무상태표): {len(relevant_items)}개")
         
-        found_items = []
+        matched_count = 0
         
         for item in relevant_items:
-            account_nm = item.get('account_nm', '').strip()
-            sj_nm = item.get('sj_nm', '').strip()
-            
-            # 대괄호 및 특수문자 제거
-            account_nm_cleaned = re.sub(r'\[.*?\]', '', account_nm).strip()
-            account_nm_cleaned = re.sub(r'\(.*?\)', '', account_nm_cleaned).strip()
-            
+            # 대상 계정과 무관한 항목(대부분)은 금액 변환 없이 건너뜀
+            candidates = _account_candidates(item.get('account_nm', '').strip())
+            if not candidates:
+                continue
+
             current_amount = item.get('thstrm_amount', '0')
             if isinstance(current_amount, str):
                 current_amount = current_amount.replace(',', '').replace(' ', '')
 
             try:
-                if current_amount and current_amount not in ['0', '', '-', 'nan']:
+                if current_amount and current_amount not in _EMPTY_AMOUNTS:
                     amount = int(float(current_amount))
                 else:
                     amount = 0
             except:
                 amount = 0
 
-            # 🔧 개선된 매칭 로직
-            for target_name, key in target_accounts.items():
-                # 정확한 매칭 우선
-                if account_nm_cleaned == target_name:
-                    if amount != 0:
-                        financial_data[key] = amount
-                        found_items.append(f"[{sj_nm}] {target_name} = {amount:,} (정확매칭)")
-                        print(f"✅ 정확매칭: [{sj_nm}] {account_nm_cleaned} → {target_name} = {amount:,}")
-                        break
-                # 부분 매칭
-                elif target_name in account_nm_cleaned or account_nm_cleaned in target_name:
-                    if key not in financial_data or financial_data[key] == 0:
-                        if amount != 0:
-                            financial_data[key] = amount
-                            found_items.append(f"[{sj_nm}] {target_name} = {amount:,} (부분매칭)")
-                            print(f"✅ 부분매칭: [{sj_nm}] {account_nm_cleaned} → {target_name} = {amount:,}")
-                            break
-        
-        print(f"📊 총 {len(found_items)}개 항목 파싱 완료")
+            # 금액이 0인 항목은 어떤 계정에도 반영되지 않음
+            if amount == 0:
+                continue
+
+            # 🔧 개선된 매칭 로직: 정확매칭은 항상 반영, 부분매칭은 아직 값이 없을 때만
+            for target_name, key, exact in candidates:
+                if exact or not financial_data.get(key):
+                    financial_data[key] = amount
+                    matched_count += 1
+                    break
+        
+        print(f"📊 총 {matched_count}개 항목 파싱 완료")
         
         # 🔧 파싱 결과 상세 출력
         print(f"🔍 파싱된 재무 데이터:")
@@ -454,30 +924,23 @@ class AdvancedAuditAgent:
         """현금흐름표 데이터 파싱"""
         cash_flow_data = {}
         
-        cash_flow_accounts = {
-            '영업활동현금흐름': 'operating_cash_flow',
-            '영업활동으로인한현금흐름': 'operating_cash_flow',
-            '투자활동현금흐름': 'investing_cash_flow',
-            '재무활동현금흐름': 'financing_cash_flow'
-        }
-        
         cf_items = [item for item in financial_list if item.get('sj_nm') == '현금흐름표']
         print(f"💰 현금흐름표 항목 수: {len(cf_items)}개")
         
         for item in cf_items:
             account_nm = item.get('account_nm', '').strip()
-            current_amount = item.get('thstrm_amount', '0').replace(',', '')
+            key = _cash_flow_key(account_nm)
+            if key is None:
+                continue  # 대상이 아닌 계정은 금액 변환도 생략
             
+            current_amount = item.get('thstrm_amount', '0').replace(',', '')
             try:
                 amount = int(current_amount) if current_amount.lstrip('-').isdigit() else 0
             except:
                 amount = 0
             
-            for target_name, key in cash_flow_accounts.items():
-                if target_name in account_nm:
-                    cash_flow_data[key] = amount
-                    print(f"💰 발견: {account_nm} = {amount:,}")
-                    break
+            cash_flow_data[key] = amount
+            print(f"💰 발견: {account_nm} = {amount:,}")
         
         return cash_flow_data
 
@@ -558,7 +1021,18 @@ class AdvancedAuditAgent:
                 company_info = company_info["candidates"][0]
             
             corp_code = company_info.get("corp_code")
-            financial_data = self.get_financial_statements(corp_code)
+            # DART 수집과 독립인 작업을 먼저 시작: 모델 예열(Ollama), 업종 벤치마크(ECOS)
+            self._warm_models()
+            industry_future = self._prefetch_industry_benchmarks(corp_code)
+
+            # 재무제표·현금흐름표·다년도 데이터는 서로 독립이므로 동시에 조회
+            with ThreadPoolExecutor(max_workers=3) as pool:
+                financial_future = pool.submit(self.get_financial_statements, corp_code)
+                cash_flow_future = pool.submit(self.get_cash_flow_statement, corp_code)
+                multi_year_future = pool.submit(self.get_multi_year_financials, corp_code)
+                financial_data = financial_future.result()
+                cash_flow_data = cash_flow_future.result()
+                multi_year_data = multi_year_future.result()
 
             # 재무 데이터가 없으면 0으로 분석을 진행하지 않고 명확히 중단
             # (비상장사 등 이 API로 조회 불가한 회사에서 전항목 0 분석이 나오던 버그 방지)
@@ -566,9 +1040,6 @@ class AdvancedAuditAgent:
                 return {"error": f"'{company_name}'의 재무제표를 DART에서 조회할 수 없습니다. "
                                  f"비상장사이거나 사업보고서 공시 대상이 아닐 수 있습니다."}
 
-            cash_flow_data = self.get_cash_flow_statement(corp_code)
-            multi_year_data = self.get_multi_year_financials(corp_code)
-
             # 3단계: A2A 협업 재무비율 분석 (항상 실행)
             print("🤖 A2A 재무비율 협업 분석...")
             ratios = self.calculate_comprehensive_ratios(financial_data, multi_year_data)
@@ -582,7 +1053,8 @@ class AdvancedAuditAgent:
             final_opinion = self._conduct_final_investment_discussion(ratios, fraud_ratios, company_name)
 
             # 5.5단계: 동종업계 벤치마크 비교 (ECOS 키가 있을 때)
-            industry_comparison = self.get_industry_comparison(corp_code, ratios)
+            induty_code = industry_future.result() if industry_future else None
+            industry_comparison = self.get_industry_comparison(corp_code, ratios, induty_code)
 
             # 6단계: 결과 통합
             analysis_data = {
@@ -634,10 +1106,10 @@ class AdvancedAuditAgent:
         for round_num in range(1, rounds + 1):
             print(f"🗣️ {topic} 토론 라운드 {round_num}/{rounds}")
             snapshot = dict(opinions)  # 이번 라운드에서 전원이 공유하는 동일한 스냅샷
-            updated = {}
+            prompts = {}
             for agent_key in self.agents.keys():
                 other_opinions = [
-                    f"{self.agents[k]['name']}: {v[:600]}"
+                    f"{self.agents[k]['name']}: {self._compress_opinion(v)}"
                     for k, v in snapshot.items() if k != agent_key
                 ]
 
@@ -650,7 +1122,9 @@ class AdvancedAuditAgent:
 
 수정된 등급과 근거를 명확히 제시해주세요.
 """
-                updated[agent_key] = self._call_agent_with_persona(agent_key, discussion_prompt)
+                prompts[agent_key] = discussion_prompt
+            # 같은 스냅샷만 보므로 라운드 내 발언은 서로 독립 → 동시에 요청
+            updated = self._call_agents_parallel(prompts)
             opinions = updated
             samples.extend(updated.values())
         return opinions, samples
@@ -688,10 +1162,8 @@ class AdvancedAuditAgent:
     def _conduct_ratio_discussion(self, ratios: Dict, financial_data: Dict) -> Dict:
         """재무비율 A2A 토론"""
 
-        # 각 AI의 초기 의견 수집
-        opinions = {}
-        for agent_key, agent in self.agents.items():
-            prompt = f"""
+        # 각 AI의 초기 의견 수집 (모든 에이전트에 같은 질문 → 동시에 요청)
+        prompt = f"""
 재무비율 분석 결과를 검토해주세요.
 
 주요 비율:
@@ -703,8 +1175,7 @@ class AdvancedAuditAgent:
 당신의 전문 분야 관점에서 투자 등급과 핵심 근거 3가지 이내를 제시해주세요.
 투자 등급 기준: S(최우수) / A(우수) / B(보통) / C(주의) / D(투자부적격)
 """
-            opinion = self._call_agent_with_persona(agent_key, prompt)
-            opinions[agent_key] = opinion
+        opinions = self._call_agents_parallel({agent_key: prompt for agent_key in self.agents})
 
         # 스냅샷 기반 토론 (2라운드): 전원이 같은 정보를 보고 수정
         opinions, samples = self._run_discussion_rounds(opinions, "재무비율 투자등급", rounds=2)
@@ -726,9 +1197,8 @@ class AdvancedAuditAgent:
     def _conduct_fraud_discussion(self, indicators: Dict, financial_data: Dict) -> Dict:
         """부정위험 A2A 토론"""
         
-        risk_opinions = {}
-        for agent_key, agent in self.agents.items():
-            prompt = f"""
+        # 각 AI의 초기 의견 수집 (동시에 요청)
+        prompt = f"""
 부정위험 지표를 분석해주세요.
 
 주요 지표:
@@ -739,8 +1209,7 @@ class AdvancedAuditAgent:
 부정위험 등급과 핵심 근거 3가지 이내를 제시해주세요.
 부정위험 등급 기준: A(위험 매우 낮음) / B(위험 낮음) / C(위험 높음) / D(위험 매우 높음)
 """
-            opinion = self._call_agent_with_persona(agent_key, prompt)
-            risk_opinions[agent_key] = opinion
+        risk_opinions = self._call_agents_parallel({agent_key: prompt for agent_key in self.agents})
 
         # 기존에는 초기 의견만 모아 바로 합의로 직행했음 → 상호 검토 라운드 1회 추가
         risk_opinions, risk_samples = self._run_discussion_rounds(
@@ -778,10 +1247,7 @@ class AdvancedAuditAgent:
 최종 투자 권고사항과 핵심 근거를 제시해주세요.
 """
         
-        final_opinions = {}
-        for agent_key in self.agents.keys():
-            opinion = self._call_agent_with_persona(agent_key, final_prompt)
-            final_opinions[agent_key] = opinion
+        final_opinions = self._call_agents_parallel({agent_key: final_prompt for agent_key in self.agents})
         
         final_consensus = self._reach_consensus(final_opinions, "최종투자의견")
 
@@ -793,11 +1259,58 @@ class AdvancedAuditAgent:
 
     # === 헬퍼 메서드들 ===
     
+    def _call_agents_parallel(self, prompts: Dict[str, str]) -> Dict[str, str]:
+        """여러 에이전트를 동시에 호출하고 {agent_key: 응답}을 입력 순서대로 반환
+
+        LLM 호출은 네트워크 대기(I/O)이므로 스레드로 겹치면 총 소요 시간이
+        응답 시간의 합이 아니라 가장 느린 응답 수준으로 줄어든다.
+        """
+        if self._llm_parallelism == 1 or len(prompts) <= 1:
+            return {key: self._call_agent_with_persona(key, prompt) for key, prompt in prompts.items()}
+        
+        executor = self._get_llm_executor()
+        futures = {
+            key: executor.submit(self._call_agent_with_persona, key, prompt)
+            for key, prompt in prompts.items()
+        }
+        return {key: future.result() for key, future in futures.items()}
+
+    def _get_llm_executor(self) -> ThreadPoolExecutor:
+        """LLM 호출용 스레드 풀 (첫 사용 시 생성)"""
+        if self._llm_executor is None:
+            self._llm_executor = ThreadPoolExecutor(
+                max_workers=self._llm_parallelism, thread_name_prefix="ollama"
+            )
+        return self._llm_executor
+
+    def _warm_models(self):
+        """에이전트 모델을 백그라운드에서 미리 로드 (DART 수집 시간과 겹치게 함)
+
+        모델을 동시에 올릴 수 있는 병렬 모드에서만 수행한다. 순차 모드(VRAM 부족)에서
+        미리 올리면 서로 밀어내기만 하므로 생략한다.
+        """
+        if self._models_warmed or self._llm_parallelism == 1:
+            return
+        self._models_warmed = True
+        executor = self._get_llm_executor()
+        for model_name in dict.fromkeys(agent["model"] for agent in self.agents.values()):
+            executor.submit(self._preload_model, model_name)
+
+    def _preload_model(self, model_name: str):
+        """프롬프트 없이 모델 로딩만 요청 (실패해도 첫 호출 때 로드되므로 무시)"""
+        payload = {"model": model_name, "keep_alive": self._keep_alive}
+        try:
+            self.http.post(self.ollama_url, data=_json_dumps(payload), headers=_JSON_HEADERS, timeout=180)
+        except requests.RequestException:
+            pass
+
     def _call_agent_with_persona(self, agent_key: str, prompt: str) -> str:
         """페르소나를 적용하여 AI 에이전트 호출"""
         agent = self.agents[agent_key]
         
-        persona_prompt = f"""
+        prefix = self._persona_prefix.get(agent_key)
+        if prefix is None:
+            prefix = self._persona_prefix[agent_key] = f"""
 당신은 {agent['name']}입니다.
 역할: {agent['role']}
 성격: {agent['personality']}
@@ -805,22 +1318,22 @@ class AdvancedAuditAgent:
 다음 요청에 대해 당신의 전문성과 성격에 맞게 간결하게 응답해주세요.
 반드시 한국어로만 답변하세요:
 
-{prompt}
 """
+        persona_prompt = f"{prefix}{prompt}\n"
         
-        # 토론 기록
-        self.discussion_log.append({
+        # 토론 기록 (병렬 호출 시 마지막 항목이 내 기록이 아닐 수 있으므로 참조를 보관)
+        log_entry = {
             "timestamp": datetime.now().strftime("%H:%M:%S"),
             "speaker": agent['name'],
             "prompt": prompt[:100] + "...",
             "response": "응답 대기 중..."
-        })
+        }
+        self.discussion_log.append(log_entry)
         
         response = self.call_ollama(agent_key, persona_prompt)
         
         # 토론 기록 업데이트
-        if self.discussion_log:
-            self.discussion_log[-1]["response"] = response[:200] + "..."
+        log_entry["response"] = response[:200] + "..."
         
         return response
 
@@ -838,7 +1351,7 @@ class AdvancedAuditAgent:
 """
         for agent_key, opinion in opinions.items():
             agent_name = self.agents[agent_key]['name']
-            consensus_prompt += f"\n{agent_name}: {opinion[:600]}\n"
+            consensus_prompt += f"\n{agent_name}: {self._compress_opinion(opinion)}\n"
 
         if distribution:
             consensus_prompt += f"""
@@ -855,6 +1368,24 @@ class AdvancedAuditAgent:
 
         return self.call_ollama("coordinator", consensus_prompt)
 
+    def _compress_opinion(self, text: str, max_chars: int = OPINION_CHAR_BUDGET) -> str:
+        """프롬프트에 넣을 의견 축약
+
+        마크다운 줄바꿈·들여쓰기를 공백 하나로 접고, 길면 단어 경계에서 자른다.
+        잘린 뒷부분에만 등급이 있으면 앞에 등급을 붙여 핵심 판정이 사라지지 않게 한다.
+        """
+        compact = _WHITESPACE_RE.sub(' ', text).strip()
+        if len(compact) <= max_chars:
+            return compact
+
+        cut = compact.rfind(' ', 0, max_chars)
+        kept = compact[:cut if cut > max_chars // 2 else max_chars] + "…"
+        if self._try_extract_grade(kept) is None:
+            grade = self._try_extract_grade(compact)
+            if grade:
+                kept = f"[{grade}등급] {kept}"
+        return kept
+
     def _try_extract_grade(self, text: str) -> Optional[str]:
         """텍스트에서 등급(S/A/B/C/D) 추출 시도. 실패 시 None"""
         # "A등급", "등급 A", "등급: A", "투자등급은 B", "Grade A", "**B**" 등 다양한 표기 대응
@@ -914,9 +1445,6 @@ class AdvancedAuditAgent:
         """기본 재무비율 계산"""
         ratios = {}
         
-        def safe_divide(a, b, default=0):
-            return (a / b) if b != 0 else default
-        
         revenue = financial_data.get('revenue', 0)
         operating_income = financial_data.get('operating_income', 0)
         net_income = financial_data.get('net_income', 0)
@@ -925,14 +1453,14 @@ class AdvancedAuditAgent:
         total_equity = financial_data.get('total_equity', 0)
         
         # 수익성 비율
-        ratios['ROE'] = safe_divide(net_income, total_equity) * 100
-        ratios['ROA'] = safe_divide(net_income, total_assets) * 100
-        ratios['영업이익률'] = safe_divide(operating_income, revenue) * 100
-        ratios['순이익률'] = safe_divide(net_income, revenue) * 100
+        ratios['ROE'] = _safe_divide(net_income, total_equity) * 100
+        ratios['ROA'] = _safe_divide(net_income, total_assets) * 100
+        ratios['영업이익률'] = _safe_divide(operating_income, revenue) * 100
+        ratios['순이익률'] = _safe_divide(net_income, revenue) * 100
         
         # 안정성 비율
-        ratios['부채비율'] = safe_divide(total_liabilities, total_equity) * 100
-        ratios['자기자본비율'] = safe_divide(total_equity, total_assets) * 100
+        ratios['부채비율'] = _safe_divide(total_liabilities, total_equity) * 100
+        ratios['자기자본비율'] = _safe_divide(total_equity, total_assets) * 100
         
         # 성장성 비율 (다년도 데이터에서 직전 연도 대비 — 연도는 동적으로 결정)
         if multi_year_data and len(multi_year_data) >= 2:
@@ -941,8 +1469,8 @@ class AdvancedAuditAgent:
             prev_revenue = prev_data.get('revenue', 0)
             prev_net_income = prev_data.get('net_income', 0)
             
-            ratios['매출성장률'] = safe_divide((revenue - prev_revenue), prev_revenue) * 100
-            ratios['순이익성장률'] = safe_divide((net_income - prev_net_income), prev_net_income) * 100
+            ratios['매출성장률'] = _safe_divide((revenue - prev_revenue), prev_revenue) * 100
+            ratios['순이익성장률'] = _safe_divide((net_income - prev_net_income), prev_net_income) * 100
         
         return ratios
 
@@ -981,23 +1509,7 @@ class AdvancedAuditAgent:
 
     def _extract_company_from_request(self, request: str) -> Optional[str]:
         """요청에서 회사명 추출"""
-        company_patterns = [
-            r'(삼성전자|LG전자|현대자동차|SK하이닉스|네이버|카카오|포스코|KT|LG화학)',
-            r'([가-힣A-Za-z]+(?:전자|자동차|화학|통신|바이오|제약|건설|중공업|생명과학))',
-            r'([가-힣A-Za-z]+(?:회사|기업|그룹|코퍼레이션))'
-        ]
-        
-        for pattern in company_patterns:
-            match = re.search(pattern, request)
-            if match:
-                return match.group(1)
-        
-        words = request.split()
-        for word in words:
-            if len(word) >= 2 and any(char in word for char in '전자자동차화학통신'):
-                return word
-        
-        return None
+        return _extract_company_name(request)
 
     def _generate_a2a_summary(self, analysis_data: Dict) -> str:
         """A2A 협업 분석 요약 생성"""
@@ -1010,132 +1522,212 @@ class AdvancedAuditAgent:
         revenue = analysis_data['financial_data'].get('revenue', 0)
         net_income = analysis_data['financial_data'].get('net_income', 0)
         
-        summary = f"""
-🤖 {company} 완전 A2A 협업 분석 완료!
-
-📊 기본 재무 현황:
-• 매출액: {self.format_currency(revenue)}
-• 순이익: {self.format_currency(net_income)}
-• ROE: {ratios.get('ROE', 0):.1f}%
-
-🏆 AI 협업 최종 결과:
-• 투자 등급: {ratios.get('A2A_투자등급', 'N/A')} (분포: {self._format_distribution(ratios.get('A2A_등급분포', {}))})
-• 부정 위험: {fraud_ratios.get('A2A_부정위험등급', 'N/A')} (분포: {self._format_distribution(fraud_ratios.get('A2A_위험등급분포', {}))})
-• 판정 쏠림 기반 확신도: 투자 {ratios.get('A2A_확신도', 0)}% / 위험 {fraud_ratios.get('A2A_위험확신도', 0)}%
-※ 본 등급은 AI 판단 보조 지표이며, 분포가 분산된 항목일수록 전문가의 직접 검토가 필요합니다.
-
-🗣️ A2A 협업 과정:
-• 총 AI 상호작용: {len(self.discussion_log)}회
-• 참여 전문가: 김성실, 이정확, 박의심
-• 다회차 토론으로 합의 도출
-
-🎯 최종 AI 합의 의견:
-{final_opinion.get('final_consensus', '분석 진행 중...')[:300]}...
-
-💡 A2A 협업의 가치:
-✓ 단일 AI를 넘어선 집단 지성 활용
-✓ 전문가 수준의 다각적 검증
-✓ 투명한 의사결정 과정 공개
-✓ 인간 전문가팀과 동등한 분석 품질
-
-💬 이제 다음과 같은 질문을 해보세요:
-• "AI들이 어떻게 토론했는지 보여줘"
-• "투자 등급을 왜 {ratios.get('A2A_투자등급', 'B')}로 결정했어?"
-• "AI들 사이에 의견 차이가 있었나?"
-• "보고서 만들어줘"
-"""
-        
-        return summary
+        return _A2A_SUMMARY_TEMPLATE.format(
+            company=company,
+            revenue=self.format_currency(revenue),
+            net_income=self.format_currency(net_income),
+            roe=ratios.get('ROE', 0),
+            investment_grade=ratios.get('A2A_투자등급', 'N/A'),
+            investment_distribution=self._format_distribution(ratios.get('A2A_등급분포', {})),
+            risk_grade=fraud_ratios.get('A2A_부정위험등급', 'N/A'),
+            risk_distribution=self._format_distribution(fraud_ratios.get('A2A_위험등급분포', {})),
+            investment_confidence=ratios.get('A2A_확신도', 0),
+            risk_confidence=fraud_ratios.get('A2A_위험확신도', 0),
+            interaction_count=len(self.discussion_log),
+            consensus=final_opinion.get('final_consensus', '분석 진행 중...')[:300],
+            question_grade=ratios.get('A2A_투자등급', 'B'),
+        )
 
     # === 기존 유틸리티 메서드들 유지 ===
     
     def format_currency(self, amount: int) -> str:
         """통화 포맷팅"""
-        if abs(amount) >= 1000000000000:
-            return f"{amount/1000000000000:.1f}조원"
-        elif abs(amount) >= 100000000:
-            return f"{amount/100000000:.0f}억원"
-        elif abs(amount) >= 10000:
-            return f"{amount/10000:.0f}만원"
-        else:
-            return f"{amount:,}원"
+        return _format_currency(amount)
 
     def format_percentage(self, ratio: float, decimal_places: int = 2) -> str:
         """백분율 포맷팅"""
-        return f"{ratio:.{decimal_places}f}%"
+        return _format_percentage(ratio, decimal_places)
 
     def format_ratios_for_display(self, ratios: Dict) -> Dict[str, str]:
         """표시용 비율 포맷팅"""
-        formatted = {}
-        
-        percentage_ratios = ['ROE', 'ROA', '영업이익률', '순이익률', '부채비율', '자기자본비율']
-        
-        for key, value in ratios.items():
-            if key.startswith('A2A_'):  # A2A 결과는 그대로
-                formatted[key] = str(value)
-            elif key in percentage_ratios and isinstance(value, (int, float)):
-                formatted[key] = self.format_percentage(value)
-            elif isinstance(value, bool):
-                formatted[key] = "예" if value else "아니오"
-            elif isinstance(value, (int, float)):
-                formatted[key] = f"{value:.2f}"
+        format_value = self._format_ratio_value
+        return {key: format_value(key, value) for key, value in ratios.items()}
+
+    def _format_ratio_value(self, key: str, value: Any) -> str:
+        """비율 하나를 표시용 문자열로 변환"""
+        if key.startswith('A2A_'):  # A2A 결과는 그대로
+            return str(value)
+        if key in self._PERCENTAGE_RATIOS and isinstance(value, (int, float)):
+            return _format_percentage(value)
+        if isinstance(value, bool):
+            return _YES if value else _NO
+        if isinstance(value, (int, float)):
+            return f"{value:.2f}"
+        return str(value)
+
+    def format_ratios_bulk(self, df: pd.DataFrame,
+                           currency_columns: Tuple[str, ...] = ()) -> pd.DataFrame:
+        """여러 회사의 비율 표를 열 단위로 한 번에 포맷팅 (동종업계 비교표 등)
+
+        각 셀은 format_ratios_for_display와 같은 문자열이 되며, currency_columns에
+        지정한 금액 열은 format_currency 형식(조/억/만 단위)으로 변환한다.
+        형식 판단은 셀마다가 아니라 열 dtype으로 한 번만 하고, 그 밖의(object) 열만
+        값별로 처리한다. (np.char.mod는 tolist() 후 % 포맷보다 느려서 쓰지 않음)
+        """
+        columns = {}
+        
+        for column in df.columns:
+            values = df[column].to_numpy()
+            kind = values.dtype.kind
+            is_a2a = isinstance(column, str) and column.startswith('A2A_')
+            
+            if column in currency_columns and kind in "iuf":
+                columns[column] = _format_currency_array(values)
+            elif is_a2a:
+                columns[column] = list(map(str, values.tolist()))
+            elif kind == "b":
+                columns[column] = [_YES if value else _NO for value in values.tolist()]
+            elif kind in "iuf":
+                fmt = "%.2f%%" if column in self._PERCENTAGE_RATIOS else "%.2f"
+                columns[column] = [fmt % value for value in values.tolist()]
             else:
-                formatted[key] = str(value)
+                format_value = self._format_ratio_value
+                columns[column] = [format_value(column, value) for value in values]
         
-        return formatted
+        # 열을 하나씩 대입하면 매번 블록을 재구성하므로 한 번에 생성
+        return pd.DataFrame(columns, index=df.index, columns=df.columns, dtype=object)
 
     # === 컨텍스트 관리 ===
     
     def save_analysis_context(self, company_name: str, analysis_data: Dict):
-        """분석 컨텍스트 저장"""
-        self.conversation_memory[company_name] = {
-            "timestamp": datetime.now(),
-            "analysis_data": analysis_data,
-            "ratios": analysis_data.get("ratios", {}),
-            "financial_data": analysis_data.get("financial_data", {}),
-            "cash_flow_data": analysis_data.get("cash_flow_data", {}),
-            "a2a_discussion_log": self.discussion_log.copy()
-        }
+        """분석 컨텍스트 저장 (같은 회사를 다시 저장하면 가장 최신 위치로 이동)"""
+        self.conversation_memory.pop(company_name, None)
+        if self._cold_contexts.pop(company_name, None) is not None:
+            del self._context_store[company_name]
+        self.conversation_memory[company_name] = AnalysisContext(
+            timestamp=datetime.now(),
+            saved_at_ns=time.monotonic_ns(),
+            analysis_data=analysis_data,
+            ratios=analysis_data.get("ratios", {}),
+            financial_data=analysis_data.get("financial_data", {}),
+            cash_flow_data=analysis_data.get("cash_flow_data", {}),
+            a2a_discussion_log=self._get_discussion_snapshot()
+        )
+        if len(self.conversation_memory) > CONTEXT_HOT_SIZE:
+            self._spill_oldest_context()
 
-    def get_analysis_context(self, company_name: str) -> Optional[Dict]:
-        """저장된 분석 컨텍스트 조회"""
-        return self.conversation_memory.get(company_name)
+    def _spill_oldest_context(self):
+        """가장 오래된 컨텍스트를 디스크 저장소로 이동 (메모리에서 해제)"""
+        memory = self.conversation_memory
+        company_name, context = memory.popitem(last=False)
+        try:
+            self._get_context_store()[company_name] = context
+        except Exception as e:
+            # 직렬화할 수 없는 값이 있으면 메모리에 그대로 둠 (가장 오래된 위치 유지)
+            print(f"⚠️ 컨텍스트 디스크 이동 실패 ({company_name}): {e}")
+            memory[company_name] = context
+            memory.move_to_end(company_name, last=False)
+            return
+        self._cold_contexts[company_name] = context.saved_at_ns
+
+    def _get_context_store(self) -> shelve.Shelf:
+        """세션 전용 컨텍스트 저장소 (인스턴스별 파일, 종료 시 삭제)"""
+        if self._context_store is None:
+            path = os.path.join(self.work_directory, "data",
+                                f"contexts_{os.getpid()}_{id(self):x}")
+            self._context_store = shelve.open(path, flag="n")
+            self._context_store_finalizer = weakref.finalize(
+                self, _close_context_store, self._context_store, path)
+        return self._context_store
+
+    def _get_discussion_snapshot(self) -> tuple:
+        """토론 기록의 불변 스냅샷
+
+        기록은 뒤에 추가만 되므로(가득 차면 앞에서 밀려남) 길이와 마지막 항목이 같으면
+        내용도 같다. 새 항목이 생겼을 때만 다시 만들고, 그 사이 저장되는 컨텍스트들은
+        같은 튜플을 공유한다.
+        """
+        log = self.discussion_log
+        snapshot = self._discussion_snapshot
+        if len(snapshot) != len(log) or (log and snapshot[-1] is not log[-1]):
+            self._discussion_snapshot = tuple(log)
+        return self._discussion_snapshot
+
+    def get_analysis_context(self, company_name: str) -> Optional[AnalysisContext]:
+        """저장된 분석 컨텍스트 조회 (메모리에 없으면 디스크 저장소에서 읽음)"""
+        context = self.conversation_memory.get(company_name)
+        if context is None and company_name in self._cold_contexts:
+            context = self._context_store[company_name]
+        return context
 
     def clear_old_contexts(self, hours: int = 24):
-        """오래된 컨텍스트 정리"""
-        cutoff_time = datetime.now() - timedelta(hours=hours)
-        
-        to_remove = []
-        for company, context in self.conversation_memory.items():
-            if context["timestamp"] < cutoff_time:
-                to_remove.append(company)
-        
-        for company in to_remove:
-            del self.conversation_memory[company]
-
-    def get_agent_status(self) -> Dict:
-        """에이전트 현재 상태 조회"""
-        return {
-            "current_model": self.current_loaded_model,
-            "active_analyses": len(self.conversation_memory),
-            "total_actions": len(self.agent_log),
-            "discussion_interactions": len(self.discussion_log),
-            "work_directory": self.work_directory,
-            "a2a_mode": "항상 활성화"
-        }
-
-    def get_discussion_summary(self) -> Dict:
-        """A2A 토론 과정 요약"""
-        if not self.discussion_log:
-            return {"message": "아직 토론이 진행되지 않았습니다."}
-        
-        agents_participated = set([log.get("speaker", "") for log in self.discussion_log])
-        
-        return {
-            "total_interactions": len(self.discussion_log),
-            "agents_participated": list(agents_participated),
-            "discussion_start": self.discussion_log[0]["timestamp"] if self.discussion_log else None,
-            "discussion_end": self.discussion_log[-1]["timestamp"] if self.discussion_log else None,
-            "recent_discussions": self.discussion_log[-5:] if len(self.discussion_log) > 5 else self.discussion_log
-        }
+        """오래된 컨텍스트 정리 (저장 순서대로 앞에서부터 만료 항목만 제거)"""
+        # 단조 시계 기준이라 저장 순서와 시각 순서가 항상 일치 → 앞에서부터 끊을 수 있음
+        cutoff_ns = time.monotonic_ns() - int(hours * 3600 * 1_000_000_000)
+        
+        # 디스크로 옮긴 항목도 이동 순서 = 저장 순서이므로 색인 앞에서부터 삭제
+        cold = self._cold_contexts
+        while cold and next(iter(cold.values())) < cutoff_ns:
+            company_name, _ = cold.popitem(last=False)
+            del self._context_store[company_name]
+        
+        memory = self.conversation_memory
+        expired = 0
+        for context in memory.values():
+            if context.saved_at_ns >= cutoff_ns:
+                break
+            expired += 1
+        
+        if expired * 2 > len(memory):
+            # 대부분 만료: 남은 항목만으로 새로 만들면 한 번에 끝나고, 삭제로 비어 있는
+            # 해시 테이블(dict는 삭제 시 줄어들지 않음)도 함께 반환됨
+            self.conversation_memory = OrderedDict(islice(memory.items(), expired, None))
+        else:
+            for _ in range(expired):
+                memory.popitem(last=False)
+
+    def get_agent_status(self) -> Mapping[str, Any]:
+        """에이전트 현재 상태 조회 (읽기 전용, 값이 바뀌었을 때만 다시 생성)"""
+        key = (self.current_loaded_model,
+               len(self.conversation_memory) + len(self._cold_contexts),
+               len(self.agent_log), len(self.discussion_log), self.work_directory)
+        if key != self._status_key:
+            current_model, active_analyses, total_actions, interactions, work_directory = key
+            self._status_view = MappingProxyType({
+                "current_model": current_model,
+                "active_analyses": active_analyses,
+                "total_actions": total_actions,
+                "discussion_interactions": interactions,
+                "work_directory": work_directory,
+                "a2a_mode": "항상 활성화"
+            })
+            self._status_key = key
+        return self._status_view
+
+    def get_discussion_summary(self) -> Mapping[str, Any]:
+        """A2A 토론 과정 요약 (읽기 전용, 새 토론 기록이 생겼을 때만 다시 집계)"""
+        log = self.discussion_log
+        if not log:
+            return _EMPTY_DISCUSSION_SUMMARY
+        
+        # 기록은 추가만 되므로 길이와 마지막 항목이 같으면 요약도 같음
+        cached_key = self._summary_key
+        if cached_key and cached_key[0] == len(log) and cached_key[1] is log[-1]:
+            return self._summary_view
+        
+        # 전체 순회는 참여자 집계 한 번뿐, 처음/끝/최근 5개는 deque 양 끝에서 바로 읽음
+        agents_participated = {entry.get("speaker", "") for entry in log}
+        recent = list(islice(reversed(log), 5))
+        recent.reverse()
+        
+        # 여러 호출자가 공유하므로 목록도 튜플로 고정
+        self._summary_view = MappingProxyType({
+            "total_interactions": len(log),
+            "agents_participated": tuple(agents_participated),
+            "discussion_start": log[0]["timestamp"],
+            "discussion_end": log[-1]["timestamp"],
+            "recent_discussions": tuple(recent)
+        })
+        self._summary_key = (len(log), log[-1])
+        return self._summary_view
     
\ No newline at end of file
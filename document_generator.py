@@ -10,13 +10,41 @@ from docx.enum.text import WD_ALIGN_PARAGRAPH, WD_BREAK
 from docx.enum.table import WD_TABLE_ALIGNMENT
 from docx.enum.section import WD_ORIENT
 from docx.oxml.shared import OxmlElement, qn
+from docx.oxml import parse_xml
+from docx.oxml.ns import nsdecls
+from docx.text.run import Run
+from copy import deepcopy
+from xml.sax.saxutils import escape
 import os
-import pandas as pd
 from datetime import datetime
 from typing import Dict, List, Optional, Any, Tuple
 import io
 import base64
-from visualization_engine import FinancialVisualizationEngine # Added import
+import hashlib
+import numbers
+from bisect import bisect_left, bisect_right
+from concurrent.futures import Future, ProcessPoolExecutor
+import multiprocessing
+import weakref
+# 보고서 차트를 동시에 그릴 프로세스 수 (코어가 1개면 병렬화 이득이 없어 순차 생성)
+CHART_WORKERS = min(3, os.cpu_count() or 1)
+
+_worker_viz_engine = None
+
+
+def _shutdown_chart_executor(executor: ProcessPoolExecutor):
+    """차트 작업 프로세스 종료 (생성기 close·소멸 시 호출, 대기 중인 작업은 취소)"""
+    executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _render_chart(method_name: str, payload: Dict, company_name: str) -> str:
+    """차트 작업 프로세스에서 차트 한 장 생성 (시각화 엔진은 프로세스당 한 번만 생성)"""
+    global _worker_viz_engine
+    if _worker_viz_engine is None:
+        from visualization_engine import FinancialVisualizationEngine
+        _worker_viz_engine = FinancialVisualizationEngine()
+    return getattr(_worker_viz_engine, method_name)(payload, company_name)
+
 
 class ProfessionalReportGenerator:
     """전문 회계 보고서 생성기"""
@@ -25,10 +53,31 @@ class ProfessionalReportGenerator:
         self.save_directory = save_directory
         self.document_templates = self._initialize_templates()
         self.color_scheme = self._initialize_colors()
-        self.viz_engine = FinancialVisualizationEngine() # Added instantiation
+        # 글꼴 속성 조합 → <w:rPr> 템플릿 (run마다 속성을 하나씩 설정하는 대신 복사)
+        self._rpr_templates: Dict[Tuple, Any] = {}
+        self._viz_engine = None  # 차트가 필요할 때 생성 (matplotlib 로딩이 무거움)
+        # 차트 입력 해시 → 생성된 차트 파일 경로 (같은 데이터로 보고서를 다시 만들 때 재사용)
+        self._chart_cache: Dict[str, str] = {}
+        # 차트 입력 해시 → 작업 프로세스에서 그리는 중인 차트
+        self._chart_futures: Dict[str, Future] = {}
+        self._chart_executor = None
+        self._chart_executor_finalizer = None
+        # 기본 서식을 적용한 빈 문서 (보고서마다 기본 템플릿을 다시 파싱하지 않고 복제)
+        self._template_doc = Document()
+        self._setup_document_format(self._template_doc)
         
         # 디렉토리 생성
         os.makedirs(save_directory, exist_ok=True)
+        # 생성한 디렉토리의 절대 경로 (이후 작업 디렉토리가 바뀌어도 같은 곳에 저장)
+        self._save_dir_abs = os.path.abspath(save_directory)
+
+    @property
+    def viz_engine(self):
+        """시각화 엔진 (최초 접근 시 생성 — Excel·요약만 만들 때는 matplotlib을 불러오지 않음)"""
+        if self._viz_engine is None:
+            from visualization_engine import FinancialVisualizationEngine
+            self._viz_engine = FinancialVisualizationEngine()
+        return self._viz_engine
 
     def _initialize_templates(self) -> Dict[str, Dict]:
         """문서 템플릿 초기화"""
@@ -75,20 +124,19 @@ class ProfessionalReportGenerator:
         """종합 보고서 생성 - 메인 함수"""
         
         print(f"📋 {company_name} 종합 보고서 생성 시작...")
+        # 파일명·표지 날짜가 어긋나지 않도록 생성 시각을 한 번만 측정
+        report_time = datetime.now()
         
-        # 새 문서 생성
-        doc = Document()
-        
-        # 문서 기본 설정
-        self._setup_document_format(doc)
+        # 새 문서 생성 (기본 설정이 적용된 템플릿 복제)
+        doc = deepcopy(self._template_doc)
         
         # 분석 기준 연도: 실제 수집된 다년도 데이터의 최신 연도 사용
         multi_year = analysis_data.get("multi_year_data", {}) or {}
-        basis_year = max(multi_year.keys()) if multi_year else str(datetime.now().year - 1)
+        basis_year = max(multi_year.keys()) if multi_year else str(report_time.year - 1)
 
         # 표지 생성
         self._create_cover_page(doc, company_name, "종합 재무 분석 보고서",
-                               "Comprehensive Financial Analysis Report", basis_year)
+                               "Comprehensive Financial Analysis Report", basis_year, report_time)
         
         # 페이지 나누기
         doc.add_page_break()
@@ -97,6 +145,9 @@ class ProfessionalReportGenerator:
         self._create_table_of_contents(doc)
         doc.add_page_break()
         
+        # 차트 3종은 작업 프로세스에서 미리 그려 두고, 섹션 작성 시 결과만 받아 옴
+        self._prefetch_charts(analysis_data, company_name)
+        
         # 본문 섹션들은 페이지를 나누지 않고 자연스럽게 이어지도록 배치
         # (섹션마다 페이지를 강제로 넘겨 짧은 섹션 아래에 빈 공간이 크게 남던 문제 해소)
         # 상세 재무비율은 부록이 아닌 재무현황(2.3)에 배치해 핵심 데이터를 앞에 둠
@@ -106,9 +157,9 @@ class ProfessionalReportGenerator:
         self._create_recommendations_section(doc, analysis_data, company_name)
         
         # 파일 저장
-        filename = f"{company_name}_종합분석보고서_{datetime.now().strftime('%Y%m%d_%H%M%S')}.docx"
-        filepath = os.path.join(self.save_directory, filename)
-        doc.save(filepath)
+        filename = f"{company_name}_종합분석보고서_{report_time.strftime('%Y%m%d_%H%M%S')}.docx"
+        filepath = os.path.join(self._save_dir_abs, filename)
+        self._save_atomically(doc.save, filepath)
         
         print(f"✅ 보고서 생성 완료: {filepath}")
         return filepath
@@ -125,98 +176,140 @@ class ProfessionalReportGenerator:
             section.right_margin = Inches(1)
 
     def _create_cover_page(self, doc: Document, company_name: str,
-                          title: str, subtitle: str, basis_year: str = None):
+                          title: str, subtitle: str, basis_year: str = None,
+                          report_time: datetime = None):
         """표지 페이지 생성"""
+        if report_time is None:
+            report_time = datetime.now()
         if basis_year is None:
-            basis_year = str(datetime.now().year - 1)
+            basis_year = str(report_time.year - 1)
         
         # 로고 공간 (텍스트로 대체)
         logo_para = doc.add_paragraph()
         logo_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-        logo_run = logo_para.add_run("🏛️ PROFESSIONAL AUDIT FIRM")
-        logo_run.font.size = Pt(20)
-        logo_run.font.bold = True
-        logo_run.font.color.rgb = self.color_scheme["primary"]
+        self._styled_run(logo_para, "🏛️ PROFESSIONAL AUDIT FIRM",
+                         size=Pt(20), bold=True, color=self.color_scheme["primary"])
         
         # 공백 (과다한 공백은 표지가 2페이지로 넘치는 원인이 되므로 최소화)
-        for _ in range(2):
-            doc.add_paragraph()
+        self._add_blank_paragraphs(doc, 2)
 
         # 메인 제목
         title_para = doc.add_paragraph()
         title_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-        title_run = title_para.add_run(title)
-        title_run.font.name = 'Malgun Gothic'
-        title_run.font.size = Pt(28)
-        title_run.font.bold = True
-        title_run.font.color.rgb = self.color_scheme["primary"]
+        self._styled_run(title_para, title,
+                         name='Malgun Gothic', size=Pt(28), bold=True,
+                         color=self.color_scheme["primary"])
         
         # 영문 부제목
         subtitle_para = doc.add_paragraph()
         subtitle_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-        subtitle_run = subtitle_para.add_run(subtitle)
-        subtitle_run.font.name = 'Calibri'
-        subtitle_run.font.size = Pt(16)
-        subtitle_run.font.italic = True
-        subtitle_run.font.color.rgb = self.color_scheme["secondary"]
+        self._styled_run(subtitle_para, subtitle,
+                         name='Calibri', size=Pt(16), italic=True,
+                         color=self.color_scheme["secondary"])
         
         # 공백
-        for _ in range(2):
-            doc.add_paragraph()
+        self._add_blank_paragraphs(doc, 2)
         
         # 회사명
         company_para = doc.add_paragraph()
         company_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-        company_run = company_para.add_run(f"분석 대상: {company_name}")
-        company_run.font.name = 'Malgun Gothic'
-        company_run.font.size = Pt(20)
-        company_run.font.bold = True
-        company_run.font.color.rgb = self.color_scheme["accent"]
+        self._styled_run(company_para, f"분석 대상: {company_name}",
+                         name='Malgun Gothic', size=Pt(20), bold=True,
+                         color=self.color_scheme["accent"])
         
         # 공백
-        for _ in range(2):
-            doc.add_paragraph()
+        self._add_blank_paragraphs(doc, 2)
 
         # 보고서 정보 테이블
-        info_table = doc.add_table(rows=4, cols=2)
+        info_table = doc.add_table(rows=0, cols=2)
         info_table.alignment = WD_TABLE_ALIGNMENT.CENTER
         
         # 테이블 내용
         info_data = [
-            ("보고서 생성일", datetime.now().strftime("%Y년 %m월 %d일")),
+            ("보고서 생성일", report_time.strftime("%Y년 %m월 %d일")),
             ("분석 기준", f"{basis_year} 회계연도 사업보고서"),
             ("데이터 출처", "DART 전자공시시스템"),
             ("생성 시스템", "AI 기반 자동 분석 시스템")
         ]
         
-        for i, (label, value) in enumerate(info_data):
-            row = info_table.rows[i]
-            label_cell = row.cells[0]
-            value_cell = row.cells[1]
-            
-            label_cell.text = label
-            value_cell.text = value
-            
-            # 셀 스타일링
-            for cell in [label_cell, value_cell]:
-                para = cell.paragraphs[0]
-                run = para.runs[0] if para.runs else para.add_run()
-                run.font.name = 'Malgun Gothic'
-                run.font.size = Pt(12)
-                if cell == label_cell:
-                    run.font.bold = True
+        label_style = {"name": 'Malgun Gothic', "size": Pt(12), "bold": True}
+        value_style = {"name": 'Malgun Gothic', "size": Pt(12)}
+        self._append_table_rows(info_table, [
+            [(label, label_style), (value, value_style)] for label, value in info_data
+        ])
         
         # 하단 면책조항
-        for _ in range(2):
-            doc.add_paragraph()
+        self._add_blank_paragraphs(doc, 2)
         disclaimer_para = doc.add_paragraph()
         disclaimer_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-        disclaimer_run = disclaimer_para.add_run(
-            "본 보고서는 AI 기반 분석 결과이며, 투자 및 경영 의사결정 시 전문가 검토가 필요합니다."
+        self._styled_run(
+            disclaimer_para,
+            "본 보고서는 AI 기반 분석 결과이며, 투자 및 경영 의사결정 시 전문가 검토가 필요합니다.",
+            name='Malgun Gothic', size=Pt(10), color=self.color_scheme["text_secondary"]
+        )
+
+    def _bulk_append_paragraphs(self, doc: Document, xml_chunks: List[str]):
+        """문단 여러 개를 본문 끝에 한 번에 추가
+
+        xml_chunks의 각 항목은 <w:p> 안에 들어갈 WordprocessingML 문자열(빈 문자열이면
+        빈 문단)이며, 전체를 lxml 서브트리 하나로 한 번만 파싱해 구역 설정(sectPr) 앞에 붙인다.
+        """
+        container = parse_xml(
+            f"<w:body {nsdecls('w')}>"
+            + "".join(f"<w:p>{chunk}</w:p>" for chunk in xml_chunks)
+            + "</w:body>"
         )
-        disclaimer_run.font.name = 'Malgun Gothic'
-        disclaimer_run.font.size = Pt(10)
-        disclaimer_run.font.color.rgb = self.color_scheme["text_secondary"]
+        body = doc.element.body
+        sect_pr = body.sectPr
+        for paragraph in list(container):
+            if sect_pr is not None:
+                sect_pr.addprevious(paragraph)
+            else:
+                body.append(paragraph)
+
+    def _append_table_rows(self, table, rows: List[List[Tuple]], widths: List = None):
+        """표에 행 여러 개를 한 번에 추가
+
+        rows의 각 행은 (텍스트, 글꼴 서식 dict[, 가운데 정렬]) 셀 튜플 목록이다.
+        add_table로 빈 셀을 미리 만든 뒤 다시 비우고 채우는 대신, 행 XML 전체를
+        한 번만 파싱해 붙이고 run마다 서식 템플릿(rPr)만 복사한다.
+        widths를 생략하면 표의 기본 열 너비(tblGrid)를 셀 너비로 사용한다.
+        """
+        tbl = table._tbl
+        if widths is None:
+            widths = [grid_col.w for grid_col in tbl.tblGrid.gridCol_lst]
+        cell_widths = [width.twips for width in widths]
+        
+        row_xml = []
+        styles = []
+        for row in rows:
+            cells_xml = []
+            for width, (text, style, *centered) in zip(cell_widths, row):
+                ppr = '<w:pPr><w:jc w:val="center"/></w:pPr>' if centered and centered[0] else ''
+                if not text:
+                    t = ''
+                elif text.strip() != text:
+                    t = f'<w:t xml:space="preserve">{escape(text)}</w:t>'
+                else:
+                    t = f'<w:t>{escape(text)}</w:t>'
+                cells_xml.append(
+                    f'<w:tc><w:tcPr><w:tcW w:type="dxa" w:w="{width}"/></w:tcPr>'
+                    f'<w:p>{ppr}<w:r>{t}</w:r></w:p></w:tc>'
+                )
+                styles.append(style)
+            row_xml.append(f"<w:tr>{''.join(cells_xml)}</w:tr>")
+        
+        container = parse_xml(f"<w:tbl {nsdecls('w')}>{''.join(row_xml)}</w:tbl>")
+        for r, style in zip(container.iter(qn('w:r')), styles):
+            template = self._run_properties(**style)
+            if len(template):
+                r.insert(0, deepcopy(template))
+        for tr in list(container):
+            tbl.append(tr)
+
+    def _add_blank_paragraphs(self, doc: Document, count: int):
+        """빈 문단(공백 줄) 여러 개 추가"""
+        self._bulk_append_paragraphs(doc, [""] * count)
 
     def _create_table_of_contents(self, doc: Document):
         """목차 생성 (정적 방식)
@@ -228,11 +321,9 @@ class ProfessionalReportGenerator:
         # 목차 제목
         toc_title = doc.add_paragraph()
         toc_title.alignment = WD_ALIGN_PARAGRAPH.CENTER
-        toc_run = toc_title.add_run("목 차")
-        toc_run.font.name = 'Malgun Gothic'
-        toc_run.font.size = Pt(18)
-        toc_run.font.bold = True
-        toc_run.font.color.rgb = self.color_scheme["primary"]
+        self._styled_run(toc_title, "목 차",
+                         name='Malgun Gothic', size=Pt(18), bold=True,
+                         color=self.color_scheme["primary"])
 
         doc.add_paragraph()
 
@@ -248,17 +339,13 @@ class ProfessionalReportGenerator:
             entry.paragraph_format.space_after = Pt(14)
             entry.paragraph_format.left_indent = Inches(1.0)
 
-            run = entry.add_run(korean)
-            run.font.name = 'Malgun Gothic'
-            run.font.size = Pt(14)
-            run.font.bold = True
-            run.font.color.rgb = self.color_scheme["text_primary"]
+            self._styled_run(entry, korean,
+                             name='Malgun Gothic', size=Pt(14), bold=True,
+                             color=self.color_scheme["text_primary"])
 
-            sub_run = entry.add_run(f"  ·  {english}")
-            sub_run.font.name = 'Calibri'
-            sub_run.font.size = Pt(11)
-            sub_run.font.italic = True
-            sub_run.font.color.rgb = self.color_scheme["text_secondary"]
+            self._styled_run(entry, f"  ·  {english}",
+                             name='Calibri', size=Pt(11), italic=True,
+                             color=self.color_scheme["text_secondary"])
 
     def _create_executive_summary_section(self, doc: Document, analysis_data: Dict, company_name: str):
         """경영진 요약 섹션"""
@@ -268,11 +355,9 @@ class ProfessionalReportGenerator:
         
         # 전반적 평가
         overall_para = doc.add_paragraph()
-        overall_run = overall_para.add_run("■ 전반적 평가")
-        overall_run.font.name = 'Malgun Gothic'
-        overall_run.font.size = Pt(14)
-        overall_run.font.bold = True
-        overall_run.font.color.rgb = self.color_scheme["primary"]
+        self._styled_run(overall_para, "■ 전반적 평가",
+                         name='Malgun Gothic', size=Pt(14), bold=True,
+                         color=self.color_scheme["primary"])
         
         # 평가 내용
         ratios = analysis_data.get('ratios', {})
@@ -287,48 +372,29 @@ class ProfessionalReportGenerator:
         net_income = financial_data.get('net_income', 0)
         
         # 종합 등급 계산
-        if roe > 15 and debt_ratio < 100 and fraud_score < 30:
-            grade = "A (우수)"
-            grade_color = self.color_scheme["success"]
-        elif roe > 10 and debt_ratio < 150 and fraud_score < 50:
-            grade = "B (양호)"
-            grade_color = self.color_scheme["warning"]
-        else:
-            grade = "C (개선필요)"
-            grade_color = self.color_scheme["danger"]
+        grade, color_key = self._overall_grade(roe, debt_ratio, fraud_score)
+        grade_color = self.color_scheme[color_key]
         
         grade_para = doc.add_paragraph()
         grade_text = f"{company_name}의 종합 재무 등급: "
-        grade_para.add_run(grade_text).font.name = 'Malgun Gothic'
-        grade_run = grade_para.add_run(grade)
-        grade_run.font.name = 'Malgun Gothic'
-        grade_run.font.bold = True
-        grade_run.font.color.rgb = grade_color
+        self._styled_run(grade_para, grade_text, name='Malgun Gothic')
+        self._styled_run(grade_para, grade, name='Malgun Gothic', bold=True, color=grade_color)
         
         # 핵심 발견사항
         doc.add_paragraph()
         findings_para = doc.add_paragraph()
-        findings_run = findings_para.add_run("■ 핵심 발견사항")
-        findings_run.font.name = 'Malgun Gothic'
-        findings_run.font.size = Pt(14)
-        findings_run.font.bold = True
-        findings_run.font.color.rgb = self.color_scheme["primary"]
+        self._styled_run(findings_para, "■ 핵심 발견사항",
+                         name='Malgun Gothic', size=Pt(14), bold=True,
+                         color=self.color_scheme["primary"])
         
         # 주요 지표 요약 테이블
-        summary_table = doc.add_table(rows=6, cols=3)
+        summary_table = doc.add_table(rows=0, cols=3)
         summary_table.style = 'Table Grid'
         
         # 테이블 헤더
-        header_cells = summary_table.rows[0].cells
+        header_style = {"bold": True, "name": 'Malgun Gothic'}
         headers = ["구분", "수치", "평가"]
-        for i, header in enumerate(headers):
-            cell = header_cells[i]
-            para = cell.paragraphs[0]
-            para.clear()
-            run = para.add_run(header)
-            run.font.bold = True
-            run.font.name = 'Malgun Gothic'
-            para.alignment = WD_ALIGN_PARAGRAPH.CENTER
+        table_rows = [[(header, header_style, True) for header in headers]]
         
         op_margin = ratios.get('영업이익률', 0)
         net_margin = ratios.get('순이익률', 0)
@@ -342,35 +408,25 @@ class ProfessionalReportGenerator:
             ("부정위험점수", f"{fraud_score:.0f}점", "낮음" if fraud_score < 30 else "보통" if fraud_score < 60 else "높음")
         ]
         
-        for i, (metric, value, assessment) in enumerate(table_data, 1):
-            row = summary_table.rows[i]
-            
-            # 각 셀에 데이터 입력
-            for j, text in enumerate([metric, value, assessment]):
-                cell = row.cells[j]
-                para = cell.paragraphs[0]
-                para.clear()
-                run = para.add_run(text)
-                run.font.name = 'Malgun Gothic'
-                run.font.size = Pt(11)
-                
-                if j == 2:  # 평가 컬럼
-                    if "우수" in text or "양호" in text or "낮음" in text:
-                        run.font.color.rgb = self.color_scheme["success"]
-                    elif "위험" in text or "높음" in text:
-                        run.font.color.rgb = self.color_scheme["danger"]
+        cell_style = {"name": 'Malgun Gothic', "size": Pt(11)}
+        for metric, value, assessment in table_data:
+            # 평가 컬럼은 평가 등급별 색상 적용
+            color_key = self._ASSESSMENT_COLOR_KEYS.get(assessment)
+            assessment_style = ({**cell_style, "color": self.color_scheme[color_key]}
+                                if color_key else cell_style)
+            table_rows.append([(metric, cell_style), (value, cell_style), (assessment, assessment_style)])
+        self._append_table_rows(summary_table, table_rows)
 
         # 평가 기준 명시 (지표별 임계값을 보고서에 투명하게 표시)
         criteria_note = doc.add_paragraph()
         criteria_note.paragraph_format.space_before = Pt(8)
-        note_run = criteria_note.add_run(
+        self._styled_run(
+            criteria_note,
             "※ 평가 기준  ·  ROE: 우수>15%, 보통>8%  ·  부채비율: 양호<100%, 보통<200%  ·  "
             "영업이익률: 우수>12%, 보통>5%  ·  순이익률: 우수>10%, 보통>4%  ·  "
-            "부정위험점수: 낮음<30, 보통<60 (100점 만점, 높을수록 위험)"
+            "부정위험점수: 낮음<30, 보통<60 (100점 만점, 높을수록 위험)",
+            name='Malgun Gothic', size=Pt(8), color=self.color_scheme["text_secondary"]
         )
-        note_run.font.name = 'Malgun Gothic'
-        note_run.font.size = Pt(8)
-        note_run.font.color.rgb = self.color_scheme["text_secondary"]
 
     def _create_financial_status_section(self, doc: Document, analysis_data: Dict, company_name: str):
         """재무현황 섹션"""
@@ -385,6 +441,7 @@ class ProfessionalReportGenerator:
         
         revenue = financial_data.get('revenue', 0)
         net_income = financial_data.get('net_income', 0)
+        roe = ratios.get('ROE', 0)
         
         multi_year = analysis_data.get('multi_year_data', {}) or {}
         basis_year = max(multi_year.keys()) if multi_year else str(datetime.now().year - 1)
@@ -393,18 +450,18 @@ class ProfessionalReportGenerator:
 
 • 매출액: {self._format_currency(revenue)}
 • 순이익: {self._format_currency(net_income)}
-• ROE: {ratios.get('ROE', 0):.2f}%
+• ROE: {roe:.2f}%
 • ROA: {ratios.get('ROA', 0):.2f}%
 
 매출 규모와 수익성 지표를 종합적으로 검토한 결과, """
         
-        if ratios.get('ROE', 0) > 12:
+        if roe > 12:
             performance_text += "수익성이 양호한 수준으로 평가됩니다."
         else:
             performance_text += "수익성 개선이 필요한 것으로 분석됩니다."
         
         performance_para = doc.add_paragraph()
-        performance_para.add_run(performance_text).font.name = 'Malgun Gothic'
+        self._styled_run(performance_para, performance_text, name='Malgun Gothic')
         
         # 2.2 재무상태
         self._add_subsection_heading(doc, "2.2 재무상태")
@@ -412,6 +469,7 @@ class ProfessionalReportGenerator:
         total_assets = financial_data.get('total_assets', 0)
         total_liabilities = financial_data.get('total_liabilities', 0)
         total_equity = financial_data.get('total_equity', 0)
+        debt_ratio = ratios.get('부채비율', 0)
         
         position_text = f"""
 재무상태표 분석 결과:
@@ -419,12 +477,11 @@ class ProfessionalReportGenerator:
 • 총자산: {self._format_currency(total_assets)}
 • 부채총계: {self._format_currency(total_liabilities)}
 • 자본총계: {self._format_currency(total_equity)}
-• 부채비율: {ratios.get('부채비율', 0):.1f}%
+• 부채비율: {debt_ratio:.1f}%
 • 자기자본비율: {ratios.get('자기자본비율', 0):.1f}%
 
 재무구조의 건전성을 평가한 결과, """
         
-        debt_ratio = ratios.get('부채비율', 0)
         if debt_ratio < 100:
             position_text += "안정적인 재무구조를 유지하고 있습니다."
         elif debt_ratio < 200:
@@ -433,7 +490,7 @@ class ProfessionalReportGenerator:
             position_text += "재무구조 개선이 필요합니다."
         
         position_para = doc.add_paragraph()
-        position_para.add_run(position_text).font.name = 'Malgun Gothic'
+        self._styled_run(position_para, position_text, name='Malgun Gothic')
 
         # 2.3 상세 재무비율 (핵심 데이터를 부록이 아닌 본문 앞쪽에 배치)
         self._add_subsection_heading(doc, "2.3 상세 재무비율")
@@ -441,7 +498,7 @@ class ProfessionalReportGenerator:
 
         # 2.4 주요 재무비율 시각화
         self._add_subsection_heading(doc, "2.4 주요 재무비율 시각화")
-        chart_path = self.viz_engine.create_ratio_comparison_chart(ratios, company_name)
+        chart_path = self._cached_chart("create_ratio_comparison_chart", ratios, company_name)
         if chart_path:
             self._add_image_to_document(doc, chart_path, "주요 재무비율 비교 차트")
 
@@ -449,64 +506,124 @@ class ProfessionalReportGenerator:
         self._add_subsection_heading(doc, "2.5 다년도 재무 추세")
         multi_year_data = analysis_data.get('multi_year_data', {})
         if multi_year_data:
-            chart_path = self.viz_engine.create_trend_analysis_chart(multi_year_data, company_name)
+            chart_path = self._cached_chart("create_trend_analysis_chart", multi_year_data, company_name)
             if chart_path:
                 self._add_image_to_document(doc, chart_path, "매출 및 순이익 추세 차트")
 
         # 2.6 동종업계 비교 (ECOS 벤치마크가 있을 때)
         self._add_industry_comparison(doc, analysis_data.get('industry_comparison'))
 
+    def _chart_key(self, method_name: str, payload: Dict, company_name: str) -> str:
+        """차트 캐시 키 (차트 종류·회사·입력값의 해시)"""
+        return hashlib.blake2b(
+            repr((method_name, company_name, sorted(payload.items()))).encode('utf-8'),
+            digest_size=16
+        ).hexdigest()
+
+    def _prefetch_charts(self, analysis_data: Dict, company_name: str):
+        """보고서에 들어갈 차트를 작업 프로세스에 미리 맡겨 동시에 생성"""
+        if CHART_WORKERS < 2:
+            return
+        
+        jobs = [("create_ratio_comparison_chart", analysis_data.get('ratios', {}))]
+        multi_year_data = analysis_data.get('multi_year_data', {})
+        if multi_year_data:
+            jobs.append(("create_trend_analysis_chart", multi_year_data))
+        jobs.append(("create_fraud_risk_radar_chart", analysis_data.get('fraud_ratios', {})))
+        
+        try:
+            if self._chart_executor is None:
+                # GUI 스레드와 함께 fork하면 교착될 수 있어 spawn 방식 사용
+                self._chart_executor = ProcessPoolExecutor(
+                    max_workers=CHART_WORKERS, mp_context=multiprocessing.get_context("spawn")
+                )
+                # 작업 프로세스는 다음 보고서를 위해 유지하되, close()나 생성기 소멸 시 종료
+                self._chart_executor_finalizer = weakref.finalize(
+                    self, _shutdown_chart_executor, self._chart_executor)
+            for method_name, payload in jobs:
+                key = self._chart_key(method_name, payload, company_name)
+                chart_path = self._chart_cache.get(key)
+                if key in self._chart_futures or (chart_path and os.path.exists(chart_path)):
+                    continue
+                self._chart_futures[key] = self._chart_executor.submit(
+                    _render_chart, method_name, payload, company_name
+                )
+        except Exception as e:
+            print(f"⚠️ 차트 병렬 생성 불가, 순차 생성으로 진행: {e}")
+
+    def close(self):
+        """차트 작업 프로세스 종료 및 대기 중인 차트 작업 정리 (이후 보고서 생성 시 다시 시작)"""
+        self._chart_futures.clear()
+        if self._chart_executor_finalizer is not None:
+            self._chart_executor_finalizer()
+        self._chart_executor = None
+        self._chart_executor_finalizer = None
+
+    def _cached_chart(self, method_name: str, payload: Dict, company_name: str) -> str:
+        """차트 생성 (같은 차트·회사·입력값이면 이미 그린 파일 경로 재사용)"""
+        key = self._chart_key(method_name, payload, company_name)
+        
+        chart_path = self._chart_cache.get(key)
+        if chart_path and os.path.exists(chart_path):  # 차트 정리로 삭제됐으면 다시 생성
+            return chart_path
+        
+        future = self._chart_futures.pop(key, None)
+        try:
+            chart_path = future.result() if future is not None else None
+        except Exception as e:
+            print(f"⚠️ 작업 프로세스 차트 생성 실패, 직접 생성합니다: {e}")
+            future = None
+        if future is None:
+            chart_path = getattr(self.viz_engine, method_name)(payload, company_name)
+        if chart_path:
+            self._chart_cache[key] = chart_path
+        return chart_path
+
     def _add_industry_comparison(self, doc: Document, comparison):
         """동종업계 비교표 (한국은행 기업경영분석 벤치마크)"""
         self._add_subsection_heading(doc, "2.6 동종업계 비교")
 
         if not comparison:
             note = doc.add_paragraph()
-            note.add_run("업종 벤치마크 데이터를 사용할 수 없습니다 (ECOS 미설정).").font.name = 'Malgun Gothic'
+            self._styled_run(note, "업종 벤치마크 데이터를 사용할 수 없습니다 (ECOS 미설정).", name='Malgun Gothic')
             return
 
         if not comparison.get("available"):
             note = doc.add_paragraph()
-            run = note.add_run(f"동종업계 비교 불가: {comparison.get('reason', '해당 업종 통계 없음')}")
-            run.font.name = 'Malgun Gothic'
+            self._styled_run(note, f"동종업계 비교 불가: {comparison.get('reason', '해당 업종 통계 없음')}",
+                             name='Malgun Gothic')
             return
 
         intro = doc.add_paragraph()
-        intro_run = intro.add_run(
-            f"{comparison['industry']} 업종 평균({comparison['period']} 기준)과 비교한 결과입니다."
+        self._styled_run(
+            intro,
+            f"{comparison['industry']} 업종 평균({comparison['period']} 기준)과 비교한 결과입니다.",
+            name='Malgun Gothic'
         )
-        intro_run.font.name = 'Malgun Gothic'
 
         items = comparison["items"]
-        table = doc.add_table(rows=len(items) + 1, cols=4)
+        table = doc.add_table(rows=0, cols=4)
         table.style = 'Light Grid Accent 1'
-        for j, header in enumerate(["지표", "당사", "업종 평균", "평가"]):
-            cell = table.rows[0].cells[j]
-            cell.paragraphs[0].clear()
-            run = cell.paragraphs[0].add_run(header)
-            run.font.bold = True
-            run.font.name = 'Malgun Gothic'
-            cell.paragraphs[0].alignment = WD_ALIGN_PARAGRAPH.CENTER
-
-        for i, it in enumerate(items, 1):
-            row = table.rows[i]
-            cells_text = [it["metric"], f"{it['company']}%", f"{it['industry']}%", it["verdict"]]
-            for j, text in enumerate(cells_text):
-                cell = row.cells[j]
-                cell.paragraphs[0].clear()
-                run = cell.paragraphs[0].add_run(text)
-                run.font.name = 'Malgun Gothic'
-                run.font.size = Pt(11)
-                if j == 3:
-                    run.font.bold = True
-                    run.font.color.rgb = (self.color_scheme["success"] if text == "우량"
-                                          else self.color_scheme["danger"])
+        header_style = {"bold": True, "name": 'Malgun Gothic'}
+        table_rows = [[(header, header_style, True) for header in ["지표", "당사", "업종 평균", "평가"]]]
+
+        cell_style = {"name": 'Malgun Gothic', "size": Pt(11)}
+        for it in items:
+            verdict_style = {**cell_style, "bold": True,
+                             "color": (self.color_scheme["success"] if it["verdict"] == "우량"
+                                       else self.color_scheme["danger"])}
+            table_rows.append([
+                (it["metric"], cell_style),
+                (f"{it['company']}%", cell_style),
+                (f"{it['industry']}%", cell_style),
+                (it["verdict"], verdict_style),
+            ])
+        self._append_table_rows(table, table_rows)
 
         source_para = doc.add_paragraph()
-        source_run = source_para.add_run(f"※ 출처: {comparison['source']}")
-        source_run.font.name = 'Malgun Gothic'
-        source_run.font.size = Pt(8)
-        source_run.font.color.rgb = self.color_scheme["text_secondary"]
+        self._styled_run(source_para, f"※ 출처: {comparison['source']}",
+                         name='Malgun Gothic', size=Pt(8),
+                         color=self.color_scheme["text_secondary"])
 
     def _create_risk_analysis_section(self, doc: Document, analysis_data: Dict, company_name: str):
         """위험분석 섹션"""
@@ -537,7 +654,7 @@ class ProfessionalReportGenerator:
             risk_text += "높은 위험 (즉시 정밀 검토 필요)"
         
         risk_para = doc.add_paragraph()
-        risk_para.add_run(risk_text).font.name = 'Malgun Gothic'
+        self._styled_run(risk_para, risk_text, name='Malgun Gothic')
 
         # 부정위험 등급 → 감사의견 스타일 참고 라벨
         risk_grade = fraud_ratios.get('A2A_부정위험등급')
@@ -546,46 +663,40 @@ class ProfessionalReportGenerator:
             opinion_hint = AdvancedAuditAgent.audit_opinion_hint(risk_grade)
             audit_para = doc.add_paragraph()
             audit_para.paragraph_format.space_before = Pt(6)
-            label_run = audit_para.add_run(f"재무제표 신뢰성 참고: {opinion_hint}")
-            label_run.font.name = 'Malgun Gothic'
-            label_run.font.bold = True
-            label_run.font.size = Pt(11)
-            note_run = audit_para.add_run(
+            self._styled_run(audit_para, f"재무제표 신뢰성 참고: {opinion_hint}",
+                             name='Malgun Gothic', bold=True, size=Pt(11))
+            self._styled_run(
+                audit_para,
                 "\n※ 실제 감사의견이 아니라 부정위험 지표에 기반한 참고 표현입니다. "
                 "감사의견은 회사의 재무 건전성이 아닌 재무제표의 신뢰성을 판단하는 것으로, "
-                "정식 감사 절차를 통해서만 표명될 수 있습니다."
+                "정식 감사 절차를 통해서만 표명될 수 있습니다.",
+                name='Malgun Gothic', size=Pt(8), color=self.color_scheme["text_secondary"]
             )
-            note_run.font.name = 'Malgun Gothic'
-            note_run.font.size = Pt(8)
-            note_run.font.color.rgb = self.color_scheme["text_secondary"]
 
         # 위험 요소 상세 분석
         if fraud_ratios.get('순이익_양수_현금흐름_음수', False):
             warning_para = doc.add_paragraph()
-            warning_run = warning_para.add_run("⚠️ 주요 위험 신호: 순이익은 양수이나 영업현금흐름이 음수입니다.")
-            warning_run.font.name = 'Malgun Gothic'
-            warning_run.font.color.rgb = self.color_scheme["danger"]
-            warning_run.font.bold = True
+            self._styled_run(warning_para, "⚠️ 주요 위험 신호: 순이익은 양수이나 영업현금흐름이 음수입니다.",
+                             name='Malgun Gothic', color=self.color_scheme["danger"], bold=True)
 
         # 부정 위험 레이더 차트 추가
         self._add_subsection_heading(doc, "3.2 부정 위험 시각화")
 
         # 차트 해석 안내 (5개 축의 의미와 읽는 법을 명시)
         guide = doc.add_paragraph()
-        guide_run = guide.add_run(
+        self._styled_run(
+            guide,
             "아래 레이더 차트의 5개 축은 각각 부정위험 신호를 0~100점으로 나타냅니다"
             "(점수가 높을수록 위험). 도형이 중심에 가까울수록(면적이 작을수록) 안전합니다.\n"
             "· 현금흐름 비율: 순이익 대비 영업현금흐름이 부족한 정도\n"
             "· 매출채권 비율: 매출 대비 매출채권이 과다한 정도 (매출 부풀리기 신호)\n"
             "· 재고 비율: 매출 대비 재고가 과다한 정도\n"
             "· 이익 품질: 순이익은 흑자이나 현금흐름이 적자인지 여부\n"
-            "· 전반적 위험: 위 지표를 종합한 부정위험 점수"
+            "· 전반적 위험: 위 지표를 종합한 부정위험 점수",
+            name='Malgun Gothic', size=Pt(9), color=self.color_scheme["text_secondary"]
         )
-        guide_run.font.name = 'Malgun Gothic'
-        guide_run.font.size = Pt(9)
-        guide_run.font.color.rgb = self.color_scheme["text_secondary"]
 
-        chart_path = self.viz_engine.create_fraud_risk_radar_chart(fraud_ratios, company_name)
+        chart_path = self._cached_chart("create_fraud_risk_radar_chart", fraud_ratios, company_name)
         if chart_path:
             self._add_image_to_document(doc, chart_path, "부정 위험 레이더 차트 (중심에 가까울수록 안전)")
 
@@ -622,7 +733,7 @@ class ProfessionalReportGenerator:
         
         for i, action in enumerate(immediate_actions, 1):
             action_para = doc.add_paragraph()
-            action_para.add_run(f"{i}. {action}").font.name = 'Malgun Gothic'
+            self._styled_run(action_para, f"{i}. {action}", name='Malgun Gothic')
         
         # 4.2 중장기 개선사항
         doc.add_paragraph()
@@ -637,27 +748,56 @@ class ProfessionalReportGenerator:
         
         for i, action in enumerate(longterm_actions, 1):
             action_para = doc.add_paragraph()
-            action_para.add_run(f"{i}. {action}").font.name = 'Malgun Gothic'
+            self._styled_run(action_para, f"{i}. {action}", name='Malgun Gothic')
+
+    def _run_properties(self, name: str = None, size: Pt = None, bold: bool = None,
+                        italic: bool = None, color: RGBColor = None):
+        """글꼴 속성 조합별 <w:rPr> 템플릿 (조합마다 처음 한 번만 python-docx로 생성)"""
+        key = (name, size, bold, italic, color)
+        template = self._rpr_templates.get(key)
+        if template is None:
+            font = Run(OxmlElement('w:r'), None).font
+            if name is not None:
+                font.name = name
+            if size is not None:
+                font.size = size
+            if bold is not None:
+                font.bold = bold
+            if italic is not None:
+                font.italic = italic
+            if color is not None:
+                font.color.rgb = color
+            template = font.element.get_or_add_rPr()
+            self._rpr_templates[key] = template
+        return template
+
+    def _apply_run_style(self, run: Run, **style) -> Run:
+        """run에 글꼴 서식 적용 (템플릿 rPr을 복사해 기존 서식을 대체)"""
+        r = run._r
+        if r.rPr is not None:
+            r.remove(r.rPr)
+        template = self._run_properties(**style)
+        if len(template):
+            r.insert(0, deepcopy(template))
+        return run
+
+    def _styled_run(self, paragraph, text: str, **style) -> Run:
+        """서식이 적용된 run 추가 (name/size/bold/italic/color)"""
+        return self._apply_run_style(paragraph.add_run(text), **style)
 
     def _add_section_heading(self, doc: Document, korean_title: str, english_title: str = ""):
         """섹션 제목 추가 (빈 문단 대신 문단 간격으로 여백 조절)"""
         heading_para = doc.add_paragraph()
         heading_para.paragraph_format.space_before = Pt(18)
         heading_para.paragraph_format.space_after = Pt(4)
-        heading_run = heading_para.add_run(korean_title)
-        heading_run.font.name = 'Malgun Gothic'
-        heading_run.font.size = Pt(16)
-        heading_run.font.bold = True
-        heading_run.font.color.rgb = self.color_scheme["primary"]
+        self._styled_run(heading_para, korean_title,
+                         name='Malgun Gothic', size=Pt(16), bold=True,
+                         color=self.color_scheme["primary"])
 
         if english_title:
-            eng_run = heading_run
-            eng_para = heading_para
-            sub = eng_para.add_run(f"   {english_title}")
-            sub.font.name = 'Calibri'
-            sub.font.size = Pt(11)
-            sub.font.italic = True
-            sub.font.color.rgb = self.color_scheme["secondary"]
+            self._styled_run(heading_para, f"   {english_title}",
+                             name='Calibri', size=Pt(11), italic=True,
+                             color=self.color_scheme["secondary"])
         heading_para.paragraph_format.space_after = Pt(8)
 
     def _add_subsection_heading(self, doc: Document, title: str):
@@ -665,11 +805,32 @@ class ProfessionalReportGenerator:
         heading_para = doc.add_paragraph()
         heading_para.paragraph_format.space_before = Pt(10)
         heading_para.paragraph_format.space_after = Pt(4)
-        heading_run = heading_para.add_run(title)
-        heading_run.font.name = 'Malgun Gothic'
-        heading_run.font.size = Pt(14)
-        heading_run.font.bold = True
-        heading_run.font.color.rgb = self.color_scheme["secondary"]
+        self._styled_run(heading_para, title,
+                         name='Malgun Gothic', size=Pt(14), bold=True,
+                         color=self.color_scheme["secondary"])
+
+    # 종합 등급 구간: 지표별 구간 0=A 수준, 1=B 수준, 2=미달 (구간 최댓값이 등급)
+    # ROE는 경계 초과(> 10, > 15)일 때 상위 구간, 부채비율·부정위험점수는 경계 이상일 때 하위 구간
+    _OVERALL_ROE_BOUNDS = (10, 15)
+    _OVERALL_DEBT_BOUNDS = (100, 150)
+    _OVERALL_FRAUD_BOUNDS = (30, 50)
+    _OVERALL_GRADES = (("A (우수)", "success"), ("B (양호)", "warning"), ("C (개선필요)", "danger"))
+
+    @classmethod
+    def _overall_grade(cls, roe: float, debt_ratio: float, fraud_score: float) -> Tuple[str, str]:
+        """종합 등급과 색상 키 (지표별 구간 중 가장 낮은 구간이 등급을 결정)"""
+        tier = max(
+            len(cls._OVERALL_ROE_BOUNDS) - bisect_left(cls._OVERALL_ROE_BOUNDS, roe),
+            bisect_right(cls._OVERALL_DEBT_BOUNDS, debt_ratio),
+            bisect_right(cls._OVERALL_FRAUD_BOUNDS, fraud_score),
+        )
+        return cls._OVERALL_GRADES[tier]
+
+    # 요약 표 평가 등급 → 색상 키 (color_scheme), 없으면 기본 색
+    _ASSESSMENT_COLOR_KEYS = {
+        "우수": "success", "양호": "success", "낮음": "success",
+        "위험": "danger", "높음": "danger",
+    }
 
     # 표에 표시할 실제 재무비율 (A2A 메타데이터·비수치 값은 제외)
     _RATIO_DISPLAY_ORDER = [
@@ -677,6 +838,12 @@ class ProfessionalReportGenerator:
         "자기자본비율", "총자산회전율", "매출성장률", "순이익성장률",
     ]
 
+    # % 단위로 표시하는 재무비율
+    _PERCENT_RATIOS = frozenset({
+        "ROE", "ROA", "영업이익률", "순이익률", "부채비율",
+        "자기자본비율", "매출성장률", "순이익성장률",
+    })
+
     def _add_ratio_detail_table(self, doc: Document, ratios: Dict):
         """상세 재무비율 표 (지표/수치/설명)
 
@@ -684,39 +851,25 @@ class ProfessionalReportGenerator:
         비율만 정해진 순서로 표시한다. (과거에는 메타데이터가 '수치' 칸에 들어가
         표가 세로로 길어지는 문제가 있었음)
         """
-        items = [(name, ratios[name]) for name in self._RATIO_DISPLAY_ORDER
-                 if isinstance(ratios.get(name), (int, float))]
+        items = [(name, value) for name in self._RATIO_DISPLAY_ORDER
+                 if isinstance(value := ratios.get(name), (int, float))]
         if not items:
             return
 
-        table = doc.add_table(rows=len(items) + 1, cols=3)
+        table = doc.add_table(rows=0, cols=3)
         table.style = 'Light Grid Accent 1'
         # 열 너비: 지표(좁게)·수치(중간)·설명(넓게)
         widths = [Inches(1.4), Inches(1.2), Inches(3.8)]
-        for row in table.rows:
-            for cell, w in zip(row.cells, widths):
-                cell.width = w
-
-        for j, header in enumerate(["재무비율", "수치", "설명"]):
-            cell = table.rows[0].cells[j]
-            cell.paragraphs[0].clear()
-            run = cell.paragraphs[0].add_run(header)
-            run.font.bold = True
-            run.font.name = 'Malgun Gothic'
-            cell.paragraphs[0].alignment = WD_ALIGN_PARAGRAPH.CENTER
-
-        percent_ratios = {"ROE", "ROA", "영업이익률", "순이익률", "부채비율",
-                          "자기자본비율", "매출성장률", "순이익성장률"}
-        for i, (name, value) in enumerate(items, 1):
-            row = table.rows[i]
-            formatted = f"{value:.2f}%" if name in percent_ratios else f"{value:.2f}"
-            for j, text in enumerate([name, formatted, self._get_ratio_description(name, value)]):
-                cell = row.cells[j]
-                cell.width = widths[j]
-                cell.paragraphs[0].clear()
-                run = cell.paragraphs[0].add_run(text)
-                run.font.name = 'Malgun Gothic'
-                run.font.size = Pt(10)
+
+        header_style = {"bold": True, "name": 'Malgun Gothic'}
+        table_rows = [[(header, header_style, True) for header in ["재무비율", "수치", "설명"]]]
+
+        cell_style = {"name": 'Malgun Gothic', "size": Pt(10)}
+        for name, value in items:
+            formatted = f"{value:.2f}%" if name in self._PERCENT_RATIOS else f"{value:.2f}"
+            table_rows.append([(text, cell_style) for text in
+                               (name, formatted, self._get_ratio_description(name, value))])
+        self._append_table_rows(table, table_rows, widths)
 
     def _format_currency(self, amount: int) -> str:
         """통화 포맷팅"""
@@ -729,39 +882,35 @@ class ProfessionalReportGenerator:
         else:
             return f"{amount:,}원"
 
+    _RATIO_DESCRIPTIONS = {
+        "ROE": "자기자본수익률 - 주주가 투자한 자본 대비 수익률",
+        "ROA": "총자산수익률 - 전체 자산 대비 수익률",
+        "영업이익률": "매출 대비 영업이익 비율 - 본업 수익성",
+        "순이익률": "매출 대비 순이익 비율 - 최종 수익성",
+        "부채비율": "자기자본 대비 부채 비율 - 재무 안정성",
+        "자기자본비율": "총자산 대비 자기자본 비율 - 재무 건전성",
+        "유동비율": "유동부채 대비 유동자산 비율 - 단기 지급능력",
+        "총자산회전율": "총자산 대비 매출 효율성",
+        "매출성장률": "전년 대비 매출 증감률",
+        "순이익성장률": "전년 대비 순이익 증감률"
+    }
+
+    # 비율별 평가 구간: (경계값 오름차순, 구간별 평가, 구간 탐색 함수)
+    # ROE는 경계 초과(> 8, > 15)일 때 상위 구간, 부채비율은 경계 이상(>= 100, >= 200)일 때 상위 구간
+    _RATIO_GRADES = {
+        "ROE": ((8, 15), (" (개선필요)", " (양호)", " (우수)"), bisect_left),
+        "부채비율": ((100, 200), (" (안정)", " (보통)", " (위험)"), bisect_right),
+    }
+
     def _get_ratio_description(self, ratio_name: str, ratio_value: Any) -> str:
         """재무비율 설명"""
-        descriptions = {
-            "ROE": "자기자본수익률 - 주주가 투자한 자본 대비 수익률",
-            "ROA": "총자산수익률 - 전체 자산 대비 수익률",
-            "영업이익률": "매출 대비 영업이익 비율 - 본업 수익성",
-            "순이익률": "매출 대비 순이익 비율 - 최종 수익성",
-            "부채비율": "자기자본 대비 부채 비율 - 재무 안정성",
-            "자기자본비율": "총자산 대비 자기자본 비율 - 재무 건전성",
-            "유동비율": "유동부채 대비 유동자산 비율 - 단기 지급능력",
-            "총자산회전율": "총자산 대비 매출 효율성",
-            "매출성장률": "전년 대비 매출 증감률",
-            "순이익성장률": "전년 대비 순이익 증감률"
-        }
-        
-        base_desc = descriptions.get(ratio_name, "재무 지표")
+        base_desc = self._RATIO_DESCRIPTIONS.get(ratio_name, "재무 지표")
         
         # 평가 추가
-        if isinstance(ratio_value, (int, float)):
-            if ratio_name == "ROE":
-                if ratio_value > 15:
-                    base_desc += " (우수)"
-                elif ratio_value > 8:
-                    base_desc += " (양호)"
-                else:
-                    base_desc += " (개선필요)"
-            elif ratio_name == "부채비율":
-                if ratio_value < 100:
-                    base_desc += " (안정)"
-                elif ratio_value < 200:
-                    base_desc += " (보통)"
-                else:
-                    base_desc += " (위험)"
+        grading = self._RATIO_GRADES.get(ratio_name)
+        if grading and isinstance(ratio_value, (int, float)):
+            thresholds, labels, locate = grading
+            base_desc += labels[locate(thresholds, ratio_value)]
         
         return base_desc
 
@@ -772,9 +921,7 @@ class ProfessionalReportGenerator:
                 doc.add_picture(image_path, width=Inches(6))
                 if caption:
                     caption_para = doc.add_paragraph()
-                    caption_run = caption_para.add_run(caption)
-                    caption_run.font.name = 'Malgun Gothic'
-                    caption_run.font.size = Pt(10)
+                    self._styled_run(caption_para, caption, name='Malgun Gothic', size=Pt(10))
                     caption_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
                 doc.add_paragraph()
             except Exception as e:
@@ -783,54 +930,95 @@ class ProfessionalReportGenerator:
             print(f"❌ 이미지 파일을 찾을 수 없습니다: {image_path}")
 
     def create_excel_report(self, analysis_data: Dict, company_name: str) -> str:
-        """Excel 형태의 상세 분석 보고서"""
+        """Excel 형태의 상세 분석 보고서
+
+        시트마다 2열짜리 작은 표라 DataFrame을 거치지 않고 openpyxl로 바로 기록한다.
+        """
         try:
-            import pandas as pd
+            from openpyxl import Workbook
+            from openpyxl.styles import Font
             
-            # Excel writer 생성
-            filename = f"{company_name}_상세분석_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx"
-            filepath = os.path.join(self.save_directory, filename)
+            report_time = datetime.now()
+            filename = f"{company_name}_상세분석_{report_time.strftime('%Y%m%d_%H%M%S')}.xlsx"
+            filepath = os.path.join(self._save_dir_abs, filename)
             
-            with pd.ExcelWriter(filepath, engine='openpyxl') as writer:
-                
-                # 1. 요약 시트
-                summary_data = self._prepare_summary_data(analysis_data, company_name)
-                summary_df = pd.DataFrame(summary_data)
-                summary_df.to_excel(writer, sheet_name='요약', index=False)
-                
-                # 2. 재무데이터 시트
-                financial_data = analysis_data.get('financial_data', {})
-                if financial_data:
-                    fin_df = pd.DataFrame(list(financial_data.items()), 
-                                        columns=['항목', '금액'])
-                    fin_df.to_excel(writer, sheet_name='재무데이터', index=False)
-                
-                # 3. 재무비율 시트
-                ratios = analysis_data.get('ratios', {})
-                if ratios:
-                    ratio_df = pd.DataFrame(list(ratios.items()), 
-                                          columns=['비율명', '수치'])
-                    ratio_df.to_excel(writer, sheet_name='재무비율', index=False)
-                
-                # 4. 부정위험 시트
-                fraud_ratios = analysis_data.get('fraud_ratios', {})
-                if fraud_ratios:
-                    fraud_df = pd.DataFrame(list(fraud_ratios.items()), 
-                                          columns=['위험지표', '값'])
-                    fraud_df.to_excel(writer, sheet_name='부정위험', index=False)
+            workbook = Workbook()
+            header_font = Font(bold=True)
+            
+            def write_sheet(worksheet, headers, rows):
+                worksheet.append(headers)
+                for cell in worksheet[1]:
+                    cell.font = header_font
+                for row in rows:
+                    worksheet.append([self._excel_value(value) for value in row])
+            
+            # 1. 요약 시트 (기본 시트 재사용)
+            summary_sheet = workbook.active
+            summary_sheet.title = '요약'
+            summary_data = self._prepare_summary_data(analysis_data, company_name, report_time)
+            write_sheet(summary_sheet, ['구분', '내용'],
+                        ((row['구분'], row['내용']) for row in summary_data))
+            
+            # 2. 재무데이터 시트
+            financial_data = analysis_data.get('financial_data', {})
+            if financial_data:
+                write_sheet(workbook.create_sheet('재무데이터'), ['항목', '금액'], financial_data.items())
+            
+            # 3. 재무비율 시트
+            ratios = analysis_data.get('ratios', {})
+            if ratios:
+                write_sheet(workbook.create_sheet('재무비율'), ['비율명', '수치'], ratios.items())
+            
+            # 4. 부정위험 시트
+            fraud_ratios = analysis_data.get('fraud_ratios', {})
+            if fraud_ratios:
+                write_sheet(workbook.create_sheet('부정위험'), ['위험지표', '값'], fraud_ratios.items())
+            
+            self._save_atomically(workbook.save, filepath)
             
             print(f"✅ Excel 보고서 생성: {filepath}")
             return filepath
             
         except ImportError:
-            print("❌ pandas가 설치되지 않아 Excel 보고서를 생성할 수 없습니다.")
+            print("❌ openpyxl이 설치되지 않아 Excel 보고서를 생성할 수 없습니다.")
             return ""
         except Exception as e:
             print(f"❌ Excel 보고서 생성 오류: {str(e)}")
             return ""
 
-    def _prepare_summary_data(self, analysis_data: Dict, company_name: str) -> List[Dict]:
+    @staticmethod
+    def _save_atomically(save, filepath: str):
+        """메모리 버퍼에 저장한 뒤 한 번에 기록하고 os.replace로 교체
+
+        python-docx·openpyxl이 파일에 조금씩 나눠 쓰는 대신 한 번에 기록하며,
+        저장 도중 실패해도 반쯤 쓰인 보고서 파일이 남지 않는다.
+        """
+        buffer = io.BytesIO()
+        save(buffer)
+        tmp_path = filepath + ".tmp"
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(buffer.getbuffer())
+            os.replace(tmp_path, filepath)
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    @staticmethod
+    def _excel_value(value: Any) -> Any:
+        """셀에 기록할 값 (숫자·문자·날짜는 그대로, NaN은 빈 칸, 그 밖의 값은 문자열)"""
+        if isinstance(value, float) and value != value:
+            return None
+        if value is None or isinstance(value, (str, numbers.Number, datetime)):
+            return value
+        return str(value)
+
+    def _prepare_summary_data(self, analysis_data: Dict, company_name: str,
+                              report_time: datetime = None) -> List[Dict]:
         """요약 데이터 준비"""
+        if report_time is None:
+            report_time = datetime.now()
         
         ratios = analysis_data.get('ratios', {})
         financial_data = analysis_data.get('financial_data', {})
@@ -838,7 +1026,7 @@ class ProfessionalReportGenerator:
         
         summary_data = [
             {"구분": "회사명", "내용": company_name},
-            {"구분": "분석일", "내용": datetime.now().strftime("%Y-%m-%d")},
+            {"구분": "분석일", "내용": report_time.strftime("%Y-%m-%d")},
             {"구분": "매출액", "내용": self._format_currency(financial_data.get('revenue', 0))},
             {"구분": "순이익", "내용": self._format_currency(financial_data.get('net_income', 0))},
             {"구분": "ROE", "내용": f"{ratios.get('ROE', 0):.2f}%"},
@@ -853,23 +1041,25 @@ class ProfessionalReportGenerator:
         try:
             # 먼저 DOCX 생성
             docx_path = self.generate_comprehensive_report(analysis_data, company_name)
-            
-            # PDF 변환 시도 (python-docx2pdf 사용)
-            try:
-                from docx2pdf import convert
-                pdf_path = docx_path.replace('.docx', '.pdf')
-                convert(docx_path, pdf_path)
-                print(f"✅ PDF 보고서 생성: {pdf_path}")
-                return pdf_path
-            except ImportError:
-                print("⚠️ docx2pdf가 설치되지 않아 PDF 변환을 건너뜁니다.")
-                print(f"✅ DOCX 보고서 생성: {docx_path}")
-                return docx_path
+            return self._convert_docx_to_pdf(docx_path)
             
         except Exception as e:
             print(f"❌ PDF 보고서 생성 오류: {str(e)}")
             return ""
 
+    def _convert_docx_to_pdf(self, docx_path: str) -> str:
+        """이미 생성된 DOCX를 PDF로 변환 (docx2pdf 없으면 DOCX 경로 반환)"""
+        try:
+            from docx2pdf import convert
+            pdf_path = docx_path.replace('.docx', '.pdf')
+            convert(docx_path, pdf_path)
+            print(f"✅ PDF 보고서 생성: {pdf_path}")
+            return pdf_path
+        except ImportError:
+            print("⚠️ docx2pdf가 설치되지 않아 PDF 변환을 건너뜁니다.")
+            print(f"✅ DOCX 보고서 생성: {docx_path}")
+            return docx_path
+
     def generate_all_reports(self, analysis_data: Dict, company_name: str) -> Dict[str, str]:
         """모든 형태의 보고서 생성"""
         
@@ -890,9 +1080,9 @@ class ProfessionalReportGenerator:
             if excel_path:
                 reports['excel'] = excel_path
             
-            # 3. PDF 보고서 시도
+            # 3. PDF 보고서 시도 (1번에서 만든 DOCX를 그대로 변환)
             print("📑 PDF 보고서 생성 시도 중...")
-            pdf_path = self.create_pdf_report(analysis_data, company_name)
+            pdf_path = self._convert_docx_to_pdf(docx_path) if docx_path else ""
             if pdf_path and pdf_path.endswith('.pdf'):
                 reports['pdf'] = pdf_path
             
@@ -146,6 +146,18 @@ class ECOSClient:
         self._save_cache()
         return result
 
+    def prefetch(self, induty_code: Optional[str], size: str = SIZE_ALL):
+        """업종의 모든 지표 벤치마크를 미리 조회해 캐시에 적재
+
+        벤치마크는 회사 비율과 무관하므로 분석(LLM 토론) 중에 미리 받아두면
+        이후 compare()는 캐시만 읽는다.
+        """
+        ecos_industry, _ = ksic_to_ecos_industry(induty_code)
+        if not ecos_industry:
+            return
+        for metric in METRIC_MAP:
+            self.get_benchmark(ecos_industry, metric, size)
+
     def compare(self, company_ratios: Dict, induty_code: Optional[str],
                 size: str = SIZE_ALL) -> Optional[Dict]:
         """회사 비율을 동종업계 벤치마크와 비교
@@ -51,6 +51,9 @@ except:
 
 class ModernAccountingGUI:
     """현대적 회계 AI GUI - 보고서 생성 기능 완전 통합"""
+
+    # 재무비율 패널에서 % 단위로 표시하는 비율
+    _PERCENT_RATIOS = frozenset({'ROE', 'ROA', '영업이익률', '순이익률', '부채비율'})
     
     def __init__(self):
         self.root = ctk.CTk()
@@ -860,7 +863,7 @@ class ModernAccountingGUI:
                     name_label.grid(row=row_idx, column=0, padx=5, pady=2, sticky="ew")
                     
                     # 비율 값
-                    if ratio_name in ['ROE', 'ROA', '영업이익률', '순이익률', '부채비율']:
+                    if ratio_name in self._PERCENT_RATIOS:
                         formatted_value = f"{ratio_value:.2f}%"
                     else:
                         formatted_value = f"{ratio_value:.2f}"
@@ -1243,6 +1246,10 @@ class ModernAccountingGUI:
             if self.agent:
                 print("🧹 시스템 정리 중...")
                 
+            # 차트 작업 프로세스 종료
+            if self.report_generator:
+                self.report_generator.close()
+                
         except Exception as e:
             print(f"정리 작업 오류: {str(e)}")
         
@@ -5,14 +5,29 @@ conversation_handler 질의 분류 단위 테스트
 실사용 중 발견된 버그의 회귀 방지: 입력을 소문자화한 뒤 대문자 키워드("ROE")와
 비교해 재무비율 질문이 일반 질의로 오분류되던 문제 (2026-07 수정).
 """
+import json
 import sys
 import os
+import time
+from collections import deque
+from datetime import timedelta
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 import pytest
 
-from conversation_handler import SmartConversationHandler
+from conversation_handler import ConversationRecord, SmartConversationHandler
+
+
+def _record(i, user_input=None, company="삼성전자", query_type=None):
+    timestamp = float(i)
+    return ConversationRecord(
+        timestamp=timestamp,
+        timestamp_iso=SmartConversationHandler._fmt_ts(timestamp),
+        user_input=str(i) if user_input is None else user_input,
+        company=company,
+        query_type=query_type,
+    )
 
 
 @pytest.fixture
@@ -33,6 +48,14 @@ class TestQueryClassification:
         ("업계 평균이랑 비교해줘", "comparison_query"),
         ("차트로 보여줘", "visualization_query"),
         ("삼성전자 분석해줘", "full_analysis"),
+        # 파일 형식 키워드는 다른 키워드 점수와 무관하게 보고서 요청
+        ("ROE 비율 엑셀로 뽑아줘", "report_query"),
+        ("PDF로 줘", "report_query"),
+        # 형식명이 다른 단어의 일부일 때는 보고서 요청으로 단정하지 않음
+        ("키워드 설명해줘", "explanation_query"),
+        ("excellent 한 ROE 비교해줘", "ratio_query"),
+        # 구두점이 붙어도 동일하게 분류
+        ("ROE?!", "ratio_query"),
     ])
     def test_classification(self, handler, query, expected):
         assert handler._classify_query_type(query) == expected
@@ -40,6 +63,9 @@ class TestQueryClassification:
     def test_unrelated_question_is_general(self, handler):
         assert handler._classify_query_type("오늘 저녁 뭐 먹지") == "general_query"
 
+    def test_every_query_type_has_handler(self, handler):
+        assert set(handler.query_patterns) == set(handler._dispatch)
+
 
 class TestRatioExtraction:
     def test_extracts_requested_ratios(self, handler):
@@ -49,3 +75,203 @@ class TestRatioExtraction:
 
     def test_no_ratio_mentioned(self, handler):
         assert handler._extract_requested_ratios("안녕하세요") == []
+
+
+class TestCompanyExtraction:
+    @pytest.mark.parametrize("query,expected", [
+        ("삼성전자 분석해줘", "삼성전자"),
+        ("한미제약 재무 상태는?", "한미제약"),
+        ("오늘 저녁 뭐 먹지", None),
+    ])
+    def test_extract_company_name(self, handler, query, expected):
+        assert handler._extract_company_name(query) == expected
+
+
+class TestConversationHistory:
+    def test_history_is_bounded(self, handler):
+        for i in range(handler.MAX_HISTORY + 5):
+            handler.conversation_history.append(_record(i))
+        assert len(handler.conversation_history) == handler.MAX_HISTORY
+        # 가장 오래된 항목부터 밀려남
+        assert handler.conversation_history[0].user_input == "5"
+
+    def test_get_history_returns_latest_entries(self, handler):
+        for i in range(5):
+            handler.conversation_history.append(_record(i))
+        recent = handler.get_conversation_history(limit=2)
+        assert [c.user_input for c in recent] == ["3", "4"]
+        assert len(handler.get_conversation_history(limit=0)) == 5
+
+    def test_export_writes_ndjson(self, handler, tmp_path):
+        for i in range(3):
+            handler.conversation_history.append(_record(i, f"질문{i}"))
+        filepath = handler.export_conversation_history_ndjson(str(tmp_path / "history.ndjson"))
+        with open(filepath, encoding="utf-8") as f:
+            lines = [json.loads(line) for line in f]
+        assert lines[0]["conversation_count"] == 3
+        assert [line["user_input"] for line in lines[1:]] == ["질문0", "질문1", "질문2"]
+        assert lines[1]["timestamp"] == 0.0
+
+    def test_export_writes_json_document(self, handler, tmp_path):
+        handler.conversation_history.append(_record(0, "ROE는?", query_type="ratio_query"))
+        filepath = handler.export_conversation_history(str(tmp_path / "history.json"))
+        with open(filepath, encoding="utf-8") as f:
+            exported = json.load(f)
+        assert exported["conversation_count"] == 1
+        assert exported["conversations"] == [
+            {"timestamp": handler._fmt_ts(0.0), "user_input": "ROE는?", "company": "삼성전자"}
+        ]
+
+    def test_export_is_compact_unless_pretty(self, handler, tmp_path):
+        handler.conversation_history.append(_record(0, "ROE는?", query_type="ratio_query"))
+        compact = handler.export_conversation_history(str(tmp_path / "compact.json"))
+        pretty = handler.export_conversation_history(str(tmp_path / "pretty.json"), pretty=True)
+        with open(compact, encoding="utf-8") as f:
+            compact_text = f.read()
+        with open(pretty, encoding="utf-8") as f:
+            pretty_text = f.read()
+        assert "\n" not in compact_text
+        assert "\n" in pretty_text
+        assert json.loads(compact_text)["conversations"] == json.loads(pretty_text)["conversations"]
+
+    def test_zst_export_falls_back_without_zstandard(self, handler, tmp_path, monkeypatch):
+        import conversation_handler
+        monkeypatch.setattr(conversation_handler, "zstandard", None)
+        handler.conversation_history.append(_record(0, "ROE는?"))
+        filepath = handler.export_conversation_history(str(tmp_path / "history.json.zst"))
+        assert filepath == str(tmp_path / "history.json")
+        with open(filepath, encoding="utf-8") as f:
+            assert json.load(f)["conversation_count"] == 1
+
+
+class TestAnalysisContextCache:
+    class _CountingAgent:
+        def __init__(self):
+            self.calls = 0
+
+        def get_analysis_context(self, company_name):
+            self.calls += 1
+            return {"company": company_name}
+
+    def test_context_fetched_once_per_company(self):
+        agent = self._CountingAgent()
+        handler = SmartConversationHandler(agent)
+        handler.current_company = "삼성전자"
+        handler._get_context()
+        handler._get_context()
+        assert agent.calls == 1
+
+        handler.current_company = "LG전자"
+        assert handler._get_context() == {"company": "LG전자"}
+        assert agent.calls == 2
+
+
+class TestCurrencyFormatting:
+    def test_summary_keeps_int_and_float_amounts_distinct(self):
+        import numpy as np
+        from core_agent_engine import AdvancedAuditAgent
+
+        handler = SmartConversationHandler(AdvancedAuditAgent(dart_api_key="test-key-not-used"))
+        as_int = handler._generate_analysis_summary(
+            {"company": "A", "financial_data": {"revenue": np.int64(5)}})
+        as_float = handler._generate_analysis_summary(
+            {"company": "B", "financial_data": {"revenue": np.float64(5.0)}})
+        # 엔진 캐시는 typed=True — 핸들러 쪽에서 5와 5.0을 같은 항목으로 합치면 안 됨
+        assert "매출액: 5원" in as_int
+        assert "매출액: 5.0원" in as_float
+
+
+class TestIndustryComparison:
+    def test_only_numeric_industry_ratios_are_compared(self, handler):
+        handler.current_company = "삼성전자"
+        result = handler._generate_industry_comparison(
+            {"ratios": {"ROE": 15, "부채비율": 50.0, "ROA": "N/A", "기타": 3}}
+        )
+        comparison = result["comparison_results"]
+        assert set(comparison) == {"ROE", "부채비율"}
+        assert comparison["ROE"]["difference"] == pytest.approx(2.5)
+        assert comparison["ROE"]["status"] == "우수"
+        assert comparison["부채비율"]["status"] == "열세"
+
+
+class TestSharedPatternTables:
+    def test_instances_share_pattern_tables(self):
+        first = SmartConversationHandler(None)
+        second = SmartConversationHandler(None)
+        assert first.query_patterns is second.query_patterns
+        assert first.context_keywords is second.context_keywords
+        with pytest.raises(TypeError):
+            first.query_patterns["new_type"] = ("키워드",)
+
+
+class TestFraudRiskLevel:
+    @pytest.mark.parametrize("score,expected", [
+        (0, "MINIMAL"), (19.9, "MINIMAL"), (20, "LOW"), (39, "LOW"),
+        (40, "MEDIUM"), (69.5, "MEDIUM"), (70, "HIGH"), (100, "HIGH"),
+    ])
+    def test_threshold_boundaries(self, handler, score, expected):
+        assert handler._determine_fraud_risk_level({"종합_부정위험점수": score}) == expected
+
+
+class TestConversationSummary:
+    def _entry(self, i, company, query_type):
+        return _record(i, f"질문{i}", company, query_type)
+
+    def test_summary_uses_running_counts(self, handler):
+        handler._record_conversation(self._entry(0, "삼성전자", "ratio_query"))
+        handler._record_conversation(self._entry(60, "삼성전자", "ratio_query"))
+        handler._record_conversation(self._entry(120, None, "fraud_query"))
+        summary = handler.get_conversation_summary()
+        assert summary["query_type_stats"] == {"ratio_query": 2, "fraud_query": 1}
+        assert summary["companies_discussed"] == ["삼성전자"]
+        assert summary["session_duration"] == pytest.approx(2.0)
+
+    def test_evicted_entries_leave_the_counts(self, handler):
+        handler.conversation_history = deque(maxlen=2)
+        handler._record_conversation(self._entry(0, "삼성전자", "ratio_query"))
+        handler._record_conversation(self._entry(1, "LG전자", "fraud_query"))
+        handler._record_conversation(self._entry(2, "LG전자", "fraud_query"))
+        summary = handler.get_conversation_summary()
+        assert summary["query_type_stats"] == {"fraud_query": 2}
+        assert summary["companies_discussed"] == ["LG전자"]
+
+    def test_empty_summary_is_a_fresh_copy(self, handler):
+        summary = handler.get_conversation_summary()
+        assert summary == {"total_conversations": 0, "current_company": None, "most_recent": None}
+        summary["total_conversations"] = 99
+        assert handler.get_conversation_summary()["total_conversations"] == 0
+
+    def test_running_counts_match_full_recompute(self, handler):
+        handler.conversation_history = deque(maxlen=3)
+        for i, (company, query_type) in enumerate([
+            ("삼성전자", "ratio_query"), (None, "fraud_query"), ("LG전자", "ratio_query"),
+            ("LG전자", "report_query"), ("삼성전자", "fraud_query"),
+        ]):
+            handler._record_conversation(self._entry(i, company, query_type))
+        incremental = handler.get_conversation_summary()
+        handler._recompute_summary_state()
+        assert handler.get_conversation_summary() == incremental
+
+    def test_compact_history_keeps_summary(self, handler):
+        now = time.time()
+        for offset, company, query_type in [
+            (-7200, "삼성전자", "ratio_query"), (-3700, None, "fraud_query"),
+            (-3650, "LG전자", "ratio_query"), (-10, "LG전자", "report_query"),
+        ]:
+            record = _record(0, "질문", company, query_type)
+            record.timestamp = now + offset
+            handler._record_conversation(record)
+        before = handler.get_conversation_summary()
+
+        assert handler.compact_history(older_than=timedelta(hours=1)) == 3
+        assert len(handler.conversation_history) == 2
+        assert handler.conversation_history[0].query_type == "digest"
+        after = handler.get_conversation_summary()
+        assert after["query_type_stats"] == before["query_type_stats"]
+        assert after["total_conversations"] == 4
+        assert after["session_duration"] == pytest.approx(before["session_duration"])
+
+        # 요약 레코드도 다시 압축되며 통계는 재계산 결과와 일치
+        assert handler.compact_history(older_than=timedelta(0)) == 4
+        handler._recompute_summary_state()
+        assert handler.get_conversation_summary()["query_type_stats"] == before["query_type_stats"]
@@ -8,6 +8,9 @@ core_agent_engine의 순수 로직 단위 테스트 (LLM/네트워크 불필요)
 """
 import sys
 import os
+import io
+import json
+import time
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
@@ -105,6 +108,25 @@ class TestGradeExtraction:
         assert agent._extract_grade_from_consensus("판단 불가") == "B"
 
 
+class TestOpinionCompression:
+    """프롬프트용 의견 축약 — 공백 정리, 단어 경계 절단, 잘린 등급 보존"""
+
+    def test_short_opinion_only_collapses_whitespace(self, agent):
+        assert agent._compress_opinion("## 의견\n\n- A등급\n  - 근거") == "## 의견 - A등급 - 근거"
+
+    def test_long_opinion_cut_at_word_boundary(self, agent):
+        text = "A등급 " + "근거문장 " * 200
+        compressed = agent._compress_opinion(text, max_chars=100)
+        assert len(compressed) <= 101
+        assert compressed.endswith("근거문장…")
+
+    def test_grade_past_cut_is_kept(self, agent):
+        text = "분석 " * 100 + "최종 투자등급은 C등급입니다."
+        compressed = agent._compress_opinion(text, max_chars=100)
+        assert compressed.startswith("[C등급] ")
+        assert agent._try_extract_grade(compressed) == "C"
+
+
 class TestAuditOpinionHint:
     """부정위험 등급 → 감사의견 스타일 참고 라벨 매핑"""
 
@@ -141,3 +163,475 @@ class TestGradeDistribution:
     def test_format_distribution_sorted_by_votes(self, agent):
         text = agent._format_distribution({"C": 1, "B": 6, "A": 2})
         assert text == "B 6표 · A 2표 · C 1표"
+
+
+class TestParallelAgentCalls:
+    """에이전트 동시 호출 — 응답이 키별로 정확히 매칭되고 토론 기록이 섞이지 않는지"""
+
+    def test_responses_match_agents_regardless_of_finish_order(self, agent):
+        delays = {"coordinator": 0.03, "financial_analyst": 0.0, "fraud_detective": 0.015}
+
+        def fake_call_ollama(model_key, prompt):
+            time.sleep(delays[model_key])
+            return f"{model_key} 의견"
+
+        agent.call_ollama = fake_call_ollama
+        results = agent._call_agents_parallel({key: "질문" for key in agent.agents})
+
+        assert list(results) == list(agent.agents)
+        assert all(results[key] == f"{key} 의견" for key in agent.agents)
+        # 각 토론 기록은 자신의 응답으로 갱신됨 (먼저 끝난 호출이 남의 기록을 덮어쓰지 않음)
+        speakers = {agent.agents[key]["name"]: key for key in agent.agents}
+        for entry in agent.discussion_log:
+            assert entry["response"].startswith(f"{speakers[entry['speaker']]} 의견")
+
+
+class TestMultiYearFetch:
+    """다년도 동시 조회 — 완료 순서와 무관하게 요청 연도 순서 유지, 미공시 연도 제외"""
+
+    def test_keeps_year_order_and_skips_missing(self, agent):
+        delays = {"2024": 0.03, "2023": 0.0, "2022": 0.015}
+
+        def fake_statements(corp_code, year=None):
+            time.sleep(delays[year])
+            return {} if year == "2023" else {"매출액": int(year)}
+
+        agent.get_financial_statements = fake_statements
+        data = agent.get_multi_year_financials("00126380", ["2024", "2023", "2022"])
+
+        assert list(data) == ["2024", "2022"]
+        assert data["2022"] == {"매출액": 2022}
+
+
+class TestCorpIndexCache:
+    """회사 목록 캐시 — 디스크 캐시가 신선하면 다운로드 없이 검색"""
+
+    CORPS = [
+        {"corp_name": "삼성전자", "corp_code": "00126380", "stock_code": "005930"},
+        {"corp_name": "삼성전자서비스", "corp_code": "00258999", "stock_code": "N/A"},
+        {"corp_name": "카카오", "corp_code": "00258801", "stock_code": "035720"},
+    ]
+
+    @pytest.fixture
+    def cached_agent(self, agent, tmp_path, monkeypatch):
+        import pickle
+
+        agent.work_directory = str(tmp_path)
+        (tmp_path / "data").mkdir()
+        with open(tmp_path / "data" / "corp_index.pkl", "wb") as f:
+            pickle.dump(self.CORPS, f)
+
+        def no_network(*args, **kwargs):
+            raise AssertionError("캐시가 있으면 다운로드하지 않아야 함")
+
+        monkeypatch.setattr(agent.http, "get", no_network)
+        return agent
+
+    def test_exact_match_from_disk_cache(self, cached_agent):
+        assert cached_agent.search_company_dart("삼성전자")["corp_code"] == "00126380"
+
+    def test_substring_candidates_keep_list_order(self, cached_agent):
+        result = cached_agent.search_company_dart("삼성")
+        assert result["exact_match"] is False
+        assert [c["corp_name"] for c in result["candidates"]] == ["삼성전자", "삼성전자서비스"]
+
+    def test_no_match_returns_none(self, cached_agent):
+        assert cached_agent.search_company_dart("없는회사") is None
+
+    def test_download_parses_zip_and_writes_cache(self, agent, tmp_path, monkeypatch):
+        import zipfile
+
+        xml = (
+            "<?xml version='1.0' encoding='UTF-8'?><result>"
+            "<list><corp_code>00126380</corp_code><corp_name>삼성전자</corp_name>"
+            "<stock_code>005930</stock_code></list>"
+            "<list><corp_code>00999999</corp_code><corp_name>비상장회사</corp_name>"
+            "<stock_code> </stock_code></list></result>"
+        ).encode("utf-8")
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, "w") as zf:
+            zf.writestr("CORPCODE.xml", xml)
+        payload = buffer.getvalue()
+
+        class FakeResponse:
+            status_code = 200
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc):
+                return False
+
+            def iter_content(self, chunk_size):
+                for i in range(0, len(payload), chunk_size):
+                    yield payload[i:i + chunk_size]
+
+        agent.work_directory = str(tmp_path)
+        (tmp_path / "data").mkdir()
+        monkeypatch.setattr(agent.http, "get", lambda *a, **kw: FakeResponse())
+
+        assert agent.search_company_dart("비상장회사")["stock_code"] == "N/A"
+        assert (tmp_path / "data" / "corp_index.pkl").exists()
+
+
+class TestStatementParsing:
+    """계정 매칭 — 정확매칭은 덮어쓰고 부분매칭은 빈 값만 채움"""
+
+    def test_exact_overrides_and_partial_fills(self, agent):
+        rows = [
+            {"sj_nm": "손익계산서", "account_nm": "지배기업소유주지분당기순이익", "thstrm_amount": "700"},
+            {"sj_nm": "손익계산서", "account_nm": "[연결]당기순이익(손실)", "thstrm_amount": "1,000"},
+            {"sj_nm": "손익계산서", "account_nm": "영업수익", "thstrm_amount": "5,000"},
+            {"sj_nm": "손익계산서", "account_nm": "기타수익", "thstrm_amount": "10"},
+            {"sj_nm": "현금흐름표", "account_nm": "자산총계", "thstrm_amount": "999"},
+            {"sj_nm": "재무상태표", "account_nm": "자산총계", "thstrm_amount": "-"},
+        ]
+        data = agent.parse_financial_statements(rows)
+        assert data == {"net_income": 1000, "revenue": 5000}
+
+    def test_cash_flow_first_matching_account_wins(self, agent):
+        rows = [
+            {"sj_nm": "현금흐름표", "account_nm": "영업활동으로인한현금흐름", "thstrm_amount": "1,200"},
+            {"sj_nm": "현금흐름표", "account_nm": "투자활동현금흐름", "thstrm_amount": "-300"},
+            {"sj_nm": "현금흐름표", "account_nm": "현금의증가", "thstrm_amount": "900"},
+            {"sj_nm": "손익계산서", "account_nm": "재무활동현금흐름", "thstrm_amount": "50"},
+        ]
+        data = agent.parse_cash_flow_data(rows)
+        assert data == {"operating_cash_flow": 1200, "investing_cash_flow": -300}
+
+
+class TestResponseCache:
+    """LLM 응답 캐시 — 활성화 시 같은 (모델, 프롬프트)는 한 번만 요청, 오류는 저장 안 함"""
+
+    @pytest.fixture
+    def cached_agent(self, monkeypatch):
+        monkeypatch.setenv("OLLAMA_RESPONSE_CACHE", "1")
+        agent = AdvancedAuditAgent(dart_api_key="test-key-not-used")
+        agent._response_disk_cache = None  # 메모리 캐시만 검증
+        return agent
+
+    @staticmethod
+    def _fake_post(calls, status_codes):
+        class FakeResponse:
+            def __init__(self, status_code):
+                self.status_code = status_code
+
+            @property
+            def content(self):
+                return json.dumps({"response": f"응답{len(calls)}"}).encode("utf-8")
+
+        def post(url, data, headers, timeout):
+            calls.append(json.loads(data)["model"])
+            return FakeResponse(status_codes.pop(0))
+
+        return post
+
+    def test_repeat_prompt_hits_cache(self, cached_agent):
+        calls = []
+        cached_agent.http.post = self._fake_post(calls, [200, 200])
+
+        first = cached_agent.call_ollama("coordinator", "질문")
+        assert cached_agent.call_ollama("coordinator", "질문") == first
+        assert len(calls) == 1
+        # 다른 모델은 별도 키
+        cached_agent.call_ollama("fraud_detective", "질문")
+        assert len(calls) == 2
+
+    def test_error_response_not_cached(self, cached_agent):
+        calls = []
+        cached_agent.http.post = self._fake_post(calls, [500, 200])
+
+        assert cached_agent.call_ollama("coordinator", "질문") == "API 오류 500"
+        assert cached_agent.call_ollama("coordinator", "질문") == "응답2"
+        assert len(calls) == 2
+
+    def test_disabled_by_default(self, agent):
+        calls = []
+        agent.http.post = self._fake_post(calls, [200, 200])
+
+        agent.call_ollama("coordinator", "질문")
+        agent.call_ollama("coordinator", "질문")
+        assert len(calls) == 2
+
+
+class TestCompanyFromRequest:
+    """요청문 회사명 추출 — 주요 회사 우선, 업종 접미사, 업종 글자 단어 순"""
+
+    @pytest.mark.parametrize("request_text,expected", [
+        ("카카오 재무분석 해줘", "카카오"),
+        ("LG화학 부정위험", "LG화학"),
+        ("한화생명과학 분석", "한화생명과학"),
+        ("알파코퍼레이션 결산", "알파코퍼레이션"),
+        ("오늘 화 분석 동차", "동차"),
+        ("그냥 인사", None),
+    ])
+    def test_extraction_order(self, agent, request_text, expected):
+        assert agent._extract_company_from_request(request_text) == expected
+
+
+class TestDartFetchCache:
+    """재무제표 디스크 캐시 — 재조회 생략, refresh 시 재요청, 최근 연도만 만료"""
+
+    ROWS = [{"sj_nm": "손익계산서", "account_nm": "매출액", "thstrm_amount": "1,000"}]
+
+    @pytest.fixture
+    def counted_agent(self, agent, tmp_path):
+        agent.work_directory = str(tmp_path)
+        (tmp_path / "data" / "dart_cache").mkdir(parents=True)
+        agent.calls = []
+
+        class FakeResponse:
+            status_code = 200
+            content = json.dumps({"status": "000", "list": self.ROWS}).encode("utf-8")
+
+        def fake_get(url, params, timeout):
+            agent.calls.append((params["bsns_year"], params["fs_div"]))
+            return FakeResponse()
+
+        agent.http.get = fake_get
+        return agent
+
+    def test_second_fetch_uses_cache(self, counted_agent):
+        first = counted_agent.get_financial_statements("00126380", "2020")
+        assert counted_agent.get_financial_statements("00126380", "2020") == first == {"revenue": 1000}
+        assert len(counted_agent.calls) == 1
+
+        counted_agent.get_financial_statements("00126380", "2020", refresh=True)
+        assert len(counted_agent.calls) == 2
+
+    def test_recent_year_cache_expires(self, counted_agent):
+        recent = str(time.localtime().tm_year - 1)
+        counted_agent.get_financial_statements("00126380", recent)
+        path = counted_agent._dart_cache_path("fs", "00126380", recent)
+        stale = time.time() - 8 * 24 * 60 * 60
+        os.utime(path, (stale, stale))
+        counted_agent._report_cache.clear()  # 새 실행 가정
+
+        counted_agent.get_financial_statements("00126380", recent)
+        assert len(counted_agent.calls) == 2
+
+    def test_empty_result_not_cached(self, counted_agent):
+        # 현금흐름 항목이 없으면 빈 결과를 반환하되 디스크 캐시에는 남기지 않음
+        assert counted_agent.get_cash_flow_statement("00126380", "2020") == {}
+        assert not os.path.exists(counted_agent._dart_cache_path("cf", "00126380", "2020"))
+
+    def test_statement_and_cash_flow_share_one_request(self, counted_agent):
+        counted_agent.get_financial_statements("00126380", "2020")
+        counted_agent.get_cash_flow_statement("00126380", "2020")
+        assert counted_agent.calls == [("2020", "CFS")]
+
+    def test_concurrent_fetches_are_deduplicated(self, counted_agent):
+        from concurrent.futures import ThreadPoolExecutor
+
+        original_get = counted_agent.http.get
+
+        def slow_get(url, params, timeout):
+            time.sleep(0.02)
+            return original_get(url, params, timeout)
+
+        counted_agent.http.get = slow_get
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            fs = pool.submit(counted_agent.get_financial_statements, "00126380", "2020")
+            cf = pool.submit(counted_agent.get_cash_flow_statement, "00126380", "2020")
+            assert fs.result() == {"revenue": 1000} and cf.result() == {}
+        assert len(counted_agent.calls) == 1
+
+
+class TestModelWarmup:
+    """모델 예열 — 병렬 모드에서 모델별 1회, 순차 모드에서는 생략"""
+
+    def test_preloads_each_model_once(self, agent):
+        posted = []
+        agent.http.post = lambda url, data, headers, timeout: posted.append(json.loads(data))
+
+        agent._warm_models()
+        agent._warm_models()
+        agent._llm_executor.shutdown(wait=True)
+
+        assert sorted(p["model"] for p in posted) == sorted(a["model"] for a in agent.agents.values())
+        assert all("prompt" not in p and p["keep_alive"] == agent._keep_alive for p in posted)
+
+    def test_skipped_in_sequential_mode(self, agent):
+        posted = []
+        agent.http.post = lambda *a, **kw: posted.append(kw)
+        agent._llm_parallelism = 1
+
+        agent._warm_models()
+        assert posted == [] and agent._llm_executor is None
+
+
+class TestAnalysisContexts:
+    """분석 컨텍스트 — 재저장 시 최신 위치로 이동, 만료 항목만 앞에서 제거"""
+
+    def test_clear_old_contexts_keeps_recent(self, agent):
+        from datetime import datetime, timedelta
+
+        for company in ("삼성전자", "카카오", "네이버"):
+            agent.save_analysis_context(company, {})
+        hour_ns = 3600 * 1_000_000_000
+        agent.conversation_memory["삼성전자"].saved_at_ns -= 30 * hour_ns
+        agent.conversation_memory["카카오"].saved_at_ns -= 25 * hour_ns
+        # 오래된 삼성전자를 다시 저장하면 최신이 되어 정리 대상에서 빠짐
+        agent.save_analysis_context("삼성전자", {})
+
+        agent.clear_old_contexts(hours=24)
+        assert list(agent.conversation_memory) == ["네이버", "삼성전자"]
+        assert agent.conversation_memory["삼성전자"].timestamp > datetime.now() - timedelta(hours=1)
+
+    def test_clear_old_contexts_rebuilds_when_mostly_expired(self, agent):
+        from collections import OrderedDict
+
+        companies = ["삼성전자", "카카오", "네이버", "LG화학"]
+        for company in companies:
+            agent.save_analysis_context(company, {})
+        hour_ns = 3600 * 1_000_000_000
+        for company in companies[:3]:
+            agent.conversation_memory[company].saved_at_ns -= 30 * hour_ns
+
+        agent.clear_old_contexts(hours=24)
+        assert isinstance(agent.conversation_memory, OrderedDict)
+        assert list(agent.conversation_memory) == ["LG화학"]
+        agent.save_analysis_context("카카오", {})
+        assert list(agent.conversation_memory) == ["LG화학", "카카오"]
+
+    def test_overflow_contexts_move_to_disk_store(self, agent, monkeypatch):
+        import glob
+        import core_agent_engine
+
+        monkeypatch.setattr(core_agent_engine, "CONTEXT_HOT_SIZE", 2)
+        for company in ("삼성전자", "카카오", "네이버"):
+            agent.save_analysis_context(company, {"ratios": {"ROE": len(company)}})
+        assert list(agent.conversation_memory) == ["카카오", "네이버"]
+        assert agent.get_analysis_context("삼성전자")["ratios"] == {"ROE": 4}
+        assert agent.get_agent_status()["active_analyses"] == 3
+
+        # 다시 저장하면 디스크 사본은 지우고 메모리 최신 위치로
+        agent.save_analysis_context("삼성전자", {})
+        assert list(agent.conversation_memory) == ["네이버", "삼성전자"]
+        assert list(agent._cold_contexts) == ["카카오"]
+
+        hour_ns = 3600 * 1_000_000_000
+        agent._cold_contexts["카카오"] -= 30 * hour_ns
+        agent.clear_old_contexts(hours=24)
+        assert agent.get_analysis_context("카카오") is None
+
+        # 세션 전용 저장소 파일은 에이전트 소멸 시(finalizer) 삭제
+        pattern = os.path.join(agent.work_directory, "data", f"contexts_{os.getpid()}_{id(agent):x}*")
+        assert glob.glob(pattern)
+        agent._context_store_finalizer()
+        assert not glob.glob(pattern)
+
+    def test_contexts_share_discussion_snapshot(self, agent):
+        agent.discussion_log.append({"speaker": "김성실", "response": "A등급"})
+        agent.save_analysis_context("삼성전자", {})
+        agent.save_analysis_context("카카오", {})
+        first = agent.conversation_memory["삼성전자"].a2a_discussion_log
+        assert first is agent.conversation_memory["카카오"].a2a_discussion_log
+
+        agent.discussion_log.append({"speaker": "박의심", "response": "C등급"})
+        agent.save_analysis_context("네이버", {})
+        assert len(agent.conversation_memory["네이버"].a2a_discussion_log) == 2
+        assert len(first) == 1  # 이미 저장된 컨텍스트는 그대로
+
+    def test_context_supports_dict_style_reads(self, agent):
+        agent.save_analysis_context("삼성전자", {"ratios": {"ROE": 10.0}})
+        context = agent.get_analysis_context("삼성전자")
+        assert context["ratios"] == {"ROE": 10.0}
+        assert context.get("fraud_ratios", {}) == {}  # 없는 키는 기본값
+        with pytest.raises(KeyError):
+            context["get"]
+
+    def test_context_supports_membership_checks(self, agent):
+        from conversation_handler import SmartConversationHandler
+
+        agent.save_analysis_context("삼성전자", {
+            "ratios": {"ROE": 10.0},
+            "financial_data": {"revenue": 258_900_000_000_000},
+        })
+        context = agent.get_analysis_context("삼성전자")
+        assert "ratios" in context and "financial_data" in context
+        assert "fraud_ratios" not in context and 0 not in context
+
+        formatted = SmartConversationHandler(agent)._format_context_for_ai(context)
+        assert "- ROE: 10.00" in formatted
+        assert "- revenue: 258.9조원" in formatted
+
+    def test_snapshot_refreshes_when_full_log_rotates(self, agent):
+        from collections import deque
+
+        agent.discussion_log = deque([{"n": 0}, {"n": 1}], maxlen=2)
+        agent.save_analysis_context("삼성전자", {})
+        agent.discussion_log.append({"n": 2})  # 길이는 그대로, 내용은 바뀜
+        agent.save_analysis_context("카카오", {})
+        assert [e["n"] for e in agent.conversation_memory["카카오"].a2a_discussion_log] == [1, 2]
+
+    def test_discussion_summary_recent_tail(self, agent):
+        for i in range(7):
+            agent.discussion_log.append({"speaker": f"s{i % 3}", "timestamp": f"t{i}"})
+        summary = agent.get_discussion_summary()
+        assert [e["timestamp"] for e in summary["recent_discussions"]] == ["t2", "t3", "t4", "t5", "t6"]
+        assert summary["discussion_start"] == "t0" and summary["discussion_end"] == "t6"
+        assert sorted(summary["agents_participated"]) == ["s0", "s1", "s2"]
+
+    def test_status_and_summary_views_cached_until_change(self, agent):
+        status = agent.get_agent_status()
+        assert agent.get_agent_status() is status
+        with pytest.raises(TypeError):
+            status["current_model"] = "x"  # 읽기 전용
+        agent.discussion_log.append({"speaker": "a", "timestamp": "t0"})
+        assert agent.get_agent_status()["discussion_interactions"] == status["discussion_interactions"] + 1
+
+        summary = agent.get_discussion_summary()
+        assert agent.get_discussion_summary() is summary
+        agent.discussion_log.append({"speaker": "b", "timestamp": "t1"})
+        assert agent.get_discussion_summary()["discussion_end"] == "t1"
+
+
+class TestDisplayFormatting:
+    """표시용 포맷 — 비율별 형식과 통화 단위"""
+
+    def test_format_ratios_for_display(self, agent):
+        formatted = agent.format_ratios_for_display({
+            "ROE": 12.345, "A2A_투자등급": "A", "순이익_양수_현금흐름_음수": True,
+            "현금흐름_대_순이익_비율": 0.8, "메모": None,
+        })
+        assert formatted == {
+            "ROE": "12.35%", "A2A_투자등급": "A", "순이익_양수_현금흐름_음수": "예",
+            "현금흐름_대_순이익_비율": "0.80", "메모": "None",
+        }
+
+    @pytest.mark.parametrize("amount,expected", [
+        (2_580_000_000_000, "2.6조원"),
+        (-350_000_000, "-4억원"),
+        (10_000, "1만원"),
+        (9_999, "9,999원"),
+    ])
+    def test_format_currency_units(self, agent, amount, expected):
+        assert agent.format_currency(amount) == expected
+
+    def test_format_ratios_bulk_matches_scalar(self, agent):
+        import pandas as pd
+        df = pd.DataFrame({
+            "ROE": [12.345, -3.0, float("nan")], "부채비율": [150, 80, 0],
+            "순이익_양수_현금흐름_음수": [True, False, True],
+            "A2A_투자등급": ["A", "C", "B"], "메모": [None, "검토", 1.5],
+            "매출액": [2_580_000_000_000, -350_000_000, 9_999],
+        })
+        bulk = agent.format_ratios_bulk(df, currency_columns=("매출액",))
+        for i, row in enumerate(df.to_dict("records")):
+            amount = row.pop("매출액")
+            expected = agent.format_ratios_for_display(row)
+            expected["매출액"] = agent.format_currency(amount)
+            assert bulk.iloc[i].to_dict() == expected
+
+    def test_bulk_boolean_cells_share_strings(self, agent):
+        import pandas as pd
+        bulk = agent.format_ratios_bulk(pd.DataFrame({"순이익_양수_현금흐름_음수": [True, True, False]}))
+        cells = bulk["순이익_양수_현금흐름_음수"].tolist()
+        assert cells == ["예", "예", "아니오"]
+        assert cells[0] is cells[1]
+
+    def test_cached_formatting_keeps_int_float_distinct(self, agent):
+        assert agent.format_currency(5) == "5원"
+        assert agent.format_currency(5.0) == "5.0원"
+        assert agent.format_percentage(12.3456, 1) == "12.3%"
@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+"""
+document_generator의 등급 판정 단위 테스트 (문서 생성 불필요)
+
+- 종합 등급: ROE > 10/15, 부채비율 < 100/150, 부정위험점수 < 30/50
+- 비율 설명 평가: ROE > 8/15, 부채비율 < 100/200
+경계값에서 bisect 방향(left/right)이 기존 비교식과 같은지 고정한다.
+"""
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+from document_generator import ProfessionalReportGenerator
+
+
+class TestOverallGrade:
+    @pytest.mark.parametrize("roe,debt_ratio,fraud_score,expected", [
+        # ROE는 경계 초과여야 상위 등급
+        (15, 50, 10, "B (양호)"),
+        (15.01, 50, 10, "A (우수)"),
+        (10, 50, 10, "C (개선필요)"),
+        (10.01, 50, 10, "B (양호)"),
+        # 부채비율은 경계 미만이어야 상위 등급
+        (20, 100, 10, "B (양호)"),
+        (20, 99.99, 10, "A (우수)"),
+        (20, 150, 10, "C (개선필요)"),
+        (20, 149.99, 10, "B (양호)"),
+        # 부정위험점수도 경계 미만이어야 상위 등급
+        (20, 50, 30, "B (양호)"),
+        (20, 50, 29.99, "A (우수)"),
+        (20, 50, 50, "C (개선필요)"),
+        (20, 50, 49.99, "B (양호)"),
+        # 한 지표라도 미달이면 가장 낮은 등급
+        (20, 50, 60, "C (개선필요)"),
+        (float("nan"), 50, 10, "C (개선필요)"),
+    ])
+    def test_grade_at_boundaries(self, roe, debt_ratio, fraud_score, expected):
+        grade, _ = ProfessionalReportGenerator._overall_grade(roe, debt_ratio, fraud_score)
+        assert grade == expected
+
+    def test_grade_color_keys(self):
+        assert ProfessionalReportGenerator._overall_grade(20, 50, 10)[1] == "success"
+        assert ProfessionalReportGenerator._overall_grade(12, 120, 40)[1] == "warning"
+        assert ProfessionalReportGenerator._overall_grade(5, 50, 10)[1] == "danger"
+
+
+class TestRatioDescriptionGrade:
+    @pytest.fixture
+    def generator(self, tmp_path):
+        return ProfessionalReportGenerator(save_directory=str(tmp_path))
+
+    @pytest.mark.parametrize("ratio_name,value,suffix", [
+        ("ROE", 15, " (양호)"),
+        ("ROE", 15.01, " (우수)"),
+        ("ROE", 8, " (개선필요)"),
+        ("ROE", 8.01, " (양호)"),
+        ("부채비율", 99.99, " (안정)"),
+        ("부채비율", 100, " (보통)"),
+        ("부채비율", 199.99, " (보통)"),
+        ("부채비율", 200, " (위험)"),
+    ])
+    def test_description_at_boundaries(self, generator, ratio_name, value, suffix):
+        assert generator._get_ratio_description(ratio_name, value).endswith(suffix)
+
+    def test_ungraded_ratio_has_no_suffix(self, generator):
+        assert generator._get_ratio_description("ROA", 15) == "총자산수익률 - 전체 자산 대비 수익률"
+
+
+class TestChartExecutorLifecycle:
+    class _StubExecutor:
+        """작업 프로세스를 띄우지 않고 제출·종료 호출만 기록"""
+        def __init__(self, *args, **kwargs):
+            self.submitted = []
+            self.shutdown_calls = []
+
+        def submit(self, fn, *args):
+            self.submitted.append(args)
+            return object()
+
+        def shutdown(self, wait=True, cancel_futures=False):
+            self.shutdown_calls.append((wait, cancel_futures))
+
+    def test_close_shuts_down_pool_and_clears_futures(self, tmp_path, monkeypatch):
+        import document_generator
+
+        monkeypatch.setattr(document_generator, "CHART_WORKERS", 2)
+        monkeypatch.setattr(document_generator, "ProcessPoolExecutor", self._StubExecutor)
+        generator = ProfessionalReportGenerator(save_directory=str(tmp_path))
+        generator._prefetch_charts({"ratios": {"ROE": 10.0}}, "삼성전자")
+        executor = generator._chart_executor
+        assert len(executor.submitted) == 2 and len(generator._chart_futures) == 2
+
+        generator.close()
+        assert executor.shutdown_calls == [(False, True)]
+        assert generator._chart_futures == {} and generator._chart_executor is None
+
+        generator.close()  # 두 번 호출해도 다시 종료하지 않음
+        assert executor.shutdown_calls == [(False, True)]
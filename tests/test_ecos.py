@@ -12,7 +12,7 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 import pytest
 
-from ecos_client import ksic_to_ecos_industry, ECOSClient
+from ecos_client import ksic_to_ecos_industry, ECOSClient, METRIC_MAP
 
 
 class TestKsicMapping:
@@ -68,3 +68,24 @@ class TestCompareVerdict:
         client = self._client_with_fake_benchmark({"부채비율": 60.0})
         result = client.compare({"부채비율": 500.0}, "64992")
         assert result["available"] is False
+
+
+class TestPrefetch:
+    """벤치마크 사전 조회: 매핑되는 업종은 전 지표, 금융업 등 미매핑은 조회 없음"""
+
+    def _recording_client(self):
+        client = ECOSClient.__new__(ECOSClient)
+        client._cache = {}
+        client.requested = []
+        client.get_benchmark = lambda ind, metric, size="A": client.requested.append(metric)
+        return client
+
+    def test_fetches_every_metric(self):
+        client = self._recording_client()
+        client.prefetch("264")
+        assert client.requested == list(METRIC_MAP)
+
+    def test_unmapped_industry_skips(self):
+        client = self._recording_client()
+        client.prefetch("64992")
+        assert client.requested == []